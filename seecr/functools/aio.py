@@ -0,0 +1,262 @@
+## begin license ##
+#
+# Seecr Functools a set of various functional tools
+#
+# Copyright (C) 2026 Seecr (Seek You Too B.V.) https://seecr.nl
+#
+# This file is part of "Seecr Functools"
+#
+# "Seecr Functools" is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# "Seecr Functools" is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with "Seecr Functools"; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+## end license ##
+
+"""
+asyncio counterparts of reduce, transduce and sequence.
+
+Async step functions (coroutine functions, or ReducingFn's with a coroutine
+step) and async map functions (see amap) can be part of a pipeline; the
+synchronous transducers from core work unchanged in between them.  The
+synchronous stages between two amap stages run as one run per input,
+into a buffer; each buffered output is then awaited through the next
+amap function - so synchronous stages never see an awaitable, and
+expanding stages (cat, mapcat) do not nest coroutines.
+"""
+
+from inspect import isawaitable
+
+from seecr.functools.core import _SequenceStep, _FusedXform, _xform_stages, _step_of, _not_found, comp, is_reduced, ensure_reduced
+
+
+def _needs_resolve(x):
+    return isawaitable(x) or (is_reduced(x) and isawaitable(x.val))
+
+async def _resolve(x):
+    while True:
+        if isawaitable(x):
+            x = await x
+        elif is_reduced(x) and isawaitable(x.val):
+            x = ensure_reduced(await _resolve(x.val))
+        else:
+            return x
+
+async def _sync_aiter(coll):
+    for x in coll:
+        yield x
+
+def _aiter(coll):
+    if hasattr(coll, '__aiter__'):
+        return coll.__aiter__()
+    return _sync_aiter(coll)
+
+async def _aclose(it):
+    aclose = getattr(it, 'aclose', None)
+    if aclose is not None:
+        await aclose()
+
+
+class _Run(object):
+    """
+    A run of synchronous stages, preceded by an async map function (but for
+    the first run); the run's outputs are buffered in output.
+    """
+    __slots__ = ('afn', 'xf', 'xf_step', 'output', 'done')
+
+    def __init__(self, afn, stages):
+        self.afn = afn
+        self.output = []
+        _output_step = _SequenceStep(self.output)
+        self.xf = comp(*stages)(_output_step) if stages else _output_step
+        self.xf_step = _step_of(self.xf)
+        self.done = False
+
+class _APipeline(object):
+    """
+    Runs xform's stages for atransduce and asequence: split at its amap
+    stages into runs of synchronous stages.  An input is pushed through a
+    run into its buffer; then each buffered output is awaited through the
+    next amap function and pushed into the next run, etc.  The outputs of
+    the last run go to f (which may be async).  No awaitable is ever handed
+    to a synchronous stage.
+    """
+    __slots__ = ('_runs', '_f', '_f_step', 'acc', '_f_done')
+
+    def __init__(self, xform, f, acc):
+        if isinstance(xform, _FusedXform):
+            xform = xform.xform
+        afn, stages, runs = None, [], []
+        for stage in _xform_stages(xform):
+            amap_f = getattr(stage, '_amap_f', None)
+            if amap_f is None:
+                stages.append(stage)
+            else:
+                runs.append(_Run(afn, stages))
+                afn, stages = amap_f, []
+        runs.append(_Run(afn, stages))
+        self._runs = runs
+        self._f = f
+        self._f_step = _step_of(f)
+        self.acc = acc
+        self._f_done = False
+
+    def terminated(self):
+        return self._f_done or any(run.done for run in self._runs)
+
+    def _open_after(self, k):
+        return not self._f_done and not any(run.done for run in self._runs[k + 1:])
+
+    async def feed(self, x, k=0):
+        "Pushes x into run k (or f, after the last run); and its outputs on."
+        if k == len(self._runs):
+            acc = self._f_step(self.acc, x)
+            if _needs_resolve(acc):
+                acc = await _resolve(acc)
+            if is_reduced(acc):
+                acc, self._f_done = acc.val, True
+            self.acc = acc
+            return
+        run = self._runs[k]
+        if run.afn is not None:
+            x = run.afn(x)
+            if isawaitable(x):
+                x = await x
+        if is_reduced(run.xf_step(None, x)):
+            run.done = True
+        await self._drain(k)
+
+    async def _drain(self, k):
+        output = self._runs[k].output
+        outputs = output[:]
+        del output[:]
+        for y in outputs:
+            if not self._open_after(k):
+                return
+            await self.feed(y, k + 1)
+
+    async def complete(self):
+        "Completes the runs (in order, handing on what they flush) and f."
+        for k, run in enumerate(self._runs):
+            run.xf(None)
+            await self._drain(k)
+        return await _resolve(self._f(self.acc))
+
+def amap(f):
+    """
+    Returns a transducer applying the async (coroutine) function f to each
+    input; for use (directly, or comp-ed) with atransduce and asequence.
+    """
+    def _amap_xf(rf):
+        raise TypeError('amap stages only run in atransduce and asequence')
+    _amap_xf._amap_f = f
+    return _amap_xf
+
+
+async def areduce(*a):
+    """
+    areduce(f, coll)
+    areduce(f, val, coll)
+
+    Same as reduce, but coll may be an async iterable (or a normal one) and f
+    may return awaitables.  When f returns a reduced value, coll's async
+    iterator is closed (aclose), so an async generator upstream stops.
+    """
+    if len(a) == 2:
+        f, coll = a[0], _aiter(a[1])
+        del a
+        _1, _2 = await _anext(coll), await _anext(coll)
+        if _1 is _not_found:
+            return await _resolve(f())
+        elif _2 is _not_found:
+            return _1
+        acc = _step_of(f)(_1, _2)
+        if _needs_resolve(acc):
+            acc = await _resolve(acc)
+        if is_reduced(acc):
+            await _aclose(coll)
+            return acc.val
+    elif len(a) == 3:
+        f, acc, coll = a[0], a[1], _aiter(a[2])
+        del a
+    else:
+        raise TypeError("areduce takes either 2 or 3 arguments ({} given)".format(len(a)))
+
+    step = _step_of(f)
+    async for x in coll:
+        acc = step(acc, x)
+        if _needs_resolve(acc):
+            acc = await _resolve(acc)
+        if is_reduced(acc):
+            await _aclose(coll)
+            return acc.val
+    return acc
+
+async def _anext(it):
+    try:
+        return await it.__anext__()
+    except StopAsyncIteration:
+        return _not_found
+
+async def atransduce(*a):
+    """
+    atransduce(xform, f, coll)
+    atransduce(xform, f, init, coll)
+
+    Same as transduce, with areduce i.s.o. reduce; f may be an async
+    reducing function and xform may contain async stages (see amap).
+    """
+    if len(a) == 3:
+        xform, f, coll = a
+        del a
+        return await atransduce(xform, f, await _resolve(f()), coll)
+    elif len(a) == 4:
+        xform, f, init, coll = a
+        del a
+    else:
+        raise TypeError("atransduce takes either 3 or 4 arguments ({} given)".format(len(a)))
+
+    pipeline = _APipeline(xform, f, init)
+    coll = _aiter(coll)
+    async for x in coll:
+        await pipeline.feed(x)
+        if pipeline.terminated():
+            await _aclose(coll)
+            break
+    return await pipeline.complete()
+
+def asequence(xform, coll):
+    """
+    Returns an async generator of the applications of xform to the items in
+    the (async) iterable coll; like sequence.  Closing it (or early
+    termination by xform) closes coll's async iterator.
+    """
+    coll = _aiter(() if coll is None else coll)
+    _output = []
+    async def _():
+        pipeline = _APipeline(xform, _SequenceStep(_output), None)
+        try:
+            async for input_ in coll:
+                await pipeline.feed(input_)
+                for _o in _output:
+                    yield _o
+                del _output[:]
+                if pipeline.terminated():
+                    break
+
+            await pipeline.complete()
+            for _o in _output:
+                yield _o
+            del _output[:]
+        finally:
+            await _aclose(coll)
+    return _()
@@ -0,0 +1,300 @@
+## begin license ##
+#
+# Seecr Functools a set of various functional tools
+#
+# Copyright (C) 2026 Seecr (Seek You Too B.V.) https://seecr.nl
+#
+# This file is part of "Seecr Functools"
+#
+# "Seecr Functools" is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# "Seecr Functools" is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with "Seecr Functools"; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+## end license ##
+
+"""
+core.async style channels on asyncio.
+
+A Channel has a (bounded) buffer; items put on it go through its
+(optional) transducer before landing in the buffer.  put waits while a
+fixed buffer is full; dropping and sliding buffers never make put wait.
+take waits until an item is available; returns None once the channel is
+closed and drained (so None cannot be put on a channel).
+
+pipe, merge and pipeline close their output channel also when they fail;
+the exception is logged on the logger of this module.
+"""
+
+from asyncio import ensure_future, get_running_loop
+from collections import deque
+from logging import getLogger
+
+from seecr.functools.core import ReducingFn, _step_of, is_reduced, completing
+from seecr.functools.aio import atransduce
+
+
+class _Buffer(object):
+    __slots__ = ('_items', '_n')
+
+    def __init__(self, n):
+        if n < 1:
+            raise ValueError('Buffer size must be >= 1')
+        self._items = deque()
+        self._n = n
+
+    def __len__(self):
+        return len(self._items)
+
+    def full(self):
+        return len(self._items) >= self._n
+
+    def add(self, x):
+        self._items.append(x)
+
+    def remove(self):
+        return self._items.popleft()
+
+class _DroppingBuffer(_Buffer):
+    __slots__ = ()
+
+    def full(self):
+        return False
+
+    def add(self, x):
+        if len(self._items) < self._n:
+            self._items.append(x)
+
+class _SlidingBuffer(_Buffer):
+    __slots__ = ()
+
+    def full(self):
+        return False
+
+    def add(self, x):
+        if len(self._items) >= self._n:
+            self._items.popleft()
+        self._items.append(x)
+
+def buffer(n):
+    "Fixed buffer of n items; puts wait while full."
+    return _Buffer(n)
+
+def dropping_buffer(n):
+    "Buffer of n items; puts never wait, items put while full are dropped."
+    return _DroppingBuffer(n)
+
+def sliding_buffer(n):
+    "Buffer of n items; puts never wait, putting while full drops the oldest item."
+    return _SlidingBuffer(n)
+
+
+class _BufferAdd(ReducingFn):
+    __slots__ = ('_buf',)
+
+    def __init__(self, buf):
+        self._buf = buf
+
+    def init(self):
+        pass
+
+    def step(self, acc, x):
+        self._buf.add(x)
+
+class Channel(object):
+    """
+    Channel(buf=1, xform=None)
+
+    buf is a buffer (see buffer, dropping_buffer and sliding_buffer) or a
+    size for a fixed buffer.  When xform returns a reduced value the channel
+    closes; on close, xform's completion may still add items (even beyond
+    the buffer's size).
+    """
+    def __init__(self, buf=1, xform=None):
+        self._buf = buffer(buf) if isinstance(buf, int) else buf
+        _add = _BufferAdd(self._buf)
+        self._xf = _add if xform is None else xform(_add)
+        self._xf_step = _step_of(self._xf)
+        self._closed = False
+        self._takers = deque()
+        self._putters = deque()
+
+    @property
+    def closed(self):
+        return self._closed
+
+    async def put(self, x):
+        """
+        Puts x on the channel, waiting while the buffer is full.  Returns
+        False (and drops x) when the channel is closed, True otherwise.
+        """
+        if x is None:
+            raise ValueError("Can't put None on a channel")
+        while not self._closed and self._buf.full():
+            await _wait(self._putters)
+        if self._closed:
+            return False
+        if is_reduced(self._xf_step(None, x)):
+            self.close()
+        _wake(self._takers)
+        return True
+
+    async def take(self):
+        "Takes an item, waiting for one if needed; None once closed and drained."
+        while not len(self._buf) and not self._closed:
+            await _wait(self._takers)
+        if len(self._buf):
+            x = self._buf.remove()
+            _wake(self._putters)
+            return x
+        return None
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._xf(None)
+        _wake(self._takers)
+        _wake(self._putters)
+
+    async def __aiter__(self):
+        while True:
+            x = await self.take()
+            if x is None:
+                return
+            yield x
+
+async def _wait(waiters):
+    future = get_running_loop().create_future()
+    waiters.append(future)
+    await future
+
+def _wake(waiters):
+    while waiters:
+        future = waiters.popleft()
+        if not future.done():
+            future.set_result(None)
+
+
+_logger = getLogger(__name__)
+
+_tasks = set()
+
+def _log_exception(task):
+    if not task.cancelled() and task.exception() is not None:
+        _logger.error('Channel task %r failed', task, exc_info=task.exception())
+
+def _go(coro):
+    task = ensure_future(coro)
+    _tasks.add(task)            # keep a reference until done
+    task.add_done_callback(_tasks.discard)
+    task.add_done_callback(_log_exception)
+    return task
+
+def pipe(from_, to, close=True):
+    """
+    Takes items from channel from_ and puts them on channel to, until from_
+    is closed and drained (or to gets closed).  Closes to when done, unless
+    close is False.  Returns to.
+    """
+    async def _pipe():
+        try:
+            async for x in from_:
+                if not await to.put(x):
+                    break
+        finally:
+            if close:
+                to.close()
+    _go(_pipe())
+    return to
+
+def merge(chs, buf=1):
+    """
+    Returns a channel (with buffer buf) with all items taken from the
+    channels chs; it is closed once all chs are closed and drained.
+    """
+    out = Channel(buf)
+    remaining = [len(chs)]
+    async def _copy(ch):
+        try:
+            async for x in ch:
+                if not await out.put(x):
+                    break
+        finally:
+            remaining[0] -= 1
+            if remaining[0] == 0:
+                out.close()
+    for ch in chs:
+        _go(_copy(ch))
+    if not chs:
+        out.close()
+    return out
+
+def _conj(acc, x):
+    acc.append(x)
+    return acc
+
+async def _put_all(ch, xs):
+    for x in xs:
+        if not await ch.put(x):
+            return False
+    return True
+
+def _log_ex_handler(e):
+    _logger.error('Exception in pipeline', exc_info=e)
+
+def pipeline(n, to, xf, from_, close=True, ex_handler=None):
+    """
+    Takes items from channel from_, applies transducer xf to each of them
+    separately - with about n of them in progress at a time - and puts the
+    results on channel to, in order.  xf may contain async stages (see
+    aio.amap).  Closes to when from_ is closed and drained, unless close
+    is False.  Returns to.
+
+    When xf raises an exception for an item, ex_handler is called with it;
+    what it returns is put on to instead, unless it is None.  By default
+    the exception is logged (and the item skipped).
+    """
+    ex_handler = _log_ex_handler if ex_handler is None else ex_handler
+    pending = Channel(n)
+    async def _apply(x):
+        try:
+            return await atransduce(xf, completing(_conj), [], [x])
+        except Exception as e:
+            v = ex_handler(e)
+            return [] if v is None else [v]
+
+    async def _read():
+        try:
+            async for x in from_:
+                task = _go(_apply(x))
+                if not await pending.put(task):
+                    task.cancel()
+                    break
+        finally:
+            pending.close()
+
+    async def _write():
+        try:
+            async for task in pending:
+                if not await _put_all(to, await task):
+                    break
+        finally:
+            pending.close()
+            async for task in pending:
+                task.cancel()
+            if close:
+                to.close()
+
+    _go(_read())
+    _go(_write())
+    return to
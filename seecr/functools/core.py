@@ -24,6 +24,15 @@
 
 # from functools import reduce
 
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from itertools import chain, islice
+from operator import add as _add
+from os import cpu_count
+from random import random as _random
+from weakref import WeakKeyDictionary
+
 
 class reduced(object):
     """Sentinel wrapper from which terminal value can be retrieved. If received
@@ -48,26 +57,139 @@ def preserving_reduced(rf):
     return _preserving_reduced
 
 
-def cat(rf):
+class ReducingFn(object):
     """
-    A transducer which concatenates the contents of each input, which must be a collection, into the reduction.
+    Reducing function with its 0, 1 and 2 arities as separate methods:
+     - init()            returns the initial accumulator;
+     - step(acc, x)      returns the next accumulator (possibly reduced);
+     - complete(acc)     returns the final result.
+
+    Optionally step_chunk(acc, xs) processes a whole list of inputs at once
+    (see transduce_chunked); by default it calls step for each x in xs.
+
+    reduce, transduce and sequence call step directly.  Instances are
+    callable with 0, 1 or 2 arguments too, so they can be handed to anything
+    expecting a closure-style reducing function (and vice versa, see
+    reducing_fn).
     """
-    rrf = preserving_reduced(rf)
-    def _cat_step(*a):
-        if len(a) == 0:
-            return rf()
+    __slots__ = ()
+
+    def init(self):
+        raise TypeError("{} has no init (0-arity)".format(type(self).__name__))
+
+    def step(self, acc, x):
+        raise NotImplementedError()
+
+    def step_chunk(self, acc, xs):
+        step = self.step
+        for x in xs:
+            acc = step(acc, x)
+            if is_reduced(acc):
+                return acc
+        return acc
+
+    def complete(self, acc):
+        return acc
+
+    def __call__(self, *a):
+        if len(a) == 2:
+            return self.step(*a)
         elif len(a) == 1:
-            result, = a
-            return rf(result)
-        elif len(a) == 2:
-            result, input_ = a
-            return reduce(rrf, result, input_)
+            return self.complete(*a)
+        elif len(a) == 0:
+            return self.init()
         else:
-            raise TypeError("_cat_step takes either 0, 1 or 2 arguments ({} given)".format(len(a)))
-    return _cat_step
+            raise TypeError("{} takes either 0, 1 or 2 arguments ({} given)".format(type(self).__name__, len(a)))
+
+class _FnReducingFn(ReducingFn):
+    __slots__ = ('_f',)
+
+    def __init__(self, f):
+        self._f = f
+
+    def init(self):
+        return self._f()
+
+    def step(self, acc, x):
+        return self._f(acc, x)
+
+    def complete(self, acc):
+        return self._f(acc)
+
+def reducing_fn(f):
+    """
+    Returns f as a ReducingFn; closure-style reducing functions (or
+    transducer steps) taking 0, 1 or 2 arguments are adapted.
+    """
+    return f if isinstance(f, ReducingFn) else _FnReducingFn(f)
+
+def _step_of(rf):
+    return rf.step if isinstance(rf, ReducingFn) else rf
+
+def _step_chunk(rf, acc, xs):
+    if isinstance(rf, ReducingFn):
+        return rf.step_chunk(acc, xs)
+    for x in xs:
+        acc = rf(acc, x)
+        if is_reduced(acc):
+            return acc
+    return acc
+
+class _Stage(ReducingFn):
+    """
+    Base for the (transducer-created) step of a stage wrapping the reducing
+    function rf; init and complete are passed through to rf.
+    """
+    __slots__ = ('_rf', '_rf_step')
+
+    def __init__(self, rf):
+        self._rf = rf
+        self._rf_step = _step_of(rf)
+
+    def init(self):
+        return self._rf()
+
+    def complete(self, acc):
+        return self._rf(acc)
+
+
+class _CatStep(_Stage):
+    __slots__ = ()
+
+    def step(self, acc, x):
+        rf_step = self._rf_step
+        for i in x:
+            acc = rf_step(acc, i)
+            if is_reduced(acc):
+                return acc
+        return acc
+
+    def step_chunk(self, acc, xs):
+        return _step_chunk(self._rf, acc, [i for x in xs for i in x])
+
+def cat(rf):
+    """
+    A transducer which concatenates the contents of each input, which must be a collection, into the reduction.
+    """
+    return _CatStep(rf)
+cat._fuse_spec = ('cat',)
 
 _not_found = type('NOT_FOUND', (object,), {})()
 
+# Builtin colls and iterators, known not to be self-reducing.
+_plain_types = frozenset(
+    t for coll in ([], (), {}, set(), frozenset(), '', b'', range(0), {}.keys(), {}.values(), {}.items())
+      for t in (type(coll), type(iter(coll)))
+) | {type(_ for _ in ()), map, filter, zip, enumerate}
+
+def _coll_reduce_of(coll):
+    """
+    Returns __seecr_reduce__ of a self-reducing coll's type, to be called as
+    coll_reduce(coll, f, val); or None.
+    """
+    t = type(coll)
+    return None if t in _plain_types else getattr(t, '__seecr_reduce__', None)
+
 def reduce(*a):
     """
     reduce(f, coll)
@@ -85,6 +207,11 @@ def reduce(*a):
     result of applying f to val and the first item in coll, then
     applying f to that result and the 2nd item, etc. If coll contains no
     items, returns val and f is not called.
+
+    When coll (or the iterator of coll) implements __seecr_reduce__(f, val),
+    reduce dispatches to it: coll then runs its own reduction loop, applying f
+    (possibly a ReducingFn) as a function of 2 arguments and honoring
+    reduced; it returns the result, which may still be wrapped in reduced.
     """
     if len(a) == 2:
         f, coll = a[0], iter(a[1])  # Only keep a reference to the iterator, so
@@ -95,11 +222,26 @@ def reduce(*a):
         elif _2 is _not_found:
             return _1
 
+        f = _step_of(f)
         accum_value = f(_1, _2)
+        if is_reduced(accum_value):
+            return accum_value.val
+        if type(coll) not in _plain_types:
+            coll_reduce = getattr(type(coll), '__seecr_reduce__', None)
+            if coll_reduce is not None:
+                return unreduced(coll_reduce(coll, f, accum_value))
     elif len(a) == 3:
-        f, val, coll = a[0], a[1], iter(a[2])  # Only keep a reference to the iterator, so
-        del a                                  # processed items can be GC'ed iff relevant.
-        accum_value = val
+        coll = a[2]
+        if type(coll) not in _plain_types:
+            coll_reduce = getattr(type(coll), '__seecr_reduce__', None)
+            if coll_reduce is not None:
+                return unreduced(coll_reduce(coll, a[0], a[1]))
+        f, accum_value, coll = _step_of(a[0]), a[1], iter(coll)  # Only keep a reference to the iterator, so
+        del a                                           # processed items can be GC'ed iff relevant.
+        if type(coll) not in _plain_types:
+            coll_reduce = getattr(type(coll), '__seecr_reduce__', None)
+            if coll_reduce is not None:
+                return unreduced(coll_reduce(coll, f, accum_value))
     else:
         raise TypeError("reduce takes either 2 or 3 arguments ({} given)".format(len(a)))
 
@@ -109,6 +251,106 @@ def reduce(*a):
             return accum_value.val
     return accum_value
 
+def _reduce_partition(reducef, init, partition):
+    "Like reduce, but returns reduced(acc) when terminated early (so the caller knows)."
+    acc = init
+    step = _step_of(reducef)
+    for x in partition:
+        acc = step(acc, x)
+        if is_reduced(acc):
+            return acc
+    return acc
+
+def fold(*a, workers=None, executor=None):
+    """
+    fold(reducef, coll)
+    fold(combinef, reducef, coll)
+    fold(n, combinef, reducef, coll)
+
+    Reduces coll in parallel: coll is split into partitions of n (default
+    512) items, each of which is reduced with reducef - starting from
+    (combinef) - on a process pool of workers (default os.cpu_count())
+    processes.  The partition results are combined (in order) using
+    combinef; reducef is used when combinef is not supplied.  combinef
+    must be associative, and (combinef) its identity value.
+
+    When reducef returns a reduced value, no further partitions are
+    reduced or combined.  A coll of at most n items is reduced in-process.
+
+    reducef, combinef and the items of coll are sent to other processes,
+    so they must be picklable.  An executor (with a submit method; e.g. a
+    concurrent.futures ThreadPoolExecutor) can be given to be used
+    instead; it is not shut down.
+    """
+    if len(a) == 2:
+        reducef, coll = a
+        del a
+        return fold(512, reducef, reducef, coll, workers=workers, executor=executor)
+    elif len(a) == 3:
+        combinef, reducef, coll = a
+        del a
+        return fold(512, combinef, reducef, coll, workers=workers, executor=executor)
+    elif len(a) == 4:
+        n, combinef, reducef, coll = a
+        del a
+    else:
+        raise TypeError("fold takes either 2, 3 or 4 arguments ({} given)".format(len(a)))
+
+    partitions = _chunks(coll, n)
+    first_partition = next(partitions, [])
+    second_partition = next(partitions, None)
+    if second_partition is None:
+        return unreduced(_reduce_partition(reducef, combinef(), first_partition))
+
+    partitions = chain((first_partition, second_partition), partitions)
+    max_pending = 2 * (workers or cpu_count() or 1)
+    if executor is None:
+        with ProcessPoolExecutor(workers) as executor:
+            return _fold(executor, max_pending, combinef, reducef, partitions)
+    return _fold(executor, max_pending, combinef, reducef, partitions)
+
+def _fold(executor, max_pending, combinef, reducef, partitions):
+    pending = deque()
+    result = combinef()
+
+    def _combine_oldest():
+        nonlocal result
+        partition_result = pending.popleft().result()
+        result = combinef(result, unreduced(partition_result))
+        return is_reduced(partition_result)
+
+    for partition in partitions:
+        pending.append(executor.submit(_reduce_partition, reducef, combinef(), partition))
+        if len(pending) >= max_pending and _combine_oldest():
+            break
+    else:
+        while pending:
+            if _combine_oldest():
+                break
+
+    for future in pending:
+        future.cancel()
+    return result
+
+class _MapStep(_Stage):
+    __slots__ = ('_f',)
+
+    def __init__(self, rf, f):
+        _Stage.__init__(self, rf)
+        self._f = f
+
+    def step(self, acc, x):
+        return self._rf_step(acc, self._f(x))
+
+    def step_chunk(self, acc, xs):
+        f = self._f
+        return _step_chunk(self._rf, acc, [f(x) for x in xs])
+
+    def __call__(self, *a):
+        if len(a) > 2:          # not a transducer-arity, so needs a wrapper to transform (result, input) to (result, input_1, ..., input_n).
+            return self._rf_step(a[0], self._f(*a[1:]))
+        return _Stage.__call__(self, *a)
+
 def map(f, *colls):
     """
     map(f)
@@ -124,19 +366,8 @@ def map(f, *colls):
     """
     if len(colls) == 0:
         def _map_xf(rf):
-            def _map_step(*a):
-                if len(a) == 0:
-                    return rf()
-                elif len(a) == 1:
-                    result, = a
-                    return rf(result)
-                elif len(a) == 2:
-                    result, input_ = a
-                    return rf(result, f(input_))
-                else:               # > 2 - not a transducer-arity, so needs a wrapper to transform (result, input) to (result, input_1, ..., input_n).
-                    result, inputs = a[0], a[1:]
-                    return rf(result, f(*inputs))
-            return _map_step
+            return _MapStep(rf, f)
+        _map_xf._fuse_spec = ('map', f)
         return _map_xf
     elif len(colls) == 1:
         coll = iter(colls[0])
@@ -154,6 +385,115 @@ def map(f, *colls):
         return _map()
 
 
+def _pmap_workers_window(workers, window):
+    workers = workers or min(32, (cpu_count() or 1) + 4) # ThreadPoolExecutor's default
+    return workers, (window or 2 * workers)
+
+class _PMapStep(_Stage):
+    __slots__ = ('_f', '_workers', '_window', '_executor', '_pending')
+
+    def __init__(self, rf, f, workers, window):
+        _Stage.__init__(self, rf)
+        self._f = f
+        self._workers = workers
+        self._window = window
+        self._executor = None
+        self._pending = deque()
+
+    def step(self, acc, x):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self._workers)
+        pending = self._pending
+        pending.append(self._executor.submit(self._f, x))
+        while len(pending) >= self._window:
+            acc = self._rf_step(acc, pending.popleft().result())
+            if is_reduced(acc):
+                self._shutdown()
+                return acc
+        return acc
+
+    def complete(self, acc):
+        pending = self._pending
+        while pending:
+            acc = self._rf_step(acc, pending.popleft().result())
+            if is_reduced(acc):
+                acc = acc.val
+                break
+        self._shutdown()
+        return self._rf(acc)
+
+    def _shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        self._pending.clear()
+
+def pmap(*a, workers=None, window=None):
+    """
+    pmap(f)
+    pmap(f, coll)
+
+    Like map, but f is applied on a pool of workers threads (default as
+    ThreadPoolExecutor).  Results are produced in input order; at most
+    window (default 2 * workers) applications of f are pending at any time,
+    so coll is consumed only that far ahead of the results.  Intended for
+    I/O bound f.  Returns a stateful transducer when no collection is
+    provided.
+    """
+    workers, window = _pmap_workers_window(workers, window)
+    if len(a) == 1:
+        f, = a
+        del a
+        def _pmap_xf(rf):
+            return _PMapStep(rf, f, workers, window)
+        return _pmap_xf
+    elif len(a) == 2:
+        f, coll = a[0], iter(a[1])
+        del a
+        def _pmap():
+            pending = deque()
+            with ThreadPoolExecutor(workers) as executor:
+                try:
+                    for x in coll:
+                        pending.append(executor.submit(f, x))
+                        if len(pending) >= window:
+                            yield pending.popleft().result()
+                    while pending:
+                        yield pending.popleft().result()
+                finally:
+                    for future in pending:
+                        future.cancel()
+        return _pmap()
+    else:
+        raise TypeError("pmap takes either 1 or 2 arguments ({} given)".format(len(a)))
+
+class _FilterStep(_Stage):
+    __slots__ = ('_pred',)
+
+    def __init__(self, rf, pred):
+        _Stage.__init__(self, rf)
+        self._pred = pred
+
+    def step(self, acc, x):
+        if self._pred(x):
+            return self._rf_step(acc, x)
+        return acc
+
+    def step_chunk(self, acc, xs):
+        pred = self._pred
+        return _step_chunk(self._rf, acc, [x for x in xs if pred(x)])
+
+class _RemoveStep(_FilterStep):
+    __slots__ = ()
+
+    def step(self, acc, x):
+        if self._pred(x):
+            return acc
+        return self._rf_step(acc, x)
+
+    def step_chunk(self, acc, xs):
+        pred = self._pred
+        return _step_chunk(self._rf, acc, [x for x in xs if not pred(x)])
+
 def filter(pred):
     """
     FIXME: Only transducer-arity implemented!
@@ -163,20 +503,8 @@ def filter(pred):
     Returns a transducer when no collection is provided.
     """
     def _filter_xf(rf):
-        def _filter_step(*a):
-            if len(a) == 0:
-                return rf()
-            elif len(a) == 1:
-                result, = a
-                return rf(result)
-            elif len(a) == 2:
-                result, input_ = a
-                if pred(input_):
-                    return rf(result, input_)
-                return result
-            else:
-                raise TypeError("filter takes either 0, 1 or 2 arguments ({} given)".format(len(a)))
-        return _filter_step
+        return _FilterStep(rf, pred)
+    _filter_xf._fuse_spec = ('filter', pred)
     return _filter_xf
 
 def remove(pred):
@@ -187,14 +515,33 @@ def remove(pred):
     pred(item) returns false. pred must be free of side-effects.
     Returns a transducer when no collection is provided.
     """
-    return filter(complement(pred))
+    def _remove_xf(rf):
+        return _RemoveStep(rf, pred)
+    _remove_xf._fuse_spec = ('remove', pred)
+    return _remove_xf
 
 def interleave(*colls):
-    _zipped_items = zip(*colls)
-    del colls
-    for _colls_item in _zipped_items:
-        for i in _colls_item:
-            yield i
+    """
+    Returns an iterator of the first item in each coll, then the second etc.
+    """
+    return chain.from_iterable(zip(*colls))
+
+class _InterposeStep(_Stage):
+    __slots__ = ('_sep', '_started')
+
+    def __init__(self, rf, sep):
+        _Stage.__init__(self, rf)
+        self._sep = sep
+        self._started = False
+
+    def step(self, acc, x):
+        if self._started:
+            acc = self._rf_step(acc, self._sep)
+            if is_reduced(acc):
+                return acc
+        else:
+            self._started = True
+        return self._rf_step(acc, x)
 
 def interpose(sep):
     """
@@ -204,33 +551,46 @@ def interpose(sep):
     Returns a stateful transducer when no collection is provided.
     """
     def _interpose_xf(rf):
-        started = [False]
-        def _interpose_step(*a):
-            if len(a) == 0:
-                return rf()
-            elif len(a) == 1:
-                result, = a
-                return rf(result)
-            elif len(a) == 2:
-                result, input_ = a
-                if started[0]:
-                    _sepr = rf(result, sep)
-                    if is_reduced(_sepr):
-                        return _sepr
-                    else:
-                        return rf(_sepr, input_)
-                else:
-                    started[0] = True
-                    return rf(result, input_)
-            else:
-                raise TypeError("interpose takes either 0, 1 or 2 arguments ({} given)".format(len(a)))
-        return _interpose_step
+        return _InterposeStep(rf, sep)
+    _interpose_xf._fuse_spec = ('interpose', sep)
     return _interpose_xf
 
+class _Iterate(object):
+    __slots__ = ('_f', '_x', '_started')
+
+    def __init__(self, f, x):
+        self._f = f
+        self._x = x
+        self._started = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._started:
+            self._x = self._f(self._x)
+        else:
+            self._started = True
+        return self._x
+
+    def __seecr_reduce__(self, f, acc):
+        f, g, x = _step_of(f), self._f, self._x
+        if self._started:
+            x = g(x)
+        self._started = True
+        while True:
+            acc = f(acc, x)
+            if is_reduced(acc):
+                self._x = x
+                return acc
+            x = g(x)
+
 def iterate(f, x):
-    while True:
-        yield x
-        x = f(x)
+    """
+    Returns an (infinite) iterator of x, f(x), f(f(x)) etc.  f must be free
+    of side-effects.  Self-reducing: reduce runs a tight loop over it.
+    """
+    return _Iterate(f, x)
 
 def first(iterable, default=None):
     if iterable:
@@ -311,9 +671,53 @@ def append(*a):
         coll.append(x)
     else:
         coll, xs = _none_to_empty_list(a[0]), a[1:]
-        run(coll.append, xs)
+        _add_all(coll)(xs)
     return coll
 
+def _add_all(coll):
+    """
+    Returns a function adding all items of an iterable to (mutable) coll in
+    bulk: extend for lists and deques, update for sets and dicts (items being
+    key-value pairs); or else by calling append for each item.
+    """
+    add_all = getattr(coll, 'extend', None)
+    if add_all is None and isinstance(coll, (set, dict)):
+        add_all = coll.update
+    if add_all is None:
+        _append = coll.append
+        def add_all(xs):
+            for x in xs:
+                _append(x)
+    return add_all
+
+def into(*a):
+    """
+    into()
+    into(to)
+    into(to, from)
+    into(to, xform, from)
+
+    Returns to with all of the items of from added; when to is None, a new
+    list.  Adds in bulk for lists, deques, sets and dicts (from yielding
+    key-value pairs - or being a dict itself), otherwise using to's append
+    method.  A transducer may be supplied, it is applied through sequence.
+    """
+    if len(a) == 0:
+        return []
+    elif len(a) == 1:
+        return _none_to_empty_list(a[0])
+    elif len(a) == 2:
+        to, from_ = _none_to_empty_list(a[0]), a[1]
+    elif len(a) == 3:
+        to, xform, from_ = _none_to_empty_list(a[0]), a[1], a[2]
+        if from_ is not None:
+            from_ = sequence(xform, from_)
+    else:
+        raise TypeError("into takes either 0, 1, 2 or 3 arguments ({} given)".format(len(a)))
+    if from_ is not None:
+        _add_all(to)(from_)
+    return to
+
 def _none_to_empty_str_or_str(s):
     return "" if s is None else str(s)
 
@@ -416,6 +820,130 @@ def merge_with(f, *ds):
                 n[k] = v
     return n
 
+def _reduce_by_key(keyfn, rf, init, coll):
+    step = _step_of(rf)
+    accs = {}
+    get = accs.get
+    for x in coll:
+        k = keyfn(x)
+        acc = get(k, init)
+        if not is_reduced(acc):
+            accs[k] = step(acc, x)
+    for k, acc in accs.items():
+        if is_reduced(acc):
+            accs[k] = acc.val
+    return accs
+
+def _group_by(f, coll):
+    groups = {}
+    get = groups.get
+    for x in coll:
+        k = f(x)
+        group = get(k)
+        if group is None:
+            groups[k] = [x]
+        else:
+            group.append(x)
+    return groups
+
+def _frequencies(coll):
+    return dict(Counter(coll))
+
+def _parallel_by_key(reduce_partition, combinef, coll, n, workers, executor):
+    """
+    Reduces the partitions (of n items) of coll into dicts on a process pool
+    (or executor); the keys of these dicts are hash-partitioned into shards,
+    which are combined - in partition order - with merge_with(combinef) as
+    separate tasks.
+    """
+    partitions = _chunks(coll, n)
+    first_partition = next(partitions, [])
+    second_partition = next(partitions, None)
+    if second_partition is None:
+        return reduce_partition(first_partition)
+
+    partitions = chain((first_partition, second_partition), partitions)
+    nshards = workers or cpu_count() or 1
+    if executor is None:
+        with ProcessPoolExecutor(workers) as executor:
+            return _by_key(executor, nshards, combinef, reduce_partition, partitions)
+    return _by_key(executor, nshards, combinef, reduce_partition, partitions)
+
+def _by_key(executor, nshards, combinef, reduce_partition, partitions):
+    shards = [[] for _ in range(nshards)]
+    pending = deque()
+
+    def _shard_oldest():
+        parts = [{} for _ in range(nshards)]
+        for k, v in pending.popleft().result().items():
+            parts[hash(k) % nshards][k] = v     # hash in this process: consistent for all partitions
+        for shard, part in zip(shards, parts):
+            if part:
+                shard.append(part)
+
+    for partition in partitions:
+        pending.append(executor.submit(reduce_partition, partition))
+        if len(pending) >= 2 * nshards:
+            _shard_oldest()
+    while pending:
+        _shard_oldest()
+
+    merging = [executor.submit(merge_with, combinef, *shard) for shard in shards if len(shard) > 1]
+    result = {}
+    for shard in shards:
+        if len(shard) == 1:
+            result.update(shard[0])
+    for future in merging:
+        result.update(future.result())
+    return result
+
+def reduce_by_key(keyfn, rf, init, coll, *, combinef=None, parallel=False, n=4096, workers=None, executor=None):
+    """
+    Returns a dict of keyfn(item) to the reduction - with rf, starting from
+    init - of the items of coll having that key; i.e. a single pass
+    equivalent of {k: reduce(rf, init, items) for k, items in
+    group_by(keyfn, coll).items()}.  init is shared by all keys, so should
+    not be mutated by rf.  A reduced value ends the reduction for its key
+    only.
+
+    With parallel, coll is split into partitions of n items which are
+    reduced on a process pool of workers (default os.cpu_count())
+    processes - or the given executor (see fold).  The results for a key
+    are combined (in order) using combinef (default: rf), by key shard in
+    parallel.  A reduced value then only ends the reduction of its key
+    within a partition.  The order of the keys is unspecified.
+    """
+    reduce_partition = partial(_reduce_by_key, keyfn, rf, init)
+    if not parallel:
+        return reduce_partition(coll)
+    return _parallel_by_key(reduce_partition, rf if combinef is None else combinef, coll, n, workers, executor)
+
+def group_by(f, coll, *, parallel=False, n=4096, workers=None, executor=None):
+    """
+    Returns a dict of the items of coll keyed by the result of f on each
+    item.  The value at each key is a list of the corresponding items, in
+    the order they appeared in coll.  For parallel (n, workers and
+    executor), see reduce_by_key.
+    """
+    if not parallel:
+        return _group_by(f, coll)
+    return _parallel_by_key(partial(_group_by, f), _add, coll, n, workers, executor)
+
+def frequencies(coll, *, parallel=False, n=4096, workers=None, executor=None):
+    """
+    Returns a dict from distinct items in coll to the number of times they
+    appear.  For parallel (n, workers and executor), see reduce_by_key.
+    """
+    if not parallel:
+        return _frequencies(coll)
+    return _parallel_by_key(_frequencies, _add, coll, n, workers, executor)
+
+# Set by seecr.functools.latency.enable(); checked by the function
+# combinators when composing, so the functions they return have no
+# overhead at all when it is None.  thrush and some_thread check it when
+# called: one global lookup and comparison (and one more on return).
+_latency_hook = None
+
 truthy = bool
 def falsy(o):
     return not o
@@ -439,7 +967,12 @@ def trampoline(f, *a, **kw):
 def thrush(*a):
    "Thrush operator for python!  Should be called with an initial value and 1 or more fns to make sense."
    # See: http://blog.fogus.me/2010/09/28/thrush-in-clojure-redux/
-   return reduce(lambda acc, fn: fn(acc), a)
+   sample = None if _latency_hook is None else _latency_hook.sample('thrush', a[1:])
+   try:
+       return reduce(lambda acc, fn: fn(acc), a)
+   finally:
+       if sample is not None:
+           sample()
 
 def before(f, g):
     """"
@@ -450,7 +983,7 @@ def before(f, g):
         g(*a, **kw)
         return f(*a, **kw)
 
-    return _before
+    return _before if _latency_hook is None else _latency_hook.wrap('before', (f, g), _before)
 
 def after(f, g):
     """"
@@ -462,7 +995,7 @@ def after(f, g):
         g(*a, **kw)
         return v
 
-    return _after
+    return _after if _latency_hook is None else _latency_hook.wrap('after', (f, g), _after)
 
 def complement(f):
     """
@@ -486,7 +1019,7 @@ def juxt(*fns):
             acc.append(fn(*a, **kw))
             return acc
         return reduce(rf, [], fns)
-    return _juxt
+    return _juxt if _latency_hook is None else _latency_hook.wrap('juxt', fns, _juxt)
 
 def run(proc, coll):
     "Runs the supplied procedure, for purposes of side effects, on successive items in coll. Returns None."
@@ -497,18 +1030,23 @@ def some_thread(x, *fns):
     When x is not None, calls the first fn with it,
     and when that result is not None, calls the next with the result, etc.
     """
-    if not fns:
-        return x
-
-    if x is None:
-        return
+    sample = None if _latency_hook is None else _latency_hook.sample('some_thread', fns)
+    try:
+        if not fns:
+            return x
 
-    for f in fns:
-        x = f(x)
         if x is None:
             return
 
-    return x
+        for f in fns:
+            x = f(x)
+            if x is None:
+                return
+
+        return x
+    finally:
+        if sample is not None:
+            sample()
 
 _pred_falsy = lambda obj: obj is False or obj is None
 def any_fn(*fns):
@@ -521,12 +1059,35 @@ def any_fn(*fns):
             if not _pred_falsy(res):
                 return res
 
-    return _any_fn
+    return _any_fn if _latency_hook is None else _latency_hook.wrap('any_fn', fns, _any_fn)
 
 def fpartial(f, *a, **kw):       # similar to: https://github.com/clojurewerkz/support/blob/master/src/clojure/clojurewerkz/support/fn.clj - but *only* first-arg is allowed & required.
     def _wrap(arg):
         return f(arg, *a, **kw)
-    return _wrap
+    return _wrap if _latency_hook is None else _latency_hook.wrap('fpartial', (f,), _wrap)
+
+class _TakeStep(_Stage):
+    __slots__ = ('_n',)
+
+    def __init__(self, rf, n):
+        _Stage.__init__(self, rf)
+        self._n = n
+
+    def step(self, acc, x):
+        n = self._n
+        self._n = n - 1
+        if n > 0:
+            acc = self._rf_step(acc, x)
+        return acc if n > 1 else ensure_reduced(acc)
+
+    def step_chunk(self, acc, xs):
+        if len(xs) == 0:
+            return acc
+        n = self._n
+        self._n = n - len(xs)
+        if n > 0:
+            acc = _step_chunk(self._rf, acc, xs[:n])
+        return acc if n > len(xs) else ensure_reduced(acc)
 
 def take(*a):
     """
@@ -541,23 +1102,8 @@ def take(*a):
         n, = a
         del a
         def _take_xf(rf):
-            _nv = [n]
-            def _take_step(*a):
-                if len(a) == 0:
-                    return rf()
-                elif len(a) == 1:
-                    result, = a
-                    return rf(result)
-                elif len(a) == 2:
-                    result, input_ = a
-                    _n = _nv[0]
-                    _nv[0] = _nn = _n - 1
-                    result = rf(result, input_) if _n > 0 else result
-                    if _nn > 0:
-                        return result
-                    else:
-                        return ensure_reduced(result)
-            return _take_step
+            return _TakeStep(rf, n)
+        _take_xf._fuse_spec = ('take', n)
         return _take_xf
     elif len(a) == 2:
         n, coll = a[0], iter(a[1])
@@ -574,6 +1120,26 @@ def take(*a):
     else:
     	raise TypeError("take takes either 1 or 2 arguments ({} given)".format(len(a)))
 
+class _DropStep(_Stage):
+    __slots__ = ('_n',)
+
+    def __init__(self, rf, n):
+        _Stage.__init__(self, rf)
+        self._n = n
+
+    def step(self, acc, x):
+        if self._n > 0:
+            self._n -= 1
+            return acc
+        return self._rf_step(acc, x)
+
+    def step_chunk(self, acc, xs):
+        n = self._n
+        if n > 0:
+            self._n = max(n - len(xs), 0)
+            xs = xs[n:]
+        return _step_chunk(self._rf, acc, xs)
+
 def drop(*a):
     """
     drop(n)
@@ -586,22 +1152,8 @@ def drop(*a):
         n, = a
         del a
         def _drop_xf(rf):
-            _nv = [n]
-            def _drop_step(*a):
-                if len(a) == 0:
-                    return rf()
-                elif len(a) == 1:
-                    result, = a
-                    return rf(result)
-                elif len(a) == 2:
-                    result, input_ = a
-                    _n = _nv[0]
-                    _nv[0] = _nn = _n - 1
-                    if _n > 0:
-                        return result
-                    else:
-                        return rf(result, input_)
-            return _drop_step
+            return _DropStep(rf, n)
+        _drop_xf._fuse_spec = ('drop', n)
         return _drop_xf
     elif len(a) == 2:
         n, coll = a[0], iter(a[1])
@@ -620,6 +1172,456 @@ def drop(*a):
     else:
     	raise TypeError("drop takes either 1 or 2 arguments ({} given)".format(len(a)))
 
+class _PartitionAllStep(_Stage):
+    __slots__ = ('_n', '_buf')
+
+    def __init__(self, rf, n):
+        _Stage.__init__(self, rf)
+        self._n = n
+        self._buf = []
+
+    def step(self, acc, x):
+        buf = self._buf
+        buf.append(x)
+        if len(buf) < self._n:
+            return acc
+        self._buf = []
+        return self._rf_step(acc, buf)
+
+    def step_chunk(self, acc, xs):
+        n, buf = self._n, self._buf
+        if buf:
+            fill = n - len(buf)
+            buf.extend(xs[:fill])
+            xs = xs[fill:]
+            if len(buf) < n:
+                return acc
+        parts = ([buf] if buf else []) + [xs[i:i + n] for i in range(0, len(xs), n)]
+        self._buf = parts.pop() if parts and len(parts[-1]) < n else []
+        acc = _step_chunk(self._rf, acc, parts)
+        if is_reduced(acc):
+            self._buf = []
+        return acc
+
+    def complete(self, acc):
+        buf, self._buf = self._buf, []
+        if buf:
+            acc = unreduced(self._rf_step(acc, buf))
+        return self._rf(acc)
+
+def partition_all(*a):
+    """
+    partition_all(n)
+    partition_all(n, coll)
+
+    Returns an iterable of lists of n items each, at offsets n apart; the
+    last list may contain fewer than n items.  Returns a stateful transducer
+    when no collection is provided.
+    """
+    if len(a) == 1:
+        n, = a
+        if n < 1:
+            raise ValueError("partition_all needs n > 0 ({} given)".format(n))
+        del a
+        def _partition_all_xf(rf):
+            return _PartitionAllStep(rf, n)
+        return _partition_all_xf
+    elif len(a) == 2:
+        n, coll = a[0], iter(a[1])
+        if n < 1:
+            raise ValueError("partition_all needs n > 0 ({} given)".format(n))
+        del a
+        def _partition_all():
+            while True:
+                part = list(islice(coll, n))
+                if not part:
+                    return
+                yield part
+        return _partition_all()
+    else:
+        raise TypeError("partition_all takes either 1 or 2 arguments ({} given)".format(len(a)))
+
+class _PartitionByStep(_Stage):
+    __slots__ = ('_f', '_buf', '_key')
+
+    def __init__(self, rf, f):
+        _Stage.__init__(self, rf)
+        self._f = f
+        self._buf = []
+        self._key = _not_found
+
+    def step(self, acc, x):
+        key = self._f(x)
+        if self._key is _not_found or key == self._key:
+            self._key = key
+            self._buf.append(x)
+            return acc
+        buf, self._buf = self._buf, []
+        acc = self._rf_step(acc, buf)
+        if not is_reduced(acc):
+            self._key = key
+            self._buf.append(x)
+        return acc
+
+    def complete(self, acc):
+        buf, self._buf = self._buf, []
+        if buf:
+            acc = unreduced(self._rf_step(acc, buf))
+        return self._rf(acc)
+
+def partition_by(*a):
+    """
+    partition_by(f)
+    partition_by(f, coll)
+
+    Applies f to each value in coll, splitting it each time f returns a
+    new value.  Returns an iterable of lists.  Returns a stateful
+    transducer when no collection is provided.
+    """
+    if len(a) == 1:
+        f, = a
+        del a
+        def _partition_by_xf(rf):
+            return _PartitionByStep(rf, f)
+        return _partition_by_xf
+    elif len(a) == 2:
+        f, coll = a[0], iter(a[1])
+        del a
+        def _partition_by():
+            buf, key = [], _not_found
+            for x in coll:
+                k = f(x)
+                if key is _not_found or k == key:
+                    buf.append(x)
+                else:
+                    yield buf
+                    buf = [x]
+                key = k
+            if buf:
+                yield buf
+        return _partition_by()
+    else:
+        raise TypeError("partition_by takes either 1 or 2 arguments ({} given)".format(len(a)))
+
+class _DedupeStep(_Stage):
+    __slots__ = ('_prev',)
+
+    def __init__(self, rf):
+        _Stage.__init__(self, rf)
+        self._prev = _not_found
+
+    def step(self, acc, x):
+        prev, self._prev = self._prev, x
+        if prev is not _not_found and prev == x:
+            return acc
+        return self._rf_step(acc, x)
+
+def dedupe(*a):
+    """
+    dedupe()
+    dedupe(coll)
+
+    Returns an iterable removing consecutive duplicates in coll.
+    Returns a transducer when no collection is provided.
+    """
+    if len(a) == 0:
+        def _dedupe_xf(rf):
+            return _DedupeStep(rf)
+        _dedupe_xf._fuse_spec = ('dedupe',)
+        return _dedupe_xf
+    elif len(a) == 1:
+        coll = iter(a[0])
+        del a
+        def _dedupe():
+            prev = _not_found
+            for x in coll:
+                if prev is _not_found or prev != x:
+                    yield x
+                prev = x
+        return _dedupe()
+    else:
+        raise TypeError("dedupe takes either 0 or 1 arguments ({} given)".format(len(a)))
+
+class _DistinctStep(_Stage):
+    __slots__ = ('_seen',)
+
+    def __init__(self, rf):
+        _Stage.__init__(self, rf)
+        self._seen = set()
+
+    def step(self, acc, x):
+        seen = self._seen
+        if x in seen:
+            return acc
+        seen.add(x)
+        return self._rf_step(acc, x)
+
+def distinct(*a):
+    """
+    distinct()
+    distinct(coll)
+
+    Returns an iterable of the elements of coll with duplicates removed
+    (elements must be hashable).  Returns a stateful transducer when no
+    collection is provided.
+    """
+    if len(a) == 0:
+        def _distinct_xf(rf):
+            return _DistinctStep(rf)
+        _distinct_xf._fuse_spec = ('distinct',)
+        return _distinct_xf
+    elif len(a) == 1:
+        coll = iter(a[0])
+        del a
+        def _distinct():
+            seen = set()
+            for x in coll:
+                if x not in seen:
+                    seen.add(x)
+                    yield x
+        return _distinct()
+    else:
+        raise TypeError("distinct takes either 0 or 1 arguments ({} given)".format(len(a)))
+
+class _KeepStep(_Stage):
+    __slots__ = ('_f',)
+
+    def __init__(self, rf, f):
+        _Stage.__init__(self, rf)
+        self._f = f
+
+    def step(self, acc, x):
+        v = self._f(x)
+        return acc if v is None else self._rf_step(acc, v)
+
+def keep(*a):
+    """
+    keep(f)
+    keep(f, coll)
+
+    Returns an iterable of the non-None results of f(item).  Note, this
+    means False return values will be included.  f must be free of
+    side-effects.  Returns a transducer when no collection is provided.
+    """
+    if len(a) == 1:
+        f, = a
+        del a
+        def _keep_xf(rf):
+            return _KeepStep(rf, f)
+        _keep_xf._fuse_spec = ('keep', f)
+        return _keep_xf
+    elif len(a) == 2:
+        f, coll = a[0], iter(a[1])
+        del a
+        def _keep():
+            for x in coll:
+                v = f(x)
+                if v is not None:
+                    yield v
+        return _keep()
+    else:
+        raise TypeError("keep takes either 1 or 2 arguments ({} given)".format(len(a)))
+
+class _MapcatStep(_CatStep):
+    __slots__ = ('_f',)
+
+    def __init__(self, rf, f):
+        _CatStep.__init__(self, rf)
+        self._f = f
+
+    def step(self, acc, x):
+        return _CatStep.step(self, acc, self._f(x))
+
+    def step_chunk(self, acc, xs):
+        f = self._f
+        return _step_chunk(self._rf, acc, [i for x in xs for i in f(x)])
+
+def mapcat(f, *colls):
+    """
+    mapcat(f)
+    mapcat(f, coll)
+    mapcat(f, coll, *colls)
+
+    Returns the result of applying concat to the result of applying map
+    to f and colls.  Thus function f should return a collection.  Returns
+    a transducer when no collections are provided.
+    """
+    if len(colls) == 0:
+        def _mapcat_xf(rf):
+            return _MapcatStep(rf, f)
+        _mapcat_xf._fuse_spec = ('mapcat', f)
+        return _mapcat_xf
+    return chain.from_iterable(map(f, *colls))
+
+class _TakeWhileStep(_Stage):
+    __slots__ = ('_pred',)
+
+    def __init__(self, rf, pred):
+        _Stage.__init__(self, rf)
+        self._pred = pred
+
+    def step(self, acc, x):
+        if self._pred(x):
+            return self._rf_step(acc, x)
+        return ensure_reduced(acc)
+
+def take_while(*a):
+    """
+    take_while(pred)
+    take_while(pred, coll)
+
+    Returns an iterable of successive items from coll while pred(item)
+    returns logical true.  pred must be free of side-effects.  Returns a
+    transducer when no collection is provided.
+    """
+    if len(a) == 1:
+        pred, = a
+        del a
+        def _take_while_xf(rf):
+            return _TakeWhileStep(rf, pred)
+        _take_while_xf._fuse_spec = ('take_while', pred)
+        return _take_while_xf
+    elif len(a) == 2:
+        pred, coll = a[0], iter(a[1])
+        del a
+        def _take_while():
+            for x in coll:
+                if not pred(x):
+                    return
+                yield x
+        return _take_while()
+    else:
+        raise TypeError("take_while takes either 1 or 2 arguments ({} given)".format(len(a)))
+
+class _DropWhileStep(_Stage):
+    __slots__ = ('_pred', '_dropping')
+
+    def __init__(self, rf, pred):
+        _Stage.__init__(self, rf)
+        self._pred = pred
+        self._dropping = True
+
+    def step(self, acc, x):
+        if self._dropping:
+            if self._pred(x):
+                return acc
+            self._dropping = False
+        return self._rf_step(acc, x)
+
+def drop_while(*a):
+    """
+    drop_while(pred)
+    drop_while(pred, coll)
+
+    Returns an iterable of the items in coll starting from the first item
+    for which pred(item) returns logical false.  Returns a stateful
+    transducer when no collection is provided.
+    """
+    if len(a) == 1:
+        pred, = a
+        del a
+        def _drop_while_xf(rf):
+            return _DropWhileStep(rf, pred)
+        _drop_while_xf._fuse_spec = ('drop_while', pred)
+        return _drop_while_xf
+    elif len(a) == 2:
+        pred, coll = a[0], iter(a[1])
+        del a
+        def _drop_while():
+            for x in coll:
+                if not pred(x):
+                    yield x
+                    break
+            yield from coll
+        return _drop_while()
+    else:
+        raise TypeError("drop_while takes either 1 or 2 arguments ({} given)".format(len(a)))
+
+class _TakeNthStep(_Stage):
+    __slots__ = ('_n', '_i')
+
+    def __init__(self, rf, n):
+        _Stage.__init__(self, rf)
+        self._n = n
+        self._i = -1
+
+    def step(self, acc, x):
+        i = self._i = self._i + 1
+        if i % self._n:
+            return acc
+        return self._rf_step(acc, x)
+
+    def step_chunk(self, acc, xs):
+        n, start = self._n, -(self._i + 1) % self._n
+        self._i += len(xs)
+        return _step_chunk(self._rf, acc, xs[start::n])
+
+def take_nth(*a):
+    """
+    take_nth(n)
+    take_nth(n, coll)
+
+    Returns an iterable of every nth item in coll, starting with the
+    first.  Returns a stateful transducer when no collection is provided.
+    """
+    if len(a) == 1:
+        n, = a
+        if n < 1:
+            raise ValueError("take_nth needs n > 0 ({} given)".format(n))
+        del a
+        def _take_nth_xf(rf):
+            return _TakeNthStep(rf, n)
+        _take_nth_xf._fuse_spec = ('take_nth', n)
+        return _take_nth_xf
+    elif len(a) == 2:
+        n, coll = a
+        if n < 1:
+            raise ValueError("take_nth needs n > 0 ({} given)".format(n))
+        del a
+        return islice(coll, 0, None, n)
+    else:
+        raise TypeError("take_nth takes either 1 or 2 arguments ({} given)".format(len(a)))
+
+class _RandomSampleStep(_Stage):
+    __slots__ = ('_prob', '_random')
+
+    def __init__(self, rf, prob, random):
+        _Stage.__init__(self, rf)
+        self._prob = prob
+        self._random = random
+
+    def step(self, acc, x):
+        if self._random() < self._prob:
+            return self._rf_step(acc, x)
+        return acc
+
+def random_sample(*a, random=_random):
+    """
+    random_sample(prob)
+    random_sample(prob, coll)
+
+    Returns items from coll with random probability of prob (0.0 -
+    1.0).  random (default: random.random) draws the numbers.  Returns a
+    transducer when no collection is provided.
+    """
+    if len(a) == 1:
+        prob, = a
+        del a
+        def _random_sample_xf(rf):
+            return _RandomSampleStep(rf, prob, random)
+        _random_sample_xf._fuse_spec = ('random_sample', prob, random)
+        return _random_sample_xf
+    elif len(a) == 2:
+        prob, coll = a[0], iter(a[1])
+        del a
+        def _random_sample():
+            for x in coll:
+                if random() < prob:
+                    yield x
+        return _random_sample()
+    else:
+        raise TypeError("random_sample takes either 1 or 2 arguments ({} given)".format(len(a)))
+
 def comp(*fns):
     """
     Takes a set of functions and returns a fn that is the composition of those fns.  The returned fn takes a variable number of args, applies the rightmost of fns to the args, the next fn (right-to-left) to the result, etc.
@@ -629,13 +1631,27 @@ def comp(*fns):
         return identity
     elif countFns == 1:
         return fns[0]
-    elif countFns == 2:
-        f, g = fns
-        def fn(*a, **kw):
-            return f(g(*a, **kw))
-        return fn
-    else:   # 3..n args
-        return reduce(comp, fns) # more than 1 item, so always starts with comp(1st, 2nd)-call
+    fn = reduce(_comp2, fns) # more than 1 item, so always starts with _comp2(1st, 2nd)-call
+    return fn if _latency_hook is None else _latency_hook.wrap('comp', fns, fn)
+
+def _comp2(f, g):
+    def fn(*a, **kw):
+        return f(g(*a, **kw))
+    fn._comp_fns = (f, g)
+    return fn
+
+class _Completing(ReducingFn):
+    __slots__ = ('step', '_f', '_cf') # 'step' slot shadows ReducingFn.step: f is called directly, no extra frame.
+
+    def __init__(self, f, cf):
+        self.step = self._f = f
+        self._cf = cf
+
+    def init(self):
+        return self._f()
+
+    def complete(self, acc):
+        return self._cf(acc)
 
 def completing(f, cf=identity):
     """
@@ -643,21 +1659,245 @@ def completing(f, cf=identity):
     transduce by adding an arity-1 signature that calls cf (default -
     identity) on the result argument.
     """
-    def _completing(*a):
-        if len(a) == 0:
-            return f()
-        elif len(a) == 1:
-            x, = a
-            return cf(x)
-        elif len(a) == 2:
-            x, y = a
-            return f(x, y)
+    return _Completing(f, cf)
+
+def _xform_stages(xform):
+    """
+    Flattens a (possibly comp-ed) xform into its list of stages; outermost
+    (first to see an input) stage first.
+    """
+    comp_fns = getattr(xform, '_comp_fns', None)
+    if comp_fns is not None:
+        return [stage for fn in comp_fns for stage in _xform_stages(fn)]
+    elif xform is identity:
+        return []
+    return [xform]
+
+class _FuseEmitter(object):
+    """
+    Generates the source of a single function running all (fusable) stages
+    of an xform inline - one loop, no per-stage step-fn calls.
+
+    The code only depends on the kinds of stages (shape); the arguments of
+    stage i (f, pred, n, sep) are parameters named _a<i>_<j>.  leaf(var) and
+    stop() return the lines for "hand var to the reducing function" and
+    "terminate early" respectively.  With star, the 1st stage receives a
+    tuple of inputs (only map and mapcat support this).
+    """
+    def __init__(self, shape, leaf, stop, star=False):
+        self._shape = shape
+        self._leaf = leaf
+        self._stop = stop
+        self._star = star
+        self._vars = 0
+        self.params = ['_a{}_{}'.format(i, j) for i, (kind, arity) in enumerate(shape) for j in range(arity)]
+        self.inits = []
+        self.lines = []
+
+    def var(self):
+        self._vars += 1
+        return 'x{}'.format(self._vars)
+
+    def emit(self, i, var, depth):
+        if i == len(self._shape):
+            self.lines.extend('    ' * depth + line for line in self._leaf(var))
+            return
+
+        kind, arity = self._shape[i]
+        args = ['_a{}_{}'.format(i, j) for j in range(arity)]
+        getattr(self, '_emit_' + kind)(i, var, depth, *args)
+
+    def _line(self, depth, line):
+        self.lines.append('    ' * depth + line)
+
+    def _emit_map(self, i, var, depth, f):
+        out = self.var()
+        self._line(depth, '{} = {}({}{})'.format(out, f, '*' if (self._star and i == 0) else '', var))
+        self.emit(i + 1, out, depth)
+
+    def _emit_filter(self, i, var, depth, pred):
+        self._line(depth, 'if {}({}):'.format(pred, var))
+        self.emit(i + 1, var, depth + 1)
+
+    def _emit_remove(self, i, var, depth, pred):
+        self._line(depth, 'if not {}({}):'.format(pred, var))
+        self.emit(i + 1, var, depth + 1)
+
+    def _emit_cat(self, i, var, depth):
+        out = self.var()
+        self._line(depth, 'for {} in {}:'.format(out, var))
+        self.emit(i + 1, out, depth + 1)
+
+    def _emit_take(self, i, var, depth, n):
+        nv = '_n{}'.format(i)
+        self.inits.append('{} = {}'.format(nv, n))
+        self._line(depth, '{} -= 1'.format(nv))
+        self._line(depth, 'if {} >= 0:'.format(nv))
+        self.emit(i + 1, var, depth + 1)
+        self._line(depth, 'if {} <= 0:'.format(nv))
+        self.lines.extend('    ' * (depth + 1) + line for line in self._stop())
+
+    def _emit_drop(self, i, var, depth, n):
+        nv = '_d{}'.format(i)
+        self.inits.append('{} = {}'.format(nv, n))
+        self._line(depth, 'if {} > 0:'.format(nv))
+        self._line(depth + 1, '{} -= 1'.format(nv))
+        self._line(depth, 'else:')
+        self.emit(i + 1, var, depth + 1)
+
+    def _emit_interpose(self, i, var, depth, sep):
+        started = '_s{}'.format(i)
+        self.inits.append('{} = False'.format(started))
+        self._line(depth, 'if {}:'.format(started))
+        self.emit(i + 1, sep, depth + 1)
+        self.emit(i + 1, var, depth + 1)
+        self._line(depth, 'else:')
+        self._line(depth + 1, '{} = True'.format(started))
+        self.emit(i + 1, var, depth + 1)
+
+    def _emit_mapcat(self, i, var, depth, f):
+        out = self.var()
+        self._line(depth, 'for {} in {}({}{}):'.format(out, f, '*' if (self._star and i == 0) else '', var))
+        self.emit(i + 1, out, depth + 1)
+
+    def _emit_keep(self, i, var, depth, f):
+        out = self.var()
+        self._line(depth, '{} = {}({})'.format(out, f, var))
+        self._line(depth, 'if {} is not None:'.format(out))
+        self.emit(i + 1, out, depth + 1)
+
+    def _emit_take_while(self, i, var, depth, pred):
+        self._line(depth, 'if {}({}):'.format(pred, var))
+        self.emit(i + 1, var, depth + 1)
+        self._line(depth, 'else:')
+        self.lines.extend('    ' * (depth + 1) + line for line in self._stop())
+
+    def _emit_drop_while(self, i, var, depth, pred):
+        dropping = '_dw{}'.format(i)
+        self.inits.append('{} = True'.format(dropping))
+        self._line(depth, 'if not ({} and {}({})):'.format(dropping, pred, var))
+        self._line(depth + 1, '{} = False'.format(dropping))
+        self.emit(i + 1, var, depth + 1)
+
+    def _emit_take_nth(self, i, var, depth, n):
+        nv = '_tn{}'.format(i)
+        self.inits.append('{} = -1'.format(nv))
+        self._line(depth, '{} += 1'.format(nv))
+        self._line(depth, 'if {} % {} == 0:'.format(nv, n))
+        self.emit(i + 1, var, depth + 1)
+
+    def _emit_dedupe(self, i, var, depth):
+        prev = '_p{}'.format(i)
+        self.inits.append('{} = _not_found'.format(prev))
+        self._line(depth, 'if {0} is _not_found or {0} != {1}:'.format(prev, var))
+        self._line(depth + 1, '{} = {}'.format(prev, var))
+        self.emit(i + 1, var, depth + 1)
+
+    def _emit_distinct(self, i, var, depth):
+        seen = '_seen{}'.format(i)
+        self.inits.append('{} = set()'.format(seen))
+        self._line(depth, 'if {} not in {}:'.format(var, seen))
+        self._line(depth + 1, '{}.add({})'.format(seen, var))
+        self.emit(i + 1, var, depth + 1)
+
+    def _emit_random_sample(self, i, var, depth, prob, random):
+        self._line(depth, 'if {}() < {}:'.format(random, prob))
+        self.emit(i + 1, var, depth + 1)
+
+def _fused_source(name, params, emitter, footer):
+    emitter.emit(0, 'x0', 2)
+    return '\n'.join(
+        ['def {}({}):'.format(name, ', '.join(emitter.params + params))]
+        + ['    {0} = _{0}'.format(g) for g in sorted(_fused_globals)] # globals -> locals
+        + ['    ' + line for line in emitter.inits]
+        + ['    for x0 in coll:']
+        + emitter.lines
+        + footer)
+
+_fused_globals = {'_isinstance': isinstance, '_reduced': reduced, '_ensure_reduced': ensure_reduced, '_not_found': _not_found}
+_fused_code_cache = {}
+
+def _fused_fn(mode, specs):
+    """
+    Returns the (cached by shape) generated function for mode 'reduce'
+    (params: rf, acc, coll - returns acc, possibly reduced), 'gen' or
+    'gen*' (param: coll - a generator of outputs; with 'gen*' the items
+    of coll are tuples of inputs); with the stage arguments of specs bound.
+    """
+    shape = tuple((spec[0], len(spec) - 1) for spec in specs)
+    fn = _fused_code_cache.get((mode, shape))
+    if fn is None:
+        if mode == 'reduce':
+            emitter = _FuseEmitter(
+                shape,
+                leaf=lambda var: [
+                    'acc = rf(acc, {})'.format(var),
+                    'if _isinstance(acc, _reduced):',
+                    '    return acc'],
+                stop=lambda: ['return _ensure_reduced(acc)'])
+            source = _fused_source('_fused_reduce', ['rf', 'acc', 'coll'], emitter, ['    return acc'])
         else:
-            raise TypeError("_completing takes either 0, 1 or 2 arguments ({} given)".format(len(a)))
+            emitter = _FuseEmitter(
+                shape,
+                leaf=lambda var: ['yield {}'.format(var)],
+                stop=lambda: ['return'],
+                star=(mode == 'gen*'))
+            source = _fused_source('_fused_gen', ['coll'], emitter, [])
+        namespace = {'_' + name: value for name, value in _fused_globals.items()}
+        exec(compile(source, '<fused xform>', 'exec'), namespace)
+        fn = _fused_code_cache[(mode, shape)] = namespace['_fused_reduce' if mode == 'reduce' else '_fused_gen']
+    return partial(fn, *(arg for spec in specs for arg in spec[1:]))
+
+def _fuse_specs(stages):
+    "Returns the fuse-specs of all stages; or None when not all of them are fusable."
+    specs = []
+    for stage in stages:
+        spec = getattr(stage, '_fuse_spec', None)
+        if spec is None:
+            return None
+        specs.append(spec)
+    return specs
+
+class _FusedXform(object):
+    """
+    A (still ordinary) transducer which can also reduce a collection in a
+    single generated loop; see compile_xform.
+    """
+    __slots__ = ('xform', 'fused_reduce')
 
-    return _completing
+    def __init__(self, xform, fused_reduce):
+        self.xform = xform
+        self.fused_reduce = fused_reduce
 
-def transduce(*a):
+    def __call__(self, rf):
+        return self.xform(rf)
+
+_fused_reduce_cache = WeakKeyDictionary()
+
+def compile_xform(xform):
+    """
+    Returns an equivalent transducer for xform, which transduce reduces using
+    a single generated step-loop when all of xform's (comp-ed) stages are
+    built-in map, filter, remove, take, drop, cat, interpose, mapcat, keep,
+    take_while, drop_while, take_nth, dedupe, distinct or random_sample
+    transducers.
+
+    When one or more stages are not recognized, xform itself is returned (and
+    transduce will use the generic path).  Compiled pipelines are cached by
+    xform identity.
+    """
+    if isinstance(xform, _FusedXform):
+        return xform
+
+    fused_reduce = _fused_reduce_cache.get(xform)
+    if fused_reduce is None:
+        specs = _fuse_specs(_xform_stages(xform))
+        if specs is None:
+            return xform
+        fused_reduce = _fused_reduce_cache[xform] = _fused_fn('reduce', specs)
+    return _FusedXform(xform, fused_reduce)
+
+def transduce(*a, instrument=None, trace_memory=None):
     """
     transduce(xform, f, coll)
     transduce(xform, f, init, coll)
@@ -672,31 +1912,155 @@ def transduce(*a):
     then applying xf to that result and the 2nd item, etc. If coll
     contains no items, returns init and f is not called. Note that
     certain transforms may inject or skip items.
+
+    When xform was compiled with compile_xform, all stages run in one
+    generated loop; unless coll is self-reducing (see reduce), which then
+    runs its own loop.
+
+    With instrument (True, or a callable to hand the report to) each stage
+    of xform records its counts and timings; with trace_memory (likewise)
+    the memory allocated by each stage and f is traced; see
+    seecr.functools.instrument.
     """
     if len(a) == 3:
         xform, f, coll = a
-        coll = iter(coll)
         del a
-        return transduce(xform, f, f(), coll)
+        return transduce(xform, f, f(), coll, instrument=instrument, trace_memory=trace_memory)
     elif len(a) == 4:
         xform, f, init, coll = a
-        coll = iter(coll)
         del a
     else:
         raise TypeError("transduce takes either 3 or 4 arguments ({} given)".format(len(a)))
 
+    if instrument:
+        from seecr.functools.instrument import instrumented_transduce  # not at module level: it imports core
+        return instrumented_transduce(xform, f, init, coll, instrument)
+    if trace_memory:
+        from seecr.functools.instrument import traced_transduce
+        return traced_transduce(xform, f, init, coll, trace_memory)
+
+    if _coll_reduce_of(coll) is None:
+        coll = iter(coll)
+    elif isinstance(xform, _FusedXform):    # self-reducing coll runs the loop
+        xform = xform.xform
+
+    if isinstance(xform, _FusedXform):
+        return f(unreduced(xform.fused_reduce(_step_of(f), init, coll)))
+
     _f = xform(f)
     ret = reduce(_f, init, coll)
     return _f(ret)
 
-def sequence(*a):
+class _SequenceStep(ReducingFn):
+    __slots__ = ('_output',)
+
+    def __init__(self, output):
+        self._output = output
+
+    def init(self):
+        pass
+
+    def step(self, acc, x):
+        self._output.append(x)
+
+def _chunks(coll, size):
+    coll = iter(coll)
+    while True:
+        chunk = list(islice(coll, size))
+        if not chunk:
+            return
+        yield chunk
+
+def transduce_chunked(*a, chunk_size=1024):
+    """
+    transduce_chunked(xform, f, coll, chunk_size=1024)
+    transduce_chunked(xform, f, init, coll, chunk_size=1024)
+
+    Same as transduce, but hands coll to the (transformed) f in lists of
+    chunk_size items at once; using ReducingFn.step_chunk.  The map,
+    filter, remove, take, drop and cat transducers process such a chunk
+    in one go (comprehensions and slicing), other stages (and f) get called
+    for each item in the chunk.
+
+    Stages see the same items as with transduce, but stateful user-defined
+    stages may see them in a different interleaving (a whole chunk per
+    stage before the next stage).
+    """
+    if len(a) == 3:
+        xform, f, coll = a
+        del a
+        return transduce_chunked(xform, f, f(), coll, chunk_size=chunk_size)
+    elif len(a) == 4:
+        xform, f, init, coll = a
+        del a
+    else:
+        raise TypeError("transduce_chunked takes either 3 or 4 arguments ({} given)".format(len(a)))
+
+    _f = reducing_fn(xform(f))
+    return _f.complete(_reduce_chunks(_f, init, _chunks(coll, chunk_size)))
+
+def _reduce_chunks(rf, acc, chunks):
+    step_chunk = rf.step_chunk
+    for chunk in chunks:
+        acc = step_chunk(acc, chunk)
+        if is_reduced(acc):
+            return acc.val
+    return acc
+
+def _buffered_sequence(xform, coll, star=False):
+    "Generator of outputs of (non-fusable) xform; buffering the outputs of one input at a time."
+    _output = []
+    xf = xform(_SequenceStep(_output))
+    xf_step = _step_of(xf)
+    for input_ in coll:
+        maybe_reduced = xf(None, *input_) if star else xf_step(None, input_)
+        if is_reduced(maybe_reduced):
+            break
+        else:
+            for _o in _output:
+                yield _o
+            del _output[:]
+
+    xf(None)
+    for _o in _output:
+        yield _o
+    del _output[:]
+
+def _sequence_segments(xform, star):
+    """
+    Splits xform into segments of consecutive stages; each a function from
+    an iterable of inputs to a generator of outputs.  Segments of fusable
+    stages run as one generated generator (not buffering anything), others
+    through _buffered_sequence.
+    """
+    if isinstance(xform, _FusedXform):
+        xform = xform.xform
+    stages = _xform_stages(xform)
+    runs = []
+    for i, stage in enumerate(stages):
+        spec = getattr(stage, '_fuse_spec', None)
+        fusable = spec is not None and not (star and i == 0 and spec[0] not in ('map', 'mapcat'))
+        if runs and runs[-1][0] == fusable:
+            runs[-1][1].append(stage)
+        else:
+            runs.append((fusable, [stage]))
+
+    segments = []
+    for fusable, run_stages in runs:
+        _star = star and not segments
+        if fusable:
+            segments.append(_fused_fn('gen*' if _star else 'gen', _fuse_specs(run_stages)))
+        else:
+            segments.append(partial(_buffered_sequence, comp(*run_stages), star=_star))
+    return segments
+
+def sequence(*a, trace_memory=None):
     """
     sequence(coll)
     sequence(xform, coll)
     sequence(xform, coll, *colls)
 
     FIXME: returns a generator for now i.s.o. a lazy-seq!
-    FIXME: only (coll) and (xform, coll) arities are currently implemented!
 
     Coerces coll to a (possibly empty) sequence, if it is not already one.
     Will not force a lazy seq. (sequence None) yields an empty sequence,
@@ -707,6 +2071,16 @@ def sequence(*a):
     Any remaining items in other colls are ignored.
 
     The transform should accept number-of-colls arguments!
+
+    Outputs are yielded as soon as they are produced: runs of the built-in
+    stages compile_xform fuses (map, filter, mapcat, take_while, dedupe,
+    etc.; see there for all of them) are pulled through as one generator -
+    no output is buffered.  Other stages are pushed one input at a time,
+    buffering the outputs of that input only.
+
+    With trace_memory (True, or a callable to hand the report to) the
+    memory allocated by each stage and the buffer is traced (one coll
+    only); see seecr.functools.instrument.
     """
     if len(a) == 1:
         coll, = a
@@ -716,41 +2090,63 @@ def sequence(*a):
 
         coll = iter(coll)
         return (_x for _x in coll)
-    elif len(a) == 2:
-        xform, coll = a
+    elif len(a) >= 2:
+        xform, colls = a[0], [() if coll is None else coll for coll in a[1:]]
         del a
-        coll = (_ for _ in ()) if coll is None else iter(coll)
-        _output = []
-        def _sequence_step(*a):
-            if len(a) == 0:
-                pass
-            elif len(a) == 1:
-                result, = a
-                return result
-            elif len(a) == 2:
-                result, input_ = a
-                append(_output, input_)
-            else:
-                raise TypeError("_sequence_step takes either 0, 1 or 2 arguments ({} given)".format(len(a)))
-
-        def _():
-            xf = xform(_sequence_step)
-            for input_ in coll:
-                maybe_reduced = xf(None, input_)
-                if is_reduced(maybe_reduced):
-                    break
-                else:
-                    for _o in _output:
-                        yield _o
-                    del _output[:]
+        if trace_memory:
+            if len(colls) > 1:
+                raise TypeError("sequence with trace_memory takes 2 arguments ({} given)".format(len(colls) + 1))
+            from seecr.functools.instrument import traced_sequence  # not at module level: it imports core
+            return traced_sequence(xform, colls[0], trace_memory)
+        star = len(colls) > 1
+        coll = zip(*colls) if star else iter(colls[0])
+        del colls
 
-            xf(None)
-            for _o in _output:
-                yield _o
-            del _output[:]
-        return _()
+        segments = _sequence_segments(xform, star)
+        if not segments:
+            return (_x for _x in coll)
+        for segment in segments:
+            coll = segment(coll)
+        return coll
     else:
-        raise TypeError("sequence takes either 1 or 2 arguments ({} given)".format(len(a)))
+        raise TypeError("sequence takes at least 1 argument ({} given)".format(len(a)))
+
+class _Eduction(object):
+    __slots__ = ('xform', 'coll')
+
+    def __init__(self, xform, coll):
+        self.xform = xform
+        self.coll = coll
+
+    def __iter__(self):
+        return sequence(self.xform, self.coll)
+
+    def __seecr_reduce__(self, f, init):
+        f = _step_of(f)
+        xform = compile_xform(self.xform)
+        if isinstance(xform, _FusedXform):
+            return xform.fused_reduce(f, init, self.coll)
+        xf = xform(completing(f))
+        return xf(reduce(xf, init, self.coll))
+
+def eduction(*a):
+    """
+    eduction(xform, coll)
+    eduction(xform, *xforms, coll)
+
+    Returns a reducible/iterable application of the (composed) transducers
+    to the items in coll.  Each iteration runs the transducers anew (see
+    sequence); reduce (and so transduce) with an initial value runs the
+    transformed reducing function directly over coll - in a single
+    generated loop when possible (see compile_xform) - without any
+    intermediate collection or generator.  The completion (1-arity) of the
+    given reducing function is not called by reduce.
+
+    For repeated use coll itself must be re-iterable (not an iterator).
+    """
+    if len(a) < 2:
+        raise TypeError("eduction takes at least 2 arguments ({} given)".format(len(a)))
+    return _Eduction(comp(*a[:-1]), a[-1])
 
 # In time expose more functions based on usage. TODO
 __all__ = ['assoc', 'get_in', 'update_in', 'assoc_in']
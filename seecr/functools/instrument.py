@@ -0,0 +1,359 @@
+## begin license ##
+#
+# Seecr Functools a set of various functional tools
+#
+# Copyright (C) 2026 Seecr (Seek You Too B.V.) https://seecr.nl
+#
+# This file is part of "Seecr Functools"
+#
+# "Seecr Functools" is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# "Seecr Functools" is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with "Seecr Functools"; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+## end license ##
+
+"""
+Instrumentation of transducer pipelines: per stage the number of items
+in and out, the time spent in the stage itself (excluding downstream
+stages), the number of times it terminated the reduction (returned
+reduced; 'reduced_downstream' counts those received from downstream) and
+the time to complete.
+
+transduce(xform, f, init, coll, instrument=True) instruments each of the
+(comp-ed) stages of xform and hands the report - a list of dicts, one
+per stage in pipeline order - to a sink: log_report by default, or the
+callable given as instrument.  instrument(name, xf) instruments a single
+transducer.  Instrumented pipelines do not run fused (see compile_xform).
+
+transduce(..., trace_memory=True) and sequence(xform, coll,
+trace_memory=True) attribute allocations (as traced by tracemalloc) to
+the source, each stage and the reducing function: the bytes retained by
+their own code (excluding downstream; memory is freed by the code
+dropping the last reference, so this may be negative) and the peak of
+transient allocations.  This is slow; it is meant to find out which part
+of a pipeline holds on to memory.  Trace one pipeline at a time.
+"""
+
+from logging import getLogger
+from time import perf_counter
+import tracemalloc
+
+from seecr.functools.core import ReducingFn, _step_of, _xform_stages, _FusedXform, is_reduced, reduce, comp, sequence, identity
+
+
+class _StageStats(object):
+    __slots__ = ('name', 'items_in', 'items_out', 'reduced', 'reduced_downstream', 'total', 'downstream', 'complete_total', 'complete_downstream')
+
+    def __init__(self, name):
+        self.name = name
+        self.items_in = self.items_out = self.reduced = self.reduced_downstream = 0
+        self.total = self.downstream = self.complete_total = self.complete_downstream = 0.0
+
+    def report(self):
+        self_seconds = self.total - self.downstream
+        return {
+            'name': self.name,
+            'items_in': self.items_in,
+            'items_out': self.items_out,
+            'self_seconds': self_seconds,
+            'items_per_second': self.items_in / self_seconds if self_seconds > 0 else None,
+            'reduced': self.reduced,
+            'reduced_downstream': self.reduced_downstream,
+            'complete_seconds': self.complete_total - self.complete_downstream,
+        }
+
+class _Downstream(ReducingFn):
+    "What an instrumented stage is applied to: measures the time spent downstream."
+    __slots__ = ('_rf', '_rf_step', '_stats')
+
+    def __init__(self, rf, stats):
+        self._rf = rf
+        self._rf_step = _step_of(rf)
+        self._stats = stats
+
+    def init(self):
+        return self._rf()
+
+    def step(self, acc, x):
+        stats = self._stats
+        stats.items_out += 1
+        t = perf_counter()
+        acc = self._rf_step(acc, x)
+        stats.downstream += perf_counter() - t
+        if is_reduced(acc):
+            stats.reduced_downstream += 1
+        return acc
+
+    def complete(self, acc):
+        t = perf_counter()
+        acc = self._rf(acc)
+        self._stats.complete_downstream += perf_counter() - t
+        return acc
+
+class _Instrumented(ReducingFn):
+    __slots__ = ('_stage', '_stage_step', '_stats', '_sink')
+
+    def __init__(self, stage, stats, sink):
+        self._stage = stage
+        self._stage_step = _step_of(stage)
+        self._stats = stats
+        self._sink = sink
+
+    def init(self):
+        return self._stage()
+
+    def step(self, acc, x):
+        stats = self._stats
+        stats.items_in += 1
+        reduced_downstream = stats.reduced_downstream
+        t = perf_counter()
+        acc = self._stage_step(acc, x)
+        stats.total += perf_counter() - t
+        if is_reduced(acc) and stats.reduced_downstream == reduced_downstream:
+            stats.reduced += 1                          # terminated by this stage itself
+        return acc
+
+    def complete(self, acc):
+        t = perf_counter()
+        acc = self._stage(acc)
+        self._stats.complete_total += perf_counter() - t
+        if self._sink is not None:
+            self._sink([self._stats.report()])
+        return acc
+
+def _instrument(name, xf, sink, collect=None):
+    def _instrumented_xf(rf):
+        stats = _StageStats(name)
+        if collect is not None:
+            collect.append(stats)
+        return _Instrumented(xf(_Downstream(rf, stats)), stats, sink)
+    return _instrumented_xf
+
+def instrument(name, xf, sink=None):
+    """
+    Returns a transducer doing what xf does, recording statistics as name;
+    on completion the report (a list with the dict for this stage) is
+    handed to sink (default: log_report).
+    """
+    return _instrument(name, xf, log_report if sink is None else sink)
+
+def stage_name(stage):
+    "Returns a readable name for a stage (transducer), e.g. 'map(parse)' or 'partition_all'."
+    spec = getattr(stage, '_fuse_spec', None)
+    if spec is not None:
+        if len(spec) == 1:
+            return spec[0]
+        arg = spec[1]
+        return '{}({})'.format(spec[0], getattr(arg, '__name__', repr(arg)))
+    name = getattr(stage, '__name__', None)
+    if name is None:
+        return type(stage).__name__
+    if name.startswith('_') and name.endswith('_xf'):
+        name = name[1:-3]
+    return name
+
+def instrumented_transduce(xform, f, init, coll, sink):
+    """
+    transduce with each stage of xform instrumented; hands the report to
+    sink (log_report when sink is not callable).
+    """
+    if isinstance(xform, _FusedXform):
+        xform = xform.xform
+    collected = []
+    stages = [_instrument('{}:{}'.format(i, stage_name(stage)), stage, None, collected) for i, stage in enumerate(_xform_stages(xform))]
+    _f = comp(*stages)(f) if stages else f
+    result = _f(reduce(_f, init, coll))
+    (sink if callable(sink) else log_report)([stats.report() for stats in reversed(collected)])    # stages are applied to rf last to first
+    return result
+
+def format_report(report):
+    "Returns the report as a (multi-line) table."
+    lines = ['{:<24} {:>10} {:>10} {:>10} {:>12} {:>7} {:>12}'.format('stage', 'in', 'out', 'self (s)', 'items/s', 'reduced', 'complete (s)')]
+    for stage in report:
+        lines.append('{:<24} {:>10} {:>10} {:>10.6f} {:>12} {:>7} {:>12.6f}'.format(
+            stage['name'][:24],
+            stage['items_in'],
+            stage['items_out'],
+            stage['self_seconds'],
+            '-' if stage['items_per_second'] is None else '{:.0f}'.format(stage['items_per_second']),
+            stage['reduced'],
+            stage['complete_seconds']))
+    return '\n'.join(lines)
+
+_logger = getLogger(__name__)
+
+def log_report(report):
+    "Logs the report (as a table) on the logger of this module, at INFO level."
+    _logger.info('Pipeline report:\n%s', format_report(report))
+
+
+class _MemStats(object):
+    __slots__ = ('name', 'items_in', 'retained', 'peak')
+
+    def __init__(self, name):
+        self.name = name
+        self.items_in = self.retained = self.peak = 0
+
+    def report(self):
+        return {
+            'name': self.name,
+            'items_in': self.items_in,
+            'retained_bytes': self.retained,
+            'peak_bytes': self.peak,
+        }
+
+class _MemTracker(object):
+    """
+    Attributes the memory allocated between two boundaries (entering or
+    leaving a traced stage) to the stats on top of the stack; None on top
+    means not accounted.
+    """
+    __slots__ = ('_stack', '_current')
+
+    def __init__(self, root):
+        self._stack = [root]
+        tracemalloc.reset_peak()
+        self._current = tracemalloc.get_traced_memory()[0]
+
+    def _flush(self):
+        current, peak = tracemalloc.get_traced_memory()
+        owner = self._stack[-1]
+        if owner is not None:
+            owner.retained += current - self._current
+            owner.peak = max(owner.peak, peak - self._current)
+        self._current = current
+        tracemalloc.reset_peak()
+
+    def enter(self, stats):
+        self._flush()
+        self._stack.append(stats)
+
+    def exit(self):
+        self._flush()
+        self._stack.pop()
+
+class _MemTraced(ReducingFn):
+    __slots__ = ('_rf', '_rf_step', '_stats', '_tracker')
+
+    def __init__(self, rf, stats, tracker):
+        self._rf = rf
+        self._rf_step = _step_of(rf)
+        self._stats = stats
+        self._tracker = tracker
+
+    def init(self):
+        self._tracker.enter(self._stats)
+        try:
+            return self._rf()
+        finally:
+            self._tracker.exit()
+
+    def step(self, acc, x):
+        self._stats.items_in += 1
+        self._tracker.enter(self._stats)
+        try:
+            return self._rf_step(acc, x)
+        finally:
+            self._tracker.exit()
+
+    def complete(self, acc):
+        self._tracker.enter(self._stats)
+        try:
+            return self._rf(acc)
+        finally:
+            self._tracker.exit()
+
+def _traced(xf, stats, tracker):
+    def _traced_xf(rf):
+        return _MemTraced(xf(rf), stats, tracker)
+    return _traced_xf
+
+def _traced_xform(xform, rf_name, tracker, collect):
+    "Returns xform with each stage, and the reducing function it is applied to, traced."
+    if isinstance(xform, _FusedXform):
+        xform = xform.xform
+    stages = []
+    for i, stage in enumerate(_xform_stages(xform)):
+        stats = _MemStats('{}:{}'.format(i, stage_name(stage)))
+        collect.append(stats)
+        stages.append(_traced(stage, stats, tracker))
+    stats = _MemStats('rf:{}'.format(rf_name))
+    collect.append(stats)
+    stages.append(_traced(identity, stats, tracker))
+    return comp(*stages)
+
+class _Tracing(object):
+    "Starts tracemalloc (unless already tracing) for the duration of a traced pipeline."
+    __slots__ = ('_started',)
+
+    def __enter__(self):
+        self._started = not tracemalloc.is_tracing()
+        if self._started:
+            tracemalloc.start()
+
+    def __exit__(self, *exc):
+        if self._started:
+            tracemalloc.stop()
+
+def traced_transduce(xform, f, init, coll, sink):
+    """
+    transduce with the memory allocated by the source, each stage of xform
+    and f traced; hands the report to sink (log_memory_report when sink is
+    not callable).
+    """
+    with _Tracing():
+        source = _MemStats('source')
+        collected = [source]
+        tracker = _MemTracker(source)
+        _f = _traced_xform(xform, stage_name(f), tracker, collected)(f)
+        result = _f(reduce(_f, init, coll))
+        tracker.exit()
+    (sink if callable(sink) else log_memory_report)([stats.report() for stats in collected])
+    return result
+
+def traced_sequence(xform, coll, sink):
+    """
+    sequence with the memory allocated by the source, each stage of xform
+    and the buffer of sequence traced; hands the report to sink
+    (log_memory_report when sink is not callable) once exhausted or closed.
+    Allocations by the consumer are not accounted.
+    """
+    with _Tracing():
+        source = _MemStats('source')
+        collected = [source]
+        tracker = _MemTracker(source)
+        try:
+            for x in sequence(_traced_xform(xform, 'sequence', tracker, collected), coll):
+                tracker.enter(None)
+                try:
+                    yield x
+                finally:
+                    tracker.exit()
+        finally:
+            tracker.exit()
+            (sink if callable(sink) else log_memory_report)([stats.report() for stats in collected])
+
+def format_memory_report(report):
+    "Returns the memory report as a (multi-line) table."
+    lines = ['{:<24} {:>10} {:>14} {:>14}'.format('stage', 'in', 'retained (B)', 'peak (B)')]
+    for stage in report:
+        lines.append('{:<24} {:>10} {:>14} {:>14}'.format(
+            stage['name'][:24],
+            stage['items_in'],
+            stage['retained_bytes'],
+            stage['peak_bytes']))
+    return '\n'.join(lines)
+
+def log_memory_report(report):
+    "Logs the memory report (as a table) on the logger of this module, at INFO level."
+    _logger.info('Pipeline memory report:\n%s', format_memory_report(report))
@@ -0,0 +1,483 @@
+## begin license ##
+#
+# Seecr Functools a set of various functional tools
+#
+# Copyright (C) 2026 Seecr (Seek You Too B.V.) https://seecr.nl
+#
+# This file is part of "Seecr Functools"
+#
+# "Seecr Functools" is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# "Seecr Functools" is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with "Seecr Functools"; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+## end license ##
+
+"""
+File sources built on mmap.
+
+Sources are re-iterable and self-reducing (see core.reduce): reduce and
+transduce run one loop over the mapping, without a generator in between,
+and stop reading as soon as the reduction is reduced.
+
+chunks hands out memoryview slices of the mapped file (no copying; use
+bytes(chunk) when needed).  The mapping is closed after each reduction or
+iteration, unless slices are still referenced - it is then released once
+these are garbage collected.  lines and records are bytes, split from
+blocks of the mapping: per item a (small) bytes object is cheaper than a
+memoryview.
+
+jsonl_source decodes newline-delimited JSON a block of lines at a time.
+
+Sinks (to_file, to_jsonl and to_csv) are reducing functions for transduce
+writing their inputs to a file in bulk; atomically - the file at path is
+only replaced once all has been written (and synced).
+"""
+
+from contextlib import contextmanager
+from csv import writer as csv_writer
+from io import StringIO
+from json import dumps, loads, JSONDecoder
+from mmap import mmap, ACCESS_READ
+from os import chmod, fstat, fsync, replace, remove, stat, urandom, open as os_open, close as os_close, O_RDONLY, O_WRONLY, O_CREAT, O_EXCL
+from os.path import abspath, basename, dirname, join
+from weakref import finalize
+
+try:
+    from os import O_BINARY    # Windows
+except ImportError:
+    O_BINARY = 0
+
+from seecr.functools.core import ReducingFn, _step_of, is_reduced, get_in
+
+
+_BLOCK_SIZE = 1 << 20
+
+@contextmanager
+def _mapped(path):
+    "Yields the mapped file; None for an empty file."
+    with open(path, 'rb') as f:
+        if fstat(f.fileno()).st_size == 0:
+            yield None
+            return
+        mm = mmap(f.fileno(), 0, access=ACCESS_READ)
+    try:
+        yield mm
+    finally:
+        try:
+            mm.close()
+        except BufferError:
+            pass            # slices still referenced; closed when these are gone
+
+def _split_blocks(mm, delimiter):
+    """
+    Generates lists of records from consecutive blocks of mm, each block
+    starting at a record and ending at the last delimiter within about
+    _BLOCK_SIZE bytes.  A record longer than that is searched for its end
+    and sliced out as a whole.  The final list is the last record when not
+    empty.
+    """
+    start, end, n = 0, len(mm), len(delimiter)
+    while start < end:
+        block_end = min(start + _BLOCK_SIZE, end)
+        last = mm.rfind(delimiter, start, block_end)
+        if last != -1:
+            yield mm[start:last].split(delimiter)
+        else:
+            last = mm.find(delimiter, max(start, block_end - n + 1))
+            if last == -1:
+                yield [mm[start:end]]
+                return
+            yield [mm[start:last]]
+        start = last + n
+
+class _Records(object):
+    __slots__ = ('_path', '_delimiter')
+
+    def __init__(self, path, delimiter):
+        if not delimiter:
+            raise ValueError("Empty delimiter")
+        self._path = path
+        self._delimiter = delimiter
+
+    def __iter__(self):
+        with _mapped(self._path) as mm:
+            if mm is None:
+                return
+            for records in _split_blocks(mm, self._delimiter):
+                yield from records
+
+    def __seecr_reduce__(self, f, acc):
+        f = _step_of(f)
+        with _mapped(self._path) as mm:
+            if mm is None:
+                return acc
+            for records in _split_blocks(mm, self._delimiter):
+                for record in records:
+                    acc = f(acc, record)
+                    if is_reduced(acc):
+                        return acc
+        return acc
+
+def records(path, delimiter):
+    """
+    Returns a source of the records (bytes) in the file at path, separated
+    by the bytes delimiter (not included); a delimiter at the end of the
+    file does not start another (empty) record.
+    """
+    return _Records(path, delimiter)
+
+def lines(path):
+    """
+    Returns a source of the lines (bytes) in the file at path, without the
+    line end (b'\\n'); see records.
+    """
+    return _Records(path, b'\n')
+
+class _Chunks(object):
+    __slots__ = ('_path', '_size')
+
+    def __init__(self, path, size):
+        if size < 1:
+            raise ValueError("Chunk size must be >= 1 ({} given)".format(size))
+        self._path = path
+        self._size = size
+
+    def __iter__(self):
+        with _mapped(self._path) as mm:
+            if mm is None:
+                return
+            view, size = memoryview(mm), self._size
+            try:
+                for start in range(0, len(view), size):
+                    yield view[start:start + size]
+            finally:
+                view.release()
+
+    def __seecr_reduce__(self, f, acc):
+        f = _step_of(f)
+        with _mapped(self._path) as mm:
+            if mm is None:
+                return acc
+            view, size = memoryview(mm), self._size
+            try:
+                for start in range(0, len(view), size):
+                    acc = f(acc, view[start:start + size])
+                    if is_reduced(acc):
+                        return acc
+            finally:
+                view.release()
+        return acc
+
+def chunks(path, size):
+    """
+    Returns a source of consecutive chunks (memoryview slices of the
+    mapping) of size bytes of the file at path; the last one possibly
+    shorter.
+    """
+    return _Chunks(path, size)
+
+
+def _split_stream(stream):
+    """
+    Like _split_blocks, for a (binary or text) stream; the pieces of a line
+    spanning reads are kept, and joined once its end is read.
+    """
+    pending = []
+    while True:
+        data = stream.read(_BLOCK_SIZE)
+        if not data:
+            break
+        newline = b'\n' if isinstance(data, bytes) else '\n'
+        last = data.rfind(newline)
+        if last == -1:
+            pending.append(data)
+            continue
+        head, tail = data[:last], data[last + 1:]
+        if pending:
+            pending.append(head)
+            head = data[:0].join(pending)
+        yield head.split(newline)
+        pending = [tail] if tail else []
+    if pending:
+        yield [pending[0][:0].join(pending)]
+
+_scan_once = JSONDecoder().scan_once
+
+def _decode_lines(lines):
+    """
+    Decodes a block of JSON lines in one text, joined by ',\n' (which no
+    JSON value contains outside of an array or object), with the C scanner
+    of json; each value must end right before a separator, and there must
+    be as many values as lines - so each value is exactly one line.  When
+    that fails, decodes lazily per line, so the values before a bad line
+    are still handed out before it raises.
+    """
+    if lines and isinstance(lines[0], bytes):
+        lines = [line for line in (line.strip(b' \t\r') for line in lines) if line]
+        try:
+            text = b',\n'.join(lines).decode('utf-8')
+        except UnicodeDecodeError:
+            return (loads(line) for line in lines)
+    else:
+        lines = [line for line in (line.strip(' \t\r') for line in lines) if line]
+        text = ',\n'.join(lines)
+    if not lines:
+        return lines
+    scan_once = _scan_once
+    values = []
+    end, last = 0, len(text)
+    try:
+        while True:
+            value, end = scan_once(text, end)
+            values.append(value)
+            if end == last:
+                break
+            if text[end:end + 2] != ',\n':
+                raise ValueError(end)
+            end += 2
+    except (StopIteration, ValueError):
+        return (loads(line) for line in lines)
+    if len(values) != len(lines):
+        return (loads(line) for line in lines)
+    return values
+
+def _projector(projection):
+    if projection is None:
+        return None
+    if isinstance(projection, dict):
+        fields = list(projection.items())
+        return lambda value: {name: get_in(value, keypath) for name, keypath in fields}
+    return lambda value: get_in(value, projection)
+
+class _JsonlSource(object):
+    __slots__ = ('_source', '_project')
+
+    def __init__(self, source, projection):
+        self._source = source
+        self._project = _projector(projection)
+
+    def _blocks(self):
+        "Generates lists of decoded (and projected) values."
+        if hasattr(self._source, 'read'):
+            yield from self._decoded(_split_stream(self._source))
+            return
+        with _mapped(self._source) as mm:
+            if mm is not None:
+                yield from self._decoded(_split_blocks(mm, b'\n'))
+
+    def _decoded(self, line_blocks):
+        project = self._project
+        for lines in line_blocks:
+            values = _decode_lines(lines)
+            yield values if project is None else map(project, values)
+
+    def __iter__(self):
+        for values in self._blocks():
+            yield from values
+
+    def __seecr_reduce__(self, f, acc):
+        f = _step_of(f)
+        blocks = self._blocks()
+        try:
+            for values in blocks:
+                for value in values:
+                    acc = f(acc, value)
+                    if is_reduced(acc):
+                        return acc
+        finally:
+            blocks.close()
+        return acc
+
+def jsonl_source(path_or_stream, projection=None):
+    """
+    Returns a self-reducing source of the values in a file of
+    newline-delimited JSON, given its path (read through mmap) or a
+    readable (binary or text) stream; blank lines are skipped.  Lines are
+    decoded a block (about 1 MiB) at a time, with a single json.loads.
+
+    With a projection - a keypath (see core.get_in), or a dict of names to
+    keypaths - only the projection of each value is kept (and handed out):
+    the value at the keypath, or a dict of the values at the keypaths.
+
+    A source for a path is re-iterable, one for a stream is not.
+    """
+    return _JsonlSource(path_or_stream, projection)
+
+def _discard(f, tmp_path):
+    f.close()
+    try:
+        remove(tmp_path)
+    except FileNotFoundError:
+        pass
+
+def _fsync_dir(path):
+    try:
+        fd = os_open(path, O_RDONLY)
+    except OSError:
+        return              # e.g. Windows: directories cannot be opened
+    try:
+        fsync(fd)
+    finally:
+        os_close(fd)
+
+_TMP_FLAGS = O_WRONLY | O_CREAT | O_EXCL | O_BINARY
+
+def _create_tmp(path):
+    """
+    Creates a new temporary file next to path; with mode 0o666 (less the
+    umask, as open() does), unlike mkstemp's 0600.  Returns (fd, tmp_path).
+    """
+    for _ in range(100):
+        tmp_path = join(dirname(path), '.{}.{}.tmp'.format(basename(path), urandom(6).hex()))
+        try:
+            return os_open(tmp_path, _TMP_FLAGS, 0o666), tmp_path
+        except FileExistsError:
+            continue
+    raise FileExistsError('No usable temporary file name for {}'.format(path))
+
+def _existing_mode(path):
+    "Mode of the file at path; None when there is none."
+    try:
+        return stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        return None
+
+class _SinkState(object):
+    """
+    Accumulator of the sinks: the temporary file (in the directory of
+    path, so it can be renamed to path) and the encoded output not yet
+    written.  The temporary file is removed when the state is garbage
+    collected before completion (e.g. after an exception).
+    """
+    __slots__ = ('tmp_path', 'file', 'pieces', 'size', 'rows', 'finalizer', '__weakref__')
+
+    def __init__(self, path):
+        fd, self.tmp_path = _create_tmp(path)
+        self.file = open(fd, 'wb', buffering=0)
+        self.pieces = []
+        self.size = 0
+        self.rows = []
+        self.finalizer = finalize(self, _discard, self.file, self.tmp_path)
+
+    def write(self, data, buffer_bytes):
+        self.pieces.append(data)
+        self.size += len(data)
+        if self.size >= buffer_bytes:
+            self.flush()
+
+    def flush(self):
+        if self.pieces:
+            self.file.write(b''.join(self.pieces))
+            self.pieces = []
+            self.size = 0
+
+class _ToFile(ReducingFn):
+    __slots__ = ('_path', '_encoder', '_buffer_bytes')
+
+    def __init__(self, path, encoder, buffer_bytes):
+        self._path = abspath(path)
+        self._encoder = encoder
+        self._buffer_bytes = buffer_bytes
+
+    def init(self):
+        return _SinkState(self._path)
+
+    def step(self, state, x):
+        state.write(self._encoder(x), self._buffer_bytes)
+        return state
+
+    def _before_complete(self, state):
+        pass
+
+    def complete(self, state):
+        try:
+            self._before_complete(state)
+            state.flush()
+            fsync(state.file.fileno())
+            state.file.close()
+            mode = _existing_mode(self._path)
+            if mode is not None:
+                chmod(state.tmp_path, mode)
+            replace(state.tmp_path, self._path)
+        except BaseException:
+            state.finalizer()
+            raise
+        state.finalizer.detach()
+        _fsync_dir(dirname(self._path))
+        return self._path
+
+def to_file(path, encoder, buffer_bytes=1 << 20):
+    """
+    Returns a reducing function writing encoder(x) (bytes) for each input x
+    to a temporary file, in writes of about buffer_bytes.  On completion
+    the temporary file is synced and renamed to path; completes to path.
+    When the reduction does not complete (e.g. raises), path is untouched.
+
+    Use with transduce (or call its 0- and 1-arity yourself): every
+    reduction starts (0-arity) with a new temporary file.
+    """
+    return _ToFile(path, encoder, buffer_bytes)
+
+def to_jsonl(path, buffer_bytes=1 << 20, **dumps_kwargs):
+    """
+    Returns a reducing function writing each input as a line of JSON
+    (encoded with json.dumps(x, **dumps_kwargs)) to path; see to_file.
+    """
+    def _encode(x):
+        return (dumps(x, **dumps_kwargs) + '\n').encode('utf-8')
+    return _ToFile(path, _encode, buffer_bytes)
+
+_CSV_BATCH = 1024
+
+class _ToCsv(_ToFile):
+    """
+    Collects rows, to have them formatted by csv.writer's writerows in
+    batches of _CSV_BATCH.
+    """
+    __slots__ = ('_header', '_encoding', '_fmtparams')
+
+    def __init__(self, path, header, buffer_bytes, encoding, fmtparams):
+        _ToFile.__init__(self, path, None, buffer_bytes)
+        self._header = header
+        self._encoding = encoding
+        self._fmtparams = fmtparams
+
+    def init(self):
+        state = _ToFile.init(self)
+        if self._header is not None:
+            state.rows.append(self._header)
+        return state
+
+    def step(self, state, row):
+        rows = state.rows
+        rows.append(row)
+        if len(rows) >= _CSV_BATCH:
+            self._write_rows(state)
+        return state
+
+    def _write_rows(self, state):
+        out = StringIO()
+        csv_writer(out, **self._fmtparams).writerows(state.rows)
+        state.rows = []
+        state.write(out.getvalue().encode(self._encoding), self._buffer_bytes)
+
+    def _before_complete(self, state):
+        self._write_rows(state)
+
+def to_csv(path, header=None, buffer_bytes=1 << 20, encoding='utf-8', **fmtparams):
+    """
+    Returns a reducing function writing each input (a sequence of fields)
+    as a row to the CSV file at path, preceded by header (when given);
+    fmtparams are passed to csv.writer.  See to_file.
+    """
+    return _ToCsv(path, header, buffer_bytes, encoding, fmtparams)
@@ -0,0 +1,194 @@
+## begin license ##
+#
+# Seecr Functools a set of various functional tools
+#
+# Copyright (C) 2026 Seecr (Seek You Too B.V.) https://seecr.nl
+#
+# This file is part of "Seecr Functools"
+#
+# "Seecr Functools" is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# "Seecr Functools" is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with "Seecr Functools"; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+## end license ##
+
+"""
+Sampled per-call latency of the function combinators (comp, juxt,
+thrush, some_thread, before, after, any_fn and fpartial).
+
+After enable(every=N) functions composed with these combinators time 1
+in N of their calls (thrush and some_thread: 1 in N calls of either)
+into a log-bucketed Histogram per composition, named after the
+combinator and the functions it combines, e.g. 'comp(parse, validate)'.
+Functions composed while disabled are not wrapped at all; those composed
+while enabled keep sampling after disable().  track(name, fn) samples a
+single function under a name of choice.
+
+report() returns per name the number of samples and the p50, p99 and
+p999 latencies in nanoseconds.
+"""
+
+from math import ceil
+from time import perf_counter_ns
+
+import seecr.functools.core as _core
+
+
+class Histogram(object):
+    """
+    Counts of nanosecond values in logarithmic buckets: values below 16
+    exactly, above that 8 buckets per power of 2 (so within 12.5%).
+    """
+    __slots__ = ('_counts', 'count')
+
+    def __init__(self):
+        self._counts = []
+        self.count = 0
+
+    def record(self, ns):
+        if ns < 16:
+            i = max(ns, 0)
+        else:
+            e = ns.bit_length() - 4
+            i = (e << 3) + (ns >> e)
+        counts = self._counts
+        if i >= len(counts):
+            counts.extend([0] * (i + 1 - len(counts)))
+        counts[i] += 1
+        self.count += 1
+
+    def percentile(self, q):
+        "Upper bound of the bucket holding the q-quantile (0 < q <= 1); None when empty."
+        if not self.count:
+            return None
+        rank = max(1, ceil(q * self.count))
+        seen = 0
+        for i, n in enumerate(self._counts):
+            seen += n
+            if seen >= rank:
+                return _upper_bound(i)
+
+def _upper_bound(i):
+    if i < 16:
+        return i
+    e = (i >> 3) - 1
+    return (((i & 7) | 8) + 1 << e) - 1
+
+
+_histograms = {}
+
+def _histogram(name):
+    hist = _histograms.get(name)
+    if hist is None:
+        hist = _histograms.setdefault(name, Histogram())
+    return hist
+
+def _fn_name(f):
+    return getattr(f, '__name__', None) or type(f).__name__
+
+def _name(kind, fns):
+    return '{}({})'.format(kind, ', '.join(_fn_name(f) for f in fns))
+
+def _sampled(name, fn, every):
+    hist = _histogram(name)
+    countdown = every
+    def _timed(*a, **kw):
+        nonlocal countdown
+        countdown -= 1
+        if countdown:
+            return fn(*a, **kw)
+        countdown = every
+        t = perf_counter_ns()
+        try:
+            return fn(*a, **kw)
+        finally:
+            hist.record(perf_counter_ns() - t)
+    _timed.__name__ = name
+    _timed.__wrapped__ = fn
+    comp_fns = getattr(fn, '_comp_fns', None)
+    if comp_fns is not None:    # keeps comp-ed transducers fusable
+        _timed._comp_fns = comp_fns
+    return _timed
+
+
+_MAX_CACHED = 1024
+
+class _Sampler(object):
+    "The hook set in core: wraps composed functions, samples immediate calls."
+    __slots__ = ('_every', '_countdown', '_by_fns')
+
+    def __init__(self, every):
+        self._every = self._countdown = every
+        self._by_fns = {}   # (kind, fns) -> Histogram; naming is not cheap
+
+    def _histogram(self, kind, fns):
+        key = (kind, fns)
+        try:
+            hist = self._by_fns.get(key)
+        except TypeError:       # unhashable fn
+            return _histogram(_name(kind, fns))
+        if hist is None:
+            if len(self._by_fns) >= _MAX_CACHED:     # e.g. lambdas made per call
+                self._by_fns.clear()
+            hist = self._by_fns[key] = _histogram(_name(kind, fns))
+        return hist
+
+    def wrap(self, kind, fns, fn):
+        return _sampled(_name(kind, fns), fn, self._every)
+
+    def sample(self, kind, fns):
+        "None when this call is not sampled; else the fn to call when it is done."
+        self._countdown -= 1
+        if self._countdown:
+            return None
+        self._countdown = self._every
+        hist = self._histogram(kind, fns)
+        t = perf_counter_ns()
+        return lambda: hist.record(perf_counter_ns() - t)
+
+def enable(every=100):
+    "Samples 1 in every calls of functions composed from now on."
+    if every < 1:
+        raise ValueError('every must be >= 1')
+    _core._latency_hook = _Sampler(every)
+
+def disable():
+    _core._latency_hook = None
+
+def track(name, fn, every=100):
+    "Returns fn sampling 1 in every calls into the histogram for name."
+    if every < 1:
+        raise ValueError('every must be >= 1')
+    return _sampled(name, fn, every)
+
+def histogram(name):
+    "The Histogram for name, or None."
+    return _histograms.get(name)
+
+def report():
+    "{name: {'samples': n, 'p50': ns, 'p99': ns, 'p999': ns}} for all sampled names."
+    return {
+        name: {
+            'samples': hist.count,
+            'p50': hist.percentile(0.5),
+            'p99': hist.percentile(0.99),
+            'p999': hist.percentile(0.999),
+        }
+        for name, hist in list(_histograms.items()) if hist.count
+    }
+
+def reset():
+    "Forgets all samples (functions composed while enabled keep sampling)."
+    for hist in list(_histograms.values()):
+        hist._counts = []
+        hist.count = 0
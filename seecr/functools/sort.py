@@ -0,0 +1,303 @@
+## begin license ##
+#
+# Seecr Functools a set of various functional tools
+#
+# Copyright (C) 2026 Seecr (Seek You Too B.V.) https://seecr.nl
+#
+# This file is part of "Seecr Functools"
+#
+# "Seecr Functools" is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# "Seecr Functools" is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with "Seecr Functools"; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+## end license ##
+
+"""
+Sorting related reducing functions, transducers and sources, for
+collections too large to sort (or hold) as a whole.
+"""
+
+from heapq import heapify, heappush, heapreplace, heappop
+from itertools import count, groupby
+from pickle import dump, load, HIGHEST_PROTOCOL
+from tempfile import TemporaryFile
+
+from seecr.functools.core import ReducingFn, _Stage, _step_of, is_reduced, unreduced, reduce
+
+
+class _TopK(ReducingFn):
+    """
+    The accumulator is a min-heap of (key, -seq, item) holding the (up to)
+    n largest items seen; -seq makes earlier items win ties, and keeps
+    items themselves from being compared.
+    """
+    __slots__ = ('_n', '_key', '_seq')
+
+    def __init__(self, n, key):
+        if n < 0:
+            raise ValueError("top_k needs n >= 0 ({} given)".format(n))
+        self._n = n
+        self._key = key
+        self._seq = count()
+
+    def init(self):
+        return []
+
+    def step(self, heap, x):
+        k = x if self._key is None else self._key(x)
+        if len(heap) < self._n:
+            heappush(heap, (k, -next(self._seq), x))
+        elif heap and k > heap[0][0]:
+            heapreplace(heap, (k, -next(self._seq), x))
+        return heap
+
+    def complete(self, heap):
+        return [entry[2] for entry in sorted(heap, reverse=True)]
+
+def top_k(n, key=None):
+    """
+    Returns a reducing function collecting the n largest items (by key),
+    in O(n) memory; completes to a list of these, largest first - i.e.
+    sorted(coll, key=key, reverse=True)[:n].
+    """
+    return _TopK(n, key)
+
+class _TakeTopStep(_Stage):
+    __slots__ = ('_top', '_heap')
+
+    def __init__(self, rf, n, key):
+        _Stage.__init__(self, rf)
+        self._top = _TopK(n, key)
+        self._heap = []
+
+    def step(self, acc, x):
+        self._top.step(self._heap, x)
+        return acc
+
+    def complete(self, acc):
+        heap, self._heap = self._heap, []
+        for x in self._top.complete(heap):
+            acc = self._rf_step(acc, x)
+            if is_reduced(acc):
+                acc = unreduced(acc)
+                break
+        return self._rf(acc)
+
+def take_top(n, key=None):
+    """
+    Returns a transducer which emits, on completion, the n largest items
+    (by key) largest first; see top_k.
+    """
+    if n < 0:
+        raise ValueError("take_top needs n >= 0 ({} given)".format(n))
+    def _take_top_xf(rf):
+        return _TakeTopStep(rf, n, key)
+    return _take_top_xf
+
+class _MergeSorted(object):
+    """
+    Iterator doing a k-way merge with a heap of [key, coll index, item,
+    iterator] entries (without key: [item, coll index, iterator]); also
+    self-reducing (see core.reduce) on the same state.
+    """
+    __slots__ = ('_colls', '_key', '_heap')
+
+    def __init__(self, colls, key):
+        self._colls = colls
+        self._key = key
+        self._heap = None
+
+    def _init_heap(self):
+        key, heap = self._key, []
+        for i, coll in enumerate(self._colls):
+            it = iter(coll)
+            for x in it:
+                heap.append([x, i, it] if key is None else [key(x), i, x, it])
+                break
+        heapify(heap)
+        self._colls = None
+        self._heap = heap
+        return heap
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        heap = self._heap
+        if heap is None:
+            heap = self._init_heap()
+        if not heap:
+            raise StopIteration
+        entry = heap[0]
+        if self._key is None:
+            x = entry[0]
+            nxt = next(entry[2], entry)
+            if nxt is entry:
+                heappop(heap)
+            else:
+                entry[0] = nxt
+                heapreplace(heap, entry)
+        else:
+            x = entry[2]
+            nxt = next(entry[3], entry)
+            if nxt is entry:
+                heappop(heap)
+            else:
+                entry[0], entry[2] = self._key(nxt), nxt
+                heapreplace(heap, entry)
+        return x
+
+    def __seecr_reduce__(self, f, acc):
+        f = _step_of(f)
+        heap = self._heap
+        if heap is None:
+            heap = self._init_heap()
+        key = self._key
+        it_index = 2 if key is None else 3
+        while len(heap) > 1:
+            entry = heap[0]
+            acc = f(acc, entry[0] if key is None else entry[2])
+            nxt = next(entry[it_index], entry)
+            if nxt is entry:
+                heappop(heap)
+            elif key is None:
+                entry[0] = nxt
+                heapreplace(heap, entry)
+            else:
+                entry[0], entry[2] = key(nxt), nxt
+                heapreplace(heap, entry)
+            if is_reduced(acc):
+                return acc
+        if heap:                        # one coll left: no more merging
+            entry = heap[0]
+            acc = f(acc, entry[0] if key is None else entry[2])
+            if is_reduced(acc):
+                self._advance_last(entry, it_index)
+                return acc
+            for x in entry[it_index]:
+                acc = f(acc, x)
+                if is_reduced(acc):
+                    self._advance_last(entry, it_index)
+                    return acc
+            heap.clear()
+        return acc
+
+    def _advance_last(self, entry, it_index):
+        nxt = next(entry[it_index], entry)
+        if nxt is entry:
+            self._heap.clear()
+        elif self._key is None:
+            entry[0] = nxt
+        else:
+            entry[0], entry[2] = self._key(nxt), nxt
+
+def merge_sorted(*colls, key=None):
+    """
+    Returns a lazy iterator merging the items of the (each sorted by key)
+    colls into one sorted sequence; items with equal keys in the order of
+    colls.  Like heapq.merge, and self-reducing: reduce (and transduce) run
+    the merge in a tight loop.
+    """
+    return _MergeSorted(colls, key)
+
+_RUN_BATCH = 1024
+
+def _write_run(items):
+    "Writes items to a temporary file, pickled in batches; returns the (rewound) file."
+    f = TemporaryFile()
+    for i in range(0, len(items), _RUN_BATCH):
+        dump(items[i:i + _RUN_BATCH], f, HIGHEST_PROTOCOL)
+    f.seek(0)
+    return f
+
+def _read_run(f):
+    with f:
+        while True:
+            try:
+                batch = load(f)
+            except EOFError:
+                return
+            yield from batch
+
+class _SpillState(object):
+    __slots__ = ('items', 'runs')
+
+    def __init__(self):
+        self.items = []
+        self.runs = []
+
+class _SpillingSort(ReducingFn):
+    """
+    The accumulator holds up to mem_limit items; when full these are
+    sorted and spilled to a temporary file (a run).  Completes to a lazy
+    merge of the runs and the items still in memory.
+    """
+    __slots__ = ('_key', '_mem_limit')
+
+    def __init__(self, key, mem_limit):
+        if mem_limit < 1:
+            raise ValueError("mem_limit must be >= 1 ({} given)".format(mem_limit))
+        self._key = key
+        self._mem_limit = mem_limit
+
+    def init(self):
+        return _SpillState()
+
+    def step(self, state, x):
+        items = state.items
+        items.append(x)
+        if len(items) >= self._mem_limit:
+            items.sort(key=self._key)
+            state.runs.append(_write_run(items))
+            state.items = []
+        return state
+
+    def complete(self, state):
+        state.items.sort(key=self._key)
+        runs, state.runs = state.runs, []
+        return merge_sorted(*[_read_run(run) for run in runs] + [state.items], key=self._key)
+
+def spilling_sort(key=None, mem_limit=1000000):
+    """
+    Returns a reducing function sorting its inputs by key (stable), keeping
+    at most mem_limit items in memory: sorted runs of mem_limit items are
+    pickled to temporary files.  Completes to a lazy iterator over all
+    items, merging the runs; the files are removed once it is exhausted
+    (or garbage collected).
+    """
+    return _SpillingSort(key, mem_limit)
+
+def external_sort(key, coll, mem_limit=1000000):
+    """
+    Returns a lazy iterator of the items of coll sorted by key (stable;
+    key None sorts the items themselves), holding at most mem_limit items
+    in memory; see spilling_sort.
+    """
+    rf = _SpillingSort(key, mem_limit)
+    return rf.complete(reduce(rf, rf.init(), coll))
+
+class _SpillingGroupBy(_SpillingSort):
+    __slots__ = ()
+
+    def complete(self, state):
+        return ((k, list(group)) for k, group in groupby(_SpillingSort.complete(self, state), key=self._key))
+
+def spilling_group_by(f, mem_limit=1000000):
+    """
+    Returns a reducing function grouping its inputs by f(item), keeping at
+    most mem_limit items in memory (see spilling_sort).  Completes to a lazy
+    iterator of (key, items) pairs ordered by key - so keys must be
+    orderable - each list of items in input order.  Only one group at a
+    time is held in memory.
+    """
+    return _SpillingGroupBy(f, mem_limit)
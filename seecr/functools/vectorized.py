@@ -0,0 +1,226 @@
+## begin license ##
+#
+# Seecr Functools a set of various functional tools
+#
+# Copyright (C) 2026 Seecr (Seek You Too B.V.) https://seecr.nl
+#
+# This file is part of "Seecr Functools"
+#
+# "Seecr Functools" is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# "Seecr Functools" is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with "Seecr Functools"; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+## end license ##
+
+"""
+NumPy-vectorized transducers and reducing functions.
+
+Sources are NumPy ndarrays, or iterables of ndarray batches; these are
+handed through the pipeline as whole arrays (see ReducingFn.step_chunk),
+so vectorized map functions and filter predicates are called once per
+array i.s.o. once per element.
+
+Use this module's transduce and sequence for that: core.transduce and
+core.sequence do not dispatch here, they loop per element over an
+ndarray (core.map's f is a function of one element, not of an array).
+
+NumPy is an optional dependency (pip install seecr-functools[numpy]), only
+imported when actually used.
+"""
+
+import builtins
+
+from seecr.functools.core import ReducingFn, reducing_fn, is_reduced, _Stage, _step_chunk, _reduce_chunks
+
+
+def _numpy():
+    import numpy
+    return numpy
+
+def _is_ndarray(o):
+    return isinstance(o, _numpy().ndarray)
+
+class _MapStep(_Stage):
+    __slots__ = ('_f',)
+
+    def __init__(self, rf, f):
+        _Stage.__init__(self, rf)
+        self._f = f
+
+    def step(self, acc, x):
+        return self._rf_step(acc, self._f(x))
+
+    def step_chunk(self, acc, xs):
+        return _step_chunk(self._rf, acc, self._f(_numpy().asarray(xs)))
+
+def map(f):
+    """
+    Returns a transducer applying the vectorized callable f (e.g. a NumPy
+    ufunc) to whole arrays of inputs at once; or to single items when not
+    used chunked.
+    """
+    def _map_xf(rf):
+        return _MapStep(rf, f)
+    return _map_xf
+
+class _FilterStep(_Stage):
+    __slots__ = ('_pred',)
+
+    def __init__(self, rf, pred):
+        _Stage.__init__(self, rf)
+        self._pred = pred
+
+    def step(self, acc, x):
+        if self._pred(x):
+            return self._rf_step(acc, x)
+        return acc
+
+    def step_chunk(self, acc, xs):
+        xs = _numpy().asarray(xs)
+        return _step_chunk(self._rf, acc, xs[self._pred(xs)])
+
+def filter(pred):
+    """
+    Returns a transducer keeping the items for which the vectorized pred
+    holds; pred is called with a whole array of inputs and must return a
+    boolean mask for it.
+    """
+    def _filter_xf(rf):
+        return _FilterStep(rf, pred)
+    return _filter_xf
+
+
+class _Sum(ReducingFn):
+    __slots__ = ()
+
+    def init(self):
+        return 0
+
+    def step(self, acc, x):
+        return acc + x
+
+    def step_chunk(self, acc, xs):
+        return acc + _numpy().sum(xs)
+
+class _Count(ReducingFn):
+    __slots__ = ()
+
+    def init(self):
+        return 0
+
+    def step(self, acc, x):
+        return acc + 1
+
+    def step_chunk(self, acc, xs):
+        return acc + len(xs)
+
+class _Extreme(ReducingFn):
+    __slots__ = ('_pick', '_np_pick')
+
+    def __init__(self, pick, np_pick):
+        self._pick = pick
+        self._np_pick = np_pick
+
+    def init(self):
+        return None
+
+    def step(self, acc, x):
+        return x if acc is None else self._pick(acc, x)
+
+    def step_chunk(self, acc, xs):
+        if len(xs) == 0:
+            return acc
+        return self.step(acc, getattr(_numpy(), self._np_pick)(xs))
+
+# Reducing fns; 0-arity gives 0 for sum and count, None for min and max.
+sum = _Sum()
+count = _Count()
+min = _Extreme(builtins.min, 'min')
+max = _Extreme(builtins.max, 'max')
+
+
+def _chunks(source, chunk_size):
+    if _is_ndarray(source):
+        if chunk_size is None:
+            yield source
+            return
+        for i in range(0, len(source), chunk_size):
+            yield source[i:i + chunk_size]
+    else:
+        for batch in source:
+            yield batch
+
+def transduce(*a, chunk_size=None):
+    """
+    transduce(xform, f, source, chunk_size=None)
+    transduce(xform, f, init, source, chunk_size=None)
+
+    Same as core.transduce for a source which is an ndarray, or an iterable
+    of ndarray batches.  Each batch (or the whole array; or slices of
+    chunk_size elements when given) goes through the pipeline at once:
+    map and filter (from this module) call their vectorized fns with it,
+    the core map, filter, remove, take, drop and cat transducers handle it
+    as a chunk, other stages get called per element.
+
+    The sum, count, min and max reducing functions from this module reduce
+    each batch with NumPy's own reductions.
+    """
+    if len(a) == 3:
+        xform, f, source = a
+        del a
+        return transduce(xform, f, f(), source, chunk_size=chunk_size)
+    elif len(a) == 4:
+        xform, f, init, source = a
+        del a
+    else:
+        raise TypeError("transduce takes either 3 or 4 arguments ({} given)".format(len(a)))
+
+    _f = reducing_fn(xform(f))
+    return _f.complete(_reduce_chunks(_f, init, _chunks(source, chunk_size)))
+
+class _BatchOutput(ReducingFn):
+    __slots__ = ('_output',)
+
+    def __init__(self, output):
+        self._output = output
+
+    def init(self):
+        pass
+
+    def step(self, acc, x):
+        self._output.append((x,))
+
+    def step_chunk(self, acc, xs):
+        self._output.append(xs)
+
+def sequence(xform, source, chunk_size=None):
+    """
+    Returns a generator of the items of applying xform to the (ndarray
+    or ndarray batches) source; processing a batch at a time, like
+    transduce does.
+    """
+    _output = []
+    def _():
+        xf = reducing_fn(xform(_BatchOutput(_output)))
+        for chunk in _chunks(source, chunk_size):
+            maybe_reduced = xf.step_chunk(None, chunk)
+            for _o in _output:
+                yield from _o
+            del _output[:]
+            if is_reduced(maybe_reduced):
+                break
+        xf.complete(None)
+        for _o in _output:
+            yield from _o
+        del _output[:]
+    return _()
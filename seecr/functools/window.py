@@ -0,0 +1,371 @@
+## begin license ##
+#
+# Seecr Functools a set of various functional tools
+#
+# Copyright (C) 2026 Seecr (Seek You Too B.V.) https://seecr.nl
+#
+# This file is part of "Seecr Functools"
+#
+# "Seecr Functools" is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# "Seecr Functools" is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with "Seecr Functools"; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+## end license ##
+
+"""
+Count windows over a stream of items.
+
+sliding and tumbling emit the windows themselves (as tuples); sum, mean,
+min and max emit an aggregate of each window, maintained incrementally
+(O(1) amortized per item) i.s.o. recomputed over the whole window.
+
+Count windows are emitted once they are full; the trailing items of an
+incomplete window are not (see core.partition_all for that).
+
+window_by_time groups items by their timestamp in tumbling, hopping or
+session windows; these are emitted as (start, end, items) once the
+watermark has passed their end, and flushed on completion.
+"""
+
+import builtins
+
+from collections import deque
+from heapq import heappush, heappop
+from math import floor
+
+from seecr.functools.core import _Stage, is_reduced, unreduced
+
+
+def _check_n_step(n, step):
+    if n < 1:
+        raise ValueError("Window size must be >= 1 ({} given)".format(n))
+    if step < 1:
+        raise ValueError("Window step must be >= 1 ({} given)".format(step))
+
+class _SlidingStep(_Stage):
+    __slots__ = ('_buf', '_step', '_until')
+
+    def __init__(self, rf, n, step):
+        _Stage.__init__(self, rf)
+        self._buf = deque(maxlen=n)
+        self._step = step
+        self._until = n
+
+    def step(self, acc, x):
+        self._buf.append(x)
+        self._until -= 1
+        if self._until:
+            return acc
+        self._until = self._step
+        return self._rf_step(acc, tuple(self._buf))
+
+def sliding(n, step=1):
+    """
+    Returns a transducer emitting a tuple of the last n items for every
+    step items, starting with the first n items.  With step > n the items
+    in between windows are skipped.
+    """
+    _check_n_step(n, step)
+    def _sliding_xf(rf):
+        return _SlidingStep(rf, n, step)
+    return _sliding_xf
+
+class _TumblingStep(_Stage):
+    __slots__ = ('_n', '_buf')
+
+    def __init__(self, rf, n):
+        _Stage.__init__(self, rf)
+        self._n = n
+        self._buf = []
+
+    def step(self, acc, x):
+        buf = self._buf
+        buf.append(x)
+        if len(buf) < self._n:
+            return acc
+        self._buf = []
+        return self._rf_step(acc, tuple(buf))
+
+def tumbling(n):
+    """
+    Returns a transducer emitting consecutive, non-overlapping tuples of n
+    items.
+    """
+    _check_n_step(n, 1)
+    def _tumbling_xf(rf):
+        return _TumblingStep(rf, n)
+    return _tumbling_xf
+
+class _AggregateStep(_Stage):
+    """
+    Base for the window aggregates; subclasses implement _push(x) (to add
+    x to the window, evicting the oldest item once there are n) and
+    _value().
+    """
+    __slots__ = ('_n', '_step', '_until')
+
+    def __init__(self, rf, n, step):
+        _Stage.__init__(self, rf)
+        self._n = n
+        self._step = step
+        self._until = n
+
+    def step(self, acc, x):
+        self._push(x)
+        self._until -= 1
+        if self._until:
+            return acc
+        self._until = self._step
+        return self._rf_step(acc, self._value())
+
+class _SumStep(_AggregateStep):
+    __slots__ = ('_buf', '_sum', '_evicted')
+
+    def __init__(self, rf, n, step):
+        _AggregateStep.__init__(self, rf, n, step)
+        self._buf = deque(maxlen=n)
+        self._sum = 0
+        self._evicted = 0
+
+    def _push(self, x):
+        buf = self._buf
+        if len(buf) < self._n:
+            buf.append(x)
+            self._sum += x
+            return
+        oldest = buf[0]
+        buf.append(x)
+        self._evicted += 1
+        if self._evicted < self._n:
+            self._sum += x - oldest
+        else:
+            self._sum = builtins.sum(buf)   # every n evictions: drops accumulated (float) rounding errors
+            self._evicted = 0
+
+    def _value(self):
+        return self._sum
+
+class _MeanStep(_SumStep):
+    __slots__ = ()
+
+    def _value(self):
+        return self._sum / self._n
+
+class _MinStep(_AggregateStep):
+    """
+    Keeps a monotonic deque of (index, item): increasing items, each
+    the minimum of the window from its index on.
+    """
+    __slots__ = ('_q', '_i')
+
+    def __init__(self, rf, n, step):
+        _AggregateStep.__init__(self, rf, n, step)
+        self._q = deque()
+        self._i = 0
+
+    def _push(self, x):
+        q, i = self._q, self._i
+        while q and not q[-1][1] < x:
+            q.pop()
+        q.append((i, x))
+        if q[0][0] <= i - self._n:
+            q.popleft()
+        self._i = i + 1
+
+    def _value(self):
+        return self._q[0][1]
+
+class _MaxStep(_MinStep):
+    __slots__ = ()
+
+    def _push(self, x):
+        q, i = self._q, self._i
+        while q and not q[-1][1] > x:
+            q.pop()
+        q.append((i, x))
+        if q[0][0] <= i - self._n:
+            q.popleft()
+        self._i = i + 1
+
+def _aggregate(step_cls, n, step):
+    _check_n_step(n, step)
+    def _aggregate_xf(rf):
+        return step_cls(rf, n, step)
+    return _aggregate_xf
+
+def sum(n, step=1):
+    "Returns a transducer emitting the sum of the last n items, for every step items."
+    return _aggregate(_SumStep, n, step)
+
+def mean(n, step=1):
+    "Returns a transducer emitting the mean of the last n items, for every step items."
+    return _aggregate(_MeanStep, n, step)
+
+def min(n, step=1):
+    "Returns a transducer emitting the minimum of the last n items, for every step items."
+    return _aggregate(_MinStep, n, step)
+
+def max(n, step=1):
+    "Returns a transducer emitting the maximum of the last n items, for every step items."
+    return _aggregate(_MaxStep, n, step)
+
+class _TimeWindowStep(_Stage):
+    """
+    Tumbling (slide == size) and hopping windows [start, start + size),
+    start being a multiple of slide.  Open windows are kept in a dict by
+    start, their ends in a heap.
+    """
+    __slots__ = ('_key_ts', '_size', '_slide', '_lateness', '_watermark', '_open', '_ends')
+
+    def __init__(self, rf, key_ts, size, slide, lateness):
+        _Stage.__init__(self, rf)
+        self._key_ts = key_ts
+        self._size = size
+        self._slide = slide
+        self._lateness = lateness
+        self._watermark = None
+        self._open = {}
+        self._ends = []
+
+    def step(self, acc, x):
+        t = self._key_ts(x)
+        size, slide, watermark, open_ = self._size, self._slide, self._watermark, self._open
+        start = floor(t / slide) * slide
+        while start > t - size:
+            end = start + size
+            if watermark is None or end > watermark:    # else: late for this window
+                items = open_.get(start)
+                if items is None:
+                    items = open_[start] = []
+                    heappush(self._ends, (end, start))
+                items.append(x)
+            start -= slide
+
+        if watermark is None or t - self._lateness > watermark:
+            self._watermark = watermark = t - self._lateness
+            return self._emit_until(acc, watermark)
+        return acc
+
+    def _emit_until(self, acc, watermark):
+        ends, open_ = self._ends, self._open
+        while ends and (watermark is None or ends[0][0] <= watermark):
+            end, start = heappop(ends)
+            acc = self._rf_step(acc, (start, end, open_.pop(start)))
+            if is_reduced(acc):
+                open_.clear()                           # nothing more to emit
+                del ends[:]
+                break
+        return acc
+
+    def complete(self, acc):
+        return self._rf(unreduced(self._emit_until(acc, None)))
+
+class _SessionWindowStep(_Stage):
+    """
+    Session windows [first ts, last ts + gap); an item within gap of an
+    open session joins it, possibly merging sessions.  The (few) open
+    sessions are kept as [start, end, items] in a list, ordered by start.
+    """
+    __slots__ = ('_key_ts', '_gap', '_lateness', '_watermark', '_sessions')
+
+    def __init__(self, rf, key_ts, gap, lateness):
+        _Stage.__init__(self, rf)
+        self._key_ts = key_ts
+        self._gap = gap
+        self._lateness = lateness
+        self._watermark = None
+        self._sessions = []
+
+    def step(self, acc, x):
+        t = self._key_ts(x)
+        start, end, watermark = t, t + self._gap, self._watermark
+        sessions, keep, items = self._sessions, [], None
+        for session in sessions:
+            if session[0] < end and t < session[1]:     # overlaps: merge
+                start, end = builtins.min(start, session[0]), builtins.max(end, session[1])
+                items = session[2] if items is None else items + session[2]
+            else:
+                keep.append(session)
+        if items is None:
+            if watermark is not None and end <= watermark:
+                return acc                              # late
+            items = []
+        items.append(x)
+        keep.append([start, end, items])
+        keep.sort(key=_first)
+        self._sessions = keep
+
+        if watermark is None or t - self._lateness > watermark:
+            self._watermark = watermark = t - self._lateness
+            return self._emit_until(acc, watermark)
+        return acc
+
+    def _emit_until(self, acc, watermark):
+        sessions = self._sessions
+        while sessions:
+            closed = [s for s in sessions if watermark is None or s[1] <= watermark]
+            if not closed:
+                break
+            first_closed = builtins.min(closed, key=_second)
+            sessions.remove(first_closed)
+            acc = self._rf_step(acc, tuple(first_closed))
+            if is_reduced(acc):
+                del sessions[:]                         # nothing more to emit
+                break
+        return acc
+
+    def complete(self, acc):
+        return self._rf(unreduced(self._emit_until(acc, None)))
+
+def _first(s):
+    return s[0]
+
+def _second(s):
+    return s[1]
+
+def window_by_time(key_ts, size=None, slide=None, gap=None, allowed_lateness=0):
+    """
+    Returns a transducer grouping items by their timestamp key_ts(item)
+    (a number) into windows, emitted as (start, end, items) tuples with
+    the items in arrival order (when sessions merge, their lists of items
+    are concatenated):
+     - size:        tumbling windows [k*size, (k+1)*size);
+     - size, slide: hopping windows [k*slide, k*slide + size) - an item is
+                    in each window covering its timestamp;
+     - gap:         session windows - runs of items less than gap apart,
+                    [first timestamp, last timestamp + gap).
+
+    The watermark is the highest timestamp seen minus allowed_lateness.
+    A window is emitted - in order of end - once the watermark reaches its
+    end; items arriving after that for it (late items) are dropped.  Only
+    open windows are kept; these are flushed on completion.
+    """
+    if (size is None) == (gap is None):
+        raise ValueError("window_by_time needs either size or gap")
+    if allowed_lateness < 0:
+        raise ValueError("allowed_lateness must be >= 0 ({} given)".format(allowed_lateness))
+    if gap is not None:
+        if slide is not None:
+            raise ValueError("window_by_time: slide is not supported for session windows")
+        if gap <= 0:
+            raise ValueError("Session gap must be > 0 ({} given)".format(gap))
+        def _session_xf(rf):
+            return _SessionWindowStep(rf, key_ts, gap, allowed_lateness)
+        return _session_xf
+
+    slide = size if slide is None else slide
+    if size <= 0 or slide <= 0:
+        raise ValueError("Window size and slide must be > 0 ({}, {} given)".format(size, slide))
+    def _time_window_xf(rf):
+        return _TimeWindowStep(rf, key_ts, size, slide, allowed_lateness)
+    return _time_window_xf
@@ -39,6 +39,9 @@ setup(
     name='seecr-functools',
     version=version,
     packages=packages,
+    extras_require={
+        'numpy': ['numpy'],
+    },
     url='http://www.seecr.nl',
     author='Seecr',
     author_email='info@seecr.nl',
@@ -38,6 +38,14 @@ from seecr_test.functools.coretest import CoreTest
 from seecr_test.functools.wrangletest import WrangleTest
 from seecr_test.functools.stringtest import StringTest
 from seecr_test.functools.walktest import WalkTest
+from seecr_test.functools.vectorizedtest import VectorizedTest
+from seecr_test.functools.aiotest import AioTest
+from seecr_test.functools.channeltest import ChannelTest
+from seecr_test.functools.windowtest import WindowTest
+from seecr_test.functools.sorttest import SortTest
+from seecr_test.functools.iotest import IoTest
+from seecr_test.functools.instrumenttest import InstrumentTest
+from seecr_test.functools.latencytest import LatencyTest
 
 
 if __name__ == '__main__':
@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+## begin license ##
+#
+# Seecr Functools a set of various functional tools
+#
+# Copyright (C) 2026 Seecr (Seek You Too B.V.) https://seecr.nl
+#
+# This file is part of "Seecr Functools"
+#
+# "Seecr Functools" is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# "Seecr Functools" is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with "Seecr Functools"; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+## end license ##
+
+"""
+Benchmarks of the transducer engine against the equivalent itertools /
+builtin code.
+
+Reports per case ns/item and peak bytes allocated per item (traced with
+tracemalloc in a separate run) for seecr.functools and for the
+reference.  Timings are compared with the baseline (benchmarks.json next
+to this file) as the ratio to the reference, so they carry over between
+machines; a case is a regression when that ratio, or its bytes/item,
+exceeds the baseline by more than the threshold (in 3 measurements).
+
+    python3 _benchmarks.py [--quick] [--save] [--threshold 0.3] [case ...]
+
+Exits with 1 on a regression; --save writes the results as the baseline.
+"""
+
+from seecrdeps import includeParentAndDeps, cleanup     #DO_NOT_DISTRIBUTE
+includeParentAndDeps(__file__, scanForDeps=True)        #DO_NOT_DISTRIBUTE
+cleanup(__file__)                                       #DO_NOT_DISTRIBUTE
+
+from argparse import ArgumentParser
+from functools import reduce as builtin_reduce
+from itertools import chain, islice, repeat
+from json import dump, load
+from operator import add
+from os.path import dirname, isfile, join
+from timeit import Timer
+import builtins
+import sys
+import tracemalloc
+
+from seecr.functools.core import reduce, transduce, sequence, map, filter, take, drop, cat, interpose, comp, compile_xform, completing, append
+
+
+BASELINE = join(dirname(__file__), 'benchmarks.json')
+SIZES = [1000, 100000]
+DEPTHS = [1, 3, 6]
+
+builtin_map, builtin_filter = builtins.map, builtins.filter
+
+def inc(x):
+    return x + 1
+
+def is_odd(x):
+    return x % 2
+
+def _pipeline(depth):
+    "comp of depth alternating map(inc) and filter(is_odd) stages."
+    return comp(*[map(inc) if i % 2 == 0 else filter(is_odd) for i in range(depth)])
+
+def _reference_pipeline(depth, xs):
+    for i in range(depth):
+        xs = builtin_map(inc, xs) if i % 2 == 0 else builtin_filter(is_odd, xs)
+    return xs
+
+def cases(sizes, depths):
+    """
+    Yields (name, n, fn, reference); fn and reference take no arguments
+    and process n items.
+    """
+    for n in sizes:
+        xs = list(range(n))
+        xss = [list(range(10))] * (n // 10)
+        yield 'reduce', n, lambda: reduce(add, 0, xs), lambda: builtin_reduce(add, xs, 0)
+        yield 'transduce map', n, lambda: transduce(map(inc), completing(add), 0, xs), lambda: builtin_reduce(add, builtin_map(inc, xs), 0)
+        yield 'sequence map', n, lambda: list(sequence(map(inc), xs)), lambda: list(builtin_map(inc, xs))
+        yield 'sequence filter', n, lambda: list(sequence(filter(is_odd), xs)), lambda: list(builtin_filter(is_odd, xs))
+        yield 'sequence take', n, lambda: list(sequence(take(n // 2), xs)), lambda: list(islice(xs, n // 2))
+        yield 'sequence drop', n, lambda: list(sequence(drop(n // 2), xs)), lambda: list(islice(xs, n // 2, None))
+        yield 'sequence cat', n, lambda: list(sequence(cat, xss)), lambda: list(chain.from_iterable(xss))
+        yield 'sequence interpose', n, lambda: list(sequence(interpose(0), xs)), lambda: list(islice(chain.from_iterable(zip(repeat(0), xs)), 1, None))
+        inc3 = comp(inc, inc, inc)
+        yield 'comp', n, lambda: list(builtin_map(inc3, xs)), lambda: list(builtin_map(lambda x: inc(inc(inc(x))), xs))
+        for depth in depths:
+            xform = _pipeline(depth)
+            compiled = compile_xform(xform)
+            reference = lambda depth=depth: list(_reference_pipeline(depth, xs))
+            yield 'transduce depth {}'.format(depth), n, lambda xform=xform: transduce(xform, completing(append), [], xs), reference
+            yield 'transduce compiled depth {}'.format(depth), n, lambda compiled=compiled: transduce(compiled, completing(append), [], xs), reference
+            yield 'sequence depth {}'.format(depth), n, lambda xform=xform: list(sequence(xform, xs)), reference
+
+def ns_per_item(fns, n, repeat=7):
+    """
+    Best ns/item of each of fns; timed in turns, so that a slower period
+    of the machine affects all of them alike.
+    """
+    timers = [Timer(fn) for fn in fns]
+    numbers = [timer.autorange()[0] for timer in timers]
+    best = [float('inf')] * len(fns)
+    for _ in range(repeat):
+        for i, (timer, number) in enumerate(zip(timers, numbers)):
+            best[i] = min(best[i], timer.timeit(number) / number)
+    return [t / n * 1e9 for t in best]
+
+def bytes_per_item(fn, n):
+    "Peak bytes allocated (above the level before) per item."
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        fn()
+        return (tracemalloc.get_traced_memory()[1] - before) / n
+    finally:
+        tracemalloc.stop()
+
+def run(sizes, depths, selected=None, keys=None):
+    results = {}
+    for name, n, fn, reference in cases(sizes, depths):
+        key = '{} n={}'.format(name, n)
+        if selected and not any(s in name for s in selected) or keys is not None and key not in keys:
+            continue
+        ns, ref_ns = ns_per_item([fn, reference], n)
+        results[key] = {
+            'ns_per_item': ns,
+            'reference_ns_per_item': ref_ns,
+            'ratio': ns / ref_ns,
+            'bytes_per_item': bytes_per_item(fn, n),
+            'reference_bytes_per_item': bytes_per_item(reference, n),
+        }
+    return results
+
+def regressions(results, baseline, threshold):
+    "Yields (key, what, value, baseline value) for results worse than baseline beyond threshold."
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        if result['ratio'] > base['ratio'] * (1 + threshold):
+            yield key, 'ratio', result['ratio'], base['ratio']
+        if result['bytes_per_item'] > base['bytes_per_item'] * (1 + threshold) + 1:  # + 1: noise on (near) zero allocations
+            yield key, 'bytes_per_item', result['bytes_per_item'], base['bytes_per_item']
+
+def format_results(results):
+    lines = ['{:<36} {:>10} {:>10} {:>7} {:>10} {:>10}'.format('case', 'ns/item', 'ref', 'ratio', 'B/item', 'ref')]
+    for key, r in results.items():
+        lines.append('{:<36} {:>10.1f} {:>10.1f} {:>7.2f} {:>10.1f} {:>10.1f}'.format(
+            key, r['ns_per_item'], r['reference_ns_per_item'], r['ratio'], r['bytes_per_item'], r['reference_bytes_per_item']))
+    return '\n'.join(lines)
+
+def main(argv):
+    parser = ArgumentParser(description='Benchmarks of the transducer engine against itertools / builtins.')
+    parser.add_argument('cases', nargs='*', help='only run cases with one of these in their name')
+    parser.add_argument('--quick', action='store_true', help='small data sizes only')
+    parser.add_argument('--save', action='store_true', help='store the results as baseline')
+    parser.add_argument('--baseline', default=BASELINE)
+    parser.add_argument('--threshold', type=float, default=0.3, help='allowed relative regression (default: 0.3)')
+    args = parser.parse_args(argv)
+
+    results = run(SIZES[:1] if args.quick else SIZES, DEPTHS, selected=args.cases)
+    print(format_results(results))
+
+    baseline = {}
+    if isfile(args.baseline):
+        with open(args.baseline) as f:
+            baseline = load(f)
+    if args.save:
+        baseline.update(results)
+        with open(args.baseline, 'w') as f:
+            dump(baseline, f, indent=2, sort_keys=True)
+        return 0
+
+    found = list(regressions(results, baseline, args.threshold))
+    for _ in range(2):      # a regression must reproduce; not just be a slower moment of the machine
+        if not found:
+            break
+        suspects = {(key, what) for key, what, _, _ in found}
+        rerun = run(SIZES, DEPTHS, keys={key for key, _ in suspects})
+        found = [r for r in regressions(rerun, baseline, args.threshold) if r[:2] in suspects]
+    for key, what, value, base in found:
+        print('REGRESSION {}: {} {:.2f} (baseline {:.2f})'.format(key, what, value, base))
+    return 1 if found else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
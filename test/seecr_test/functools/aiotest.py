@@ -0,0 +1,175 @@
+## begin license ##
+#
+# Seecr Functools a set of various functional tools
+#
+# Copyright (C) 2026 Seecr (Seek You Too B.V.) https://seecr.nl
+#
+# This file is part of "Seecr Functools"
+#
+# "Seecr Functools" is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# "Seecr Functools" is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with "Seecr Functools"; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+## end license ##
+
+from unittest import TestCase
+
+import asyncio
+from warnings import catch_warnings, simplefilter
+
+from seecr.functools.core import comp, map, filter, take, drop, cat, mapcat, interpose, completing, reduced, ReducingFn
+from seecr.functools.aio import areduce, atransduce, asequence, amap
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+async def agen(coll, log=None):
+    try:
+        for x in coll:
+            await asyncio.sleep(0)
+            if log is not None:
+                log.append(x)
+            yield x
+    finally:
+        if log is not None:
+            log.append('closed')
+
+def _a(acc, e):
+    acc.append(e)
+    return acc
+
+async def a_a(acc, e):
+    await asyncio.sleep(0)
+    acc.append(e)
+    return acc
+
+async def a_inc(x):
+    await asyncio.sleep(0)
+    return x + 1
+
+
+class AioTest(TestCase):
+    def test_areduce(self):
+        add = lambda acc, e: acc + e
+        self.assertEqual(10, run(areduce(add, 0, agen([1, 2, 3, 4]))))
+        self.assertEqual(10, run(areduce(add, [1, 2, 3, 4])))
+        self.assertEqual(3, run(areduce(add, agen([1, 2]))))
+        self.assertEqual(1, run(areduce(add, agen([1]))))
+        self.assertEqual('x', run(areduce(lambda: 'x', agen([]))))
+        self.assertEqual('i', run(areduce(add, 'i', agen([]))))
+
+        # async f
+        async def a_add(acc, e):
+            await asyncio.sleep(0)
+            return acc + e
+        self.assertEqual(10, run(areduce(a_add, 0, agen([1, 2, 3, 4]))))
+        self.assertEqual(10, run(areduce(a_add, [1, 2, 3, 4])))
+
+        # reduced closes upstream
+        log = []
+        async def until_3(acc, e):
+            return reduced(acc + e) if e == 3 else acc + e
+        self.assertEqual(6, run(areduce(until_3, 0, agen(range(1, 100), log))))
+        self.assertEqual([1, 2, 3, 'closed'], log)
+
+        self.assertRaises(TypeError, lambda: run(areduce(add)))
+
+    def test_atransduce(self):
+        # sync transducers & rf, async source
+        self.assertEqual([11, 12], run(atransduce(comp(map(lambda x: x + 10), take(2)), completing(_a), [], agen([1, 2, 3]))))
+        # async rf
+        self.assertEqual([11, 12], run(atransduce(comp(map(lambda x: x + 10), take(2)), completing(a_a), [], agen([1, 2, 3]))))
+        self.assertEqual([2, 4], run(atransduce(comp(amap(a_inc), filter(lambda x: x % 2 == 0)), completing(_a), [], [1, 2, 3, 4])))
+
+        # async stages between sync (also stateful / expanding) stages
+        log = []
+        self.assertEqual([2, '-', 2, '-', 4, '-', 4], run(atransduce(
+            comp(drop(1), amap(a_inc), filter(lambda x: x % 2 == 0), map(lambda x: [x, x]), cat, interpose('-'), take(7), amap(lambda x: x)),
+            completing(a_a), [], agen(range(10), log))))
+        self.assertEqual([0, 1, 2, 3, 'closed'], log)
+
+        # reduced from async rf within cat
+        async def until_3(acc, e):
+            acc.append(e)
+            return reduced(acc) if len(acc) == 3 else acc
+        self.assertEqual([1, 2, 2], run(atransduce(comp(amap(a_inc), map(lambda x: [x] * x), cat), completing(until_3), [], range(10))))
+
+        # 3-arity: async init
+        class ARf(ReducingFn):
+            __slots__ = ()
+            async def init(self):
+                return ['init']
+            async def step(self, acc, x):
+                return acc + [x]
+            async def complete(self, acc):
+                return acc + ['done']
+        self.assertEqual(['init', 2, 3, 'done'], run(atransduce(amap(a_inc), ARf(), agen([1, 2]))))
+
+        # completion flushes through async stages
+        def flushing(rf):
+            buf = []
+            def _step(*a):
+                if len(a) == 2:
+                    buf.append(a[1])
+                    return a[0]
+                elif len(a) == 1:
+                    acc = a[0]
+                    for x in buf:
+                        acc = rf(acc, x)
+                    return rf(acc)
+                return rf()
+            return _step
+        self.assertEqual([2, 3], run(atransduce(comp(flushing, amap(a_inc)), completing(_a), [], [1, 2])))
+
+        self.assertRaises(TypeError, lambda: run(atransduce(amap(a_inc), completing(a_a))))
+
+    def test_asequence(self):
+        async def collect(agen):
+            return [x async for x in agen]
+
+        self.assertEqual([], run(collect(asequence(take(1), None))))
+        self.assertEqual([2, 3, 4], run(collect(asequence(amap(a_inc), agen([1, 2, 3])))))
+        self.assertEqual([2, '-', 3], run(collect(asequence(comp(amap(a_inc), interpose('-')), [1, 2]))))
+
+        log = []
+        self.assertEqual([1, 2], run(collect(asequence(take(2), agen(range(1, 10), log)))))
+        self.assertEqual([1, 2, 'closed'], log)
+
+        # closing the async generator closes the source
+        log = []
+        async def first_of():
+            s = asequence(amap(a_inc), agen(range(10), log))
+            x = await s.__anext__()
+            await s.aclose()
+            return x
+        self.assertEqual(1, run(first_of()))
+        self.assertEqual([0, 'closed'], log)
+
+    def test_expanding_stages_before_async_stage(self):
+        async def collect(agen):
+            return [x async for x in agen]
+
+        n = 5000
+        with catch_warnings():
+            simplefilter('error')   # e.g. coroutine never awaited
+            self.assertEqual(list(range(1, n + 1)), run(atransduce(comp(cat, amap(a_inc)), completing(_a), [], [list(range(n))])))
+            self.assertEqual(list(range(1, n + 1)), run(atransduce(comp(mapcat(range), amap(a_inc)), completing(a_a), [], [n])))
+            async def a_ident(x):
+                return x
+            self.assertEqual(2 * n - 1, len(run(collect(asequence(comp(cat, interpose('-'), amap(a_ident)), [[0] * n])))))
+            self.assertEqual([1, 2, 3], run(atransduce(comp(cat, amap(a_inc), take(3)), completing(_a), [], [range(n)])))
+
+    def test_amap_only_in_async_pipelines(self):
+        from seecr.functools.core import transduce
+        self.assertRaises(TypeError, lambda: transduce(amap(a_inc), completing(_a), [], [1]))
@@ -0,0 +1,224 @@
+## begin license ##
+#
+# Seecr Functools a set of various functional tools
+#
+# Copyright (C) 2026 Seecr (Seek You Too B.V.) https://seecr.nl
+#
+# This file is part of "Seecr Functools"
+#
+# "Seecr Functools" is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# "Seecr Functools" is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with "Seecr Functools"; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+## end license ##
+
+from unittest import TestCase
+
+import asyncio
+
+from seecr.functools.core import comp, map, filter, take, cat
+from seecr.functools.aio import amap
+from seecr.functools.channel import Channel, buffer, dropping_buffer, sliding_buffer, pipe, merge, pipeline
+
+
+def run(coro):
+    return asyncio.run(asyncio.wait_for(coro, 5))
+
+async def drain(ch):
+    return [x async for x in ch]
+
+async def put_all(ch, xs, close=True):
+    for x in xs:
+        await ch.put(x)
+    if close:
+        ch.close()
+
+
+class ChannelTest(TestCase):
+    def test_put_take(self):
+        async def t():
+            ch = Channel(2)
+            self.assertEqual(True, await ch.put('a'))
+            self.assertEqual(True, await ch.put('b'))
+            self.assertEqual('a', await ch.take())
+            ch.close()
+            self.assertEqual(True, ch.closed)
+            self.assertEqual(False, await ch.put('c'))
+            self.assertEqual('b', await ch.take())
+            self.assertEqual(None, await ch.take())
+            self.assertEqual(None, await ch.take())
+            with self.assertRaises(ValueError):
+                await Channel().put(None)
+        run(t())
+
+    def test_fixed_buffer_backpressure(self):
+        async def t():
+            log = []
+            ch = Channel(buffer(2))
+            async def producer():
+                for x in range(5):
+                    await ch.put(x)
+                    log.append(('put', x))
+                ch.close()
+            task = asyncio.ensure_future(producer())
+            await asyncio.sleep(0.01)
+            self.assertEqual([('put', 0), ('put', 1)], log)   # waiting: buffer full
+            self.assertEqual(0, await ch.take())
+            await asyncio.sleep(0.01)
+            self.assertEqual([('put', 0), ('put', 1), ('put', 2)], log)
+            self.assertEqual([1, 2, 3, 4], await drain(ch))
+            await task
+        run(t())
+
+    def test_dropping_and_sliding(self):
+        async def t():
+            ch = Channel(dropping_buffer(2))
+            await put_all(ch, [1, 2, 3, 4])
+            self.assertEqual([1, 2], await drain(ch))
+
+            ch = Channel(sliding_buffer(2))
+            await put_all(ch, [1, 2, 3, 4])
+            self.assertEqual([3, 4], await drain(ch))
+        run(t())
+        self.assertRaises(ValueError, lambda: buffer(0))
+
+    def test_xform(self):
+        async def t():
+            ch = Channel(10, comp(filter(lambda x: x % 2), map(lambda x: [x] * 2), cat))
+            await put_all(ch, [1, 2, 3])
+            self.assertEqual([1, 1, 3, 3], await drain(ch))
+
+            # reduced closes the channel
+            ch = Channel(10, take(2))
+            self.assertEqual(True, await ch.put(1))
+            self.assertEqual(True, await ch.put(2))
+            self.assertEqual(True, ch.closed)
+            self.assertEqual(False, await ch.put(3))
+            self.assertEqual([1, 2], await drain(ch))
+
+            # completion on close
+            def flush_on_close(rf):
+                def _step(*a):
+                    if len(a) == 1:
+                        rf(a[0], 'flushed')
+                    return rf(*a)
+                return _step
+            ch = Channel(1, flush_on_close)
+            await put_all(ch, [])
+            self.assertEqual(['flushed'], await drain(ch))
+        run(t())
+
+    def test_pipe_merge(self):
+        async def t():
+            a, b = Channel(), Channel(3)
+            self.assertTrue(pipe(a, b) is b)
+            asyncio.ensure_future(put_all(a, [1, 2, 3]))
+            self.assertEqual([1, 2, 3], await drain(b))
+            self.assertEqual(True, b.closed)
+
+            a, b = Channel(), Channel()
+            asyncio.ensure_future(put_all(a, [1, 2, 3]))
+            asyncio.ensure_future(put_all(b, ['x', 'y']))
+            self.assertEqual([1, 2, 3, 'x', 'y'], sorted(await drain(merge([a, b])), key=str))
+
+            self.assertEqual([], await drain(merge([])))
+        run(t())
+
+    def test_pipeline(self):
+        async def t():
+            in_progress = [0, 0]
+            async def slow_inc(x):
+                in_progress[0] += 1
+                in_progress[1] = max(in_progress)
+                await asyncio.sleep(0.001 * (5 - x % 5))
+                in_progress[0] -= 1
+                return x + 1
+
+            src, dst = Channel(), Channel(2)
+            self.assertTrue(pipeline(3, dst, comp(amap(slow_inc), map(lambda x: [x, -x]), cat), src) is dst)
+            asyncio.ensure_future(put_all(src, range(10)))
+            self.assertEqual([y for x in range(1, 11) for y in [x, -x]], await drain(dst))
+            self.assertTrue(1 < in_progress[1] <= 5, in_progress)
+
+            # expanding xf before an async stage
+            src, dst = Channel(), Channel(10000)
+            async def a_inc(x):
+                await asyncio.sleep(0)
+                return x + 1
+            pipeline(2, dst, comp(map(range), cat, amap(a_inc)), src)
+            await put_all(src, [3000])
+            self.assertEqual(list(range(1, 3001)), await drain(dst))
+
+            # stateful xf applied to each item separately
+            src, dst = Channel(), Channel(100)
+            pipeline(2, dst, comp(map(lambda x: [x] * 3), cat, take(2)), src)
+            await put_all(src, [1, 2])
+            self.assertEqual([1, 1, 2, 2], await drain(dst))
+
+            # to closed early
+            src, dst = Channel(), Channel(1)
+            pipeline(2, dst, map(lambda x: x), src, close=False)
+            asyncio.ensure_future(put_all(src, range(100)))
+            self.assertEqual(0, await dst.take())
+            dst.close()
+            await asyncio.sleep(0.01)
+        run(t())
+
+    def test_pipeline_exception(self):
+        def boom(x):
+            if x == 2:
+                raise ValueError(x)
+            return x
+        async def t():
+            src, dst = Channel(), Channel(10)
+            pipeline(2, dst, map(boom), src)
+            asyncio.ensure_future(put_all(src, range(4)))
+            with self.assertLogs('seecr.functools.channel', level='ERROR') as logs:
+                self.assertEqual([0, 1, 3], await drain(dst))
+            self.assertEqual(1, len(logs.output))
+            self.assertTrue('ValueError: 2' in logs.output[0])
+
+            errors = []
+            def ex_handler(e):
+                errors.append(e)
+                return 'error'
+            src, dst = Channel(), Channel(10)
+            pipeline(2, dst, map(boom), src, ex_handler=ex_handler)
+            asyncio.ensure_future(put_all(src, range(4)))
+            self.assertEqual([0, 1, 'error', 3], await drain(dst))
+            self.assertEqual(['2'], [str(e) for e in errors])
+
+            # to's xform raising: writing stops, to is closed all the same
+            src, dst = Channel(), Channel(10, xform=map(boom))
+            pipeline(2, dst, map(lambda x: x), src)
+            asyncio.ensure_future(put_all(src, range(4)))
+            with self.assertLogs('seecr.functools.channel', level='ERROR') as logs:
+                self.assertEqual([0, 1], await drain(dst))
+                await asyncio.sleep(0)  # task's done callbacks
+            self.assertTrue('ValueError: 2' in logs.output[0])
+        run(t())
+
+    def test_pipe_exception(self):
+        def boom(x):
+            if x == 2:
+                raise ValueError(x)
+            return x
+        async def t():
+            a, b = Channel(), Channel(3, xform=map(boom))
+            pipe(a, b)
+            asyncio.ensure_future(put_all(a, [1, 2, 3]))
+            with self.assertLogs('seecr.functools.channel', level='ERROR') as logs:
+                self.assertEqual([1], await drain(b))
+                await asyncio.sleep(0)  # task's done callbacks
+            self.assertTrue('ValueError: 2' in logs.output[0])
+        run(t())
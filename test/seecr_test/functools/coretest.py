@@ -28,10 +28,16 @@ import builtins
 
 from unittest import TestCase
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy, copy
+from itertools import islice
+from random import random
+from threading import Lock
+from time import sleep
 from types import GeneratorType
 
-from seecr.functools.core import first, second, identity, some_thread, fpartial, comp, reduce, is_reduced, ensure_reduced, unreduced, reduced, completing, transduce, take, cat, map, run, filter, complement, remove, juxt, truthy, append, strng, trampoline, thrush, constantly, before, after, interpose, interleave, assoc_in, update_in, assoc, assoc_in_when, sequence, get_in, assoc_when, update_in_when, iterate, last, any_fn, drop, get, merge, merge_with
+from seecr.functools.core import first, second, identity, some_thread, fpartial, comp, reduce, is_reduced, ensure_reduced, unreduced, reduced, completing, transduce, take, cat, map, run, filter, complement, remove, juxt, truthy, append, strng, trampoline, thrush, constantly, before, after, interpose, interleave, assoc_in, update_in, assoc, assoc_in_when, sequence, get_in, assoc_when, update_in_when, iterate, last, any_fn, drop, get, merge, merge_with, compile_xform, ReducingFn, reducing_fn, transduce_chunked, fold, pmap, eduction, partition_all, partition_by, dedupe, distinct, keep, mapcat, take_while, drop_while, take_nth, random_sample, into, group_by, frequencies, reduce_by_key
 from seecr.functools.string import strip, split
 
 builtin_next = builtins.next
@@ -574,6 +580,45 @@ class CoreTest(TestCase):
         self.assertEqual([1, 2, None], append([1, 2], None))
         self.assertEqual([1, 2, None, None], append([1, 2], None, None))
 
+    def test_into(self):
+        self.assertEqual([], into())
+        self.assertEqual([], into(None))
+        to = [1]
+        self.assertTrue(to is into(to))
+        self.assertTrue(to is into(to, [2, 3]))
+        self.assertEqual([1, 2, 3], to)
+        self.assertEqual([1, 2], into(None, (x for x in [1, 2])))
+        self.assertEqual([1], into([1], None))
+        self.assertEqual([1], into([1], map(lambda x: x + 1), None))
+
+        self.assertEqual({1, 2}, into({1}, [1, 2, 2]))
+        self.assertEqual({'a': 1, 'b': 3}, into({'a': 1, 'b': 2}, [('b', 3)]))
+        self.assertEqual({'a': 1, 'b': 3}, into({'a': 1}, {'b': 3}))
+        self.assertEqual(deque([0, 1, 2]), into(deque([0]), [1, 2]))
+
+        # with xform
+        self.assertEqual([2, 4], into([], comp(map(lambda x: x + 1), filter(lambda x: x % 2 == 0)), [1, 2, 3, 4]))
+        self.assertEqual([2, 3], into([], comp(map(lambda x: x + 1), take(2)), log_iter([], [1, 2, 3, 4])))
+        self.assertEqual({'a': 0, 'b': 1}, into({}, map(reversed), [(0, 'a'), (1, 'b')]))
+        self.assertEqual({1, 2}, into(set(), comp(cat, distinct()), [[1, 2], [2, 1]]))
+        self.assertEqual([[1, 2], [3]], into([], partition_all(2), [1, 2, 3]))
+
+        # stops consuming when the xform is done
+        _log = []
+        self.assertEqual([1], into([], take(1), log_iter(_log, [1, 2, 3])))
+        self.assertEqual([1], _log)
+
+        # other targets: append per item
+        class Appender(object):
+            def __init__(self):
+                self.items = []
+            def append(self, x):
+                self.items.append(x)
+        self.assertEqual([1, 2], into(Appender(), [1, 2]).items)
+        self.assertEqual([1, 2], append(Appender(), 1, 2).items)
+        self.assertRaises(AttributeError, lambda: into(object(), [1]))
+        self.assertRaises(TypeError, lambda: into([], map(lambda x: x + 1), [1], [2]))
+
     def test_strng(self):
         class A(object):
             def __str__(self):
@@ -785,6 +830,63 @@ class CoreTest(TestCase):
         self.assertRaises(TypeError, lambda: reduce(lambda:None)) # Too few
         self.assertRaises(TypeError, lambda: reduce(lambda:None, 1, [2], 'drie')) # Too many
 
+    def test_fold(self):
+        self.assertEqual(sum(range(10000)), fold(100, plus, plus, range(10000), workers=2))
+        self.assertEqual(sum(range(10000)), fold(plus, range(10000), workers=2))
+        self.assertEqual(sum(range(10000)), fold(plus, plus, range(10000), workers=2))
+
+        # combinef distinct from reducef (combinef() as initial value of each partition)
+        self.assertEqual({'a': 2000, 'b': 1000}, fold(250, merge_counts, count_into, ['a', 'b', 'a'] * 1000, workers=2))
+
+        # small coll -> reduced in-process
+        self.assertEqual(0, fold(plus, []))
+        self.assertEqual(45, fold(plus, (i for i in range(10))))
+        self.assertEqual({'x': 1}, fold(merge_counts, lambda acc, x: count_into(acc, x), ['x'])) # lambda not picklable, but not needed
+
+        # reduced: no further partitions combined.
+        self.assertEqual(sum(range(101)), fold(10, plus, sum_until_100, range(10000), workers=2))
+
+        # Other executor
+        with ThreadPoolExecutor(2) as executor:
+            self.assertEqual(sum(range(1000)), fold(10, plus, lambda acc, x: acc + x, range(1000), executor=executor))
+            self.assertEqual(sum(range(101)), fold(10, plus, sum_until_100, log_iter([], range(10000)), executor=executor))
+
+        self.assertRaises(TypeError, lambda: fold(plus))
+        self.assertRaises(TypeError, lambda: fold(1, plus, plus, [], 'x'))
+
+    def test_group_by(self):
+        self.assertEqual({}, group_by(len, []))
+        self.assertEqual({1: ['a', 'c'], 2: ['bb']}, group_by(len, ['a', 'bb', 'c']))
+        self.assertEqual([1, 2], l(group_by(len, ['a', 'bb', 'c']))) # keys in order of appearance
+
+        words = ['a', 'bb', 'c', 'ddd', 'ee'] * 500
+        expected = group_by(len, words)
+        self.assertEqual(expected, group_by(len, words, parallel=True, n=100, workers=2))
+        with ThreadPoolExecutor(2) as executor:
+            self.assertEqual(expected, group_by(lambda w: len(w), iter(words), parallel=True, n=7, executor=executor))
+        self.assertEqual({}, group_by(len, [], parallel=True))
+
+    def test_frequencies(self):
+        self.assertEqual({}, frequencies([]))
+        self.assertEqual({'a': 2, 'b': 1}, frequencies('aba'))
+        self.assertEqual({'a': 2000, 'b': 1000}, frequencies(['a', 'b', 'a'] * 1000, parallel=True, n=250, workers=2))
+
+    def test_reduce_by_key(self):
+        self.assertEqual({}, reduce_by_key(len, plus, 0, []))
+        self.assertEqual({1: 'ac', 2: 'bb'}, reduce_by_key(len, plus, '', ['a', 'bb', 'c']))
+        self.assertEqual({1: 6, 0: 4}, reduce_by_key(lambda x: x % 2, reducing_fn(plus), 0, [1, 2, 2, 5]))
+
+        # reduced ends only the reduction of its key
+        self.assertEqual({0: 56, 1: 64}, reduce_by_key(lambda x: x % 2, lambda acc, x: reduced(acc) if acc >= 50 else acc + x, 0, range(100)))
+
+        # parallel; combinef distinct from rf
+        self.assertEqual(
+            {'a': {'a': 2000}, 'b': {'b': 1000}},
+            reduce_by_key(identity, count_into_new, {}, ['a', 'b', 'a'] * 1000, combinef=merge_counts, parallel=True, n=250, workers=2))
+        self.assertEqual(
+            reduce_by_key(is_even, plus, 0, range(1000)),
+            reduce_by_key(is_even, plus, 0, range(1000), parallel=True, n=10, workers=2))
+
     def testRun(self):
         log = []
         f = lambda i: log.append(i)
@@ -869,6 +971,157 @@ class CoreTest(TestCase):
             ),
             completing(_a), [], [1, 2, 3, 4, 5]))
 
+    def test_compile_xform(self):
+        def _a(acc, e):
+            acc.append(e)
+            return acc
+        rf = completing(_a)
+        plus10 = lambda x: x + 10
+        odd = lambda x: (x % 2) == 1
+
+        # Not fusable -> xform itself (generic path)
+        def user_xf(rf):
+            return rf
+        self.assertTrue(compile_xform(user_xf) is user_xf)
+        xform = comp(map(plus10), user_xf)
+        self.assertTrue(compile_xform(xform) is xform)
+
+        # Fusable -> same results as the generic path
+        def assert_fused(xform_fn, coll):
+            expected = transduce(xform_fn(), rf, [], coll)
+            xform = compile_xform(xform_fn())
+            self.assertEqual(expected, transduce(xform, rf, [], coll))
+            self.assertEqual(expected, transduce(xform, rf, [], coll)) # stateful stages re-initialized per run
+
+        for coll in [[], [1], [1, 2, 3, 4, 5, 6, 7]]:
+            assert_fused(lambda: identity, coll)
+            assert_fused(lambda: map(plus10), coll)
+            assert_fused(lambda: comp(map(plus10), filter(odd)), coll)
+            assert_fused(lambda: comp(remove(odd), interpose('-'), take(4)), coll)
+            assert_fused(lambda: comp(take(0)), coll)
+            assert_fused(lambda: comp(drop(2), map(lambda x: [x, x]), cat, take(5)), coll)
+            assert_fused(lambda: comp(map(lambda x: [[x], [], [x + 1]]), cat, cat, interpose('~'), drop(1)), coll)
+
+        # reduced from the reducing function honoured
+        self.assertEqual([11, 12], transduce(
+            compile_xform(comp(map(plus10), identity)),
+            completing(lambda acc, e: reduced(_a(acc, e)) if e == 12 else _a(acc, e)), [], [1, 2, 3]))
+
+        # Cached by xform identity
+        xform = comp(map(plus10), take(2))
+        self.assertTrue(compile_xform(xform).fused_reduce is compile_xform(xform).fused_reduce)
+        compiled = compile_xform(xform)
+        self.assertTrue(compile_xform(compiled) is compiled)
+
+        # Still usable as an ordinary transducer
+        self.assertEqual([11, 12], list(sequence(compiled, [1, 2, 3])))
+
+    def test_reducing_fn(self):
+        class Summing(ReducingFn):
+            __slots__ = ('log',)
+            def __init__(self):
+                self.log = []
+            def init(self):
+                self.log.append('init')
+                return 0
+            def step(self, acc, x):
+                self.log.append(x)
+                return reduced(acc + x) if x == 'stop' else acc + x
+            def complete(self, acc):
+                self.log.append('complete')
+                return -acc
+
+        # Callable with 0, 1 and 2 arguments
+        rf = Summing()
+        self.assertEqual(0, rf())
+        self.assertEqual(3, rf(1, 2))
+        self.assertEqual(-3, rf(3))
+        self.assertEqual(['init', 2, 'complete'], rf.log)
+        self.assertRaises(TypeError, lambda: rf(1, 2, 3))
+
+        # reduce / transduce
+        rf = Summing()
+        self.assertEqual(6, reduce(rf, 0, [1, 2, 3]))
+        self.assertEqual(6, reduce(rf, [1, 2, 3]))
+        self.assertEqual([1, 2, 3, 2, 3], rf.log)
+        rf = Summing()
+        self.assertEqual(-12, transduce(map(lambda x: x * 2), rf, [1, 2, 3]))
+        self.assertEqual(['init', 2, 4, 6, 'complete'], rf.log)
+
+        # Closure-style transducers and reducing fns mixed with ReducingFn steps
+        def closure_xf(rf):
+            def _step(*a):
+                if len(a) == 2:
+                    return rf(a[0], a[1] + 1)
+                return rf(*a)
+            return _step
+        rf = Summing()
+        self.assertEqual(-7, transduce(comp(closure_xf, take(2), closure_xf), rf, [1, 2, 3]))
+        self.assertEqual(['init', 3, 4, 'complete'], rf.log)
+        self.assertEqual([2, 3], list(sequence(comp(take(2), closure_xf), [1, 2, 3])))
+
+        # reducing_fn adapts closure-style reducing fns
+        f = reducing_fn(completing(lambda acc, x: acc + x, lambda acc: acc * 10))
+        self.assertTrue(f is reducing_fn(f))
+        f = reducing_fn(closure_xf(completing(lambda acc, x: acc + x, lambda acc: acc * 10)))
+        self.assertTrue(isinstance(f, ReducingFn))
+        self.assertEqual(5, f.step(2, 2))
+        self.assertEqual(20, f.complete(2))
+        self.assertEqual(5, reduce(f, 0, [1, 2]))
+
+    def test_transduce_chunked(self):
+        def _a(acc, e):
+            acc.append(e)
+            return acc
+        rf = completing(_a)
+
+        class ChunkLog(ReducingFn):
+            __slots__ = ('log',)
+            def __init__(self):
+                self.log = []
+            def init(self):
+                return []
+            def step(self, acc, x):
+                self.log.append(x)
+                return _a(acc, x)
+            def step_chunk(self, acc, xs):
+                self.log.append(xs)
+                acc.extend(xs)
+                return acc
+
+        # Chunks handed on as a whole by chunk-aware stages
+        f = ChunkLog()
+        self.assertEqual([2, 4, 6, 8], transduce_chunked(comp(map(lambda x: x * 2), filter(lambda x: x < 10)), f, range(1, 7), chunk_size=4))
+        self.assertEqual([[2, 4, 6, 8], []], f.log)
+
+        # Stages without chunk support: per item
+        f = ChunkLog()
+        self.assertEqual([1, '-', 2, '-', 3], transduce_chunked(interpose('-'), f, [], [1, 2, 3], chunk_size=2))
+        self.assertEqual([1, '-', 2, '-', 3], f.log)
+
+        # Same results as transduce
+        for xform_fn in [
+                lambda: identity,
+                lambda: comp(map(lambda x: x + 1), remove(lambda x: x % 3 == 0)),
+                lambda: comp(drop(3), map(lambda x: [x, x]), cat, take(7)),
+                lambda: comp(take(0)),
+                lambda: comp(take(4), interpose('-'), drop(1)),
+        ]:
+            for coll in [[], [1], list(range(20))]:
+                expected = transduce(xform_fn(), rf, [], coll)
+                for chunk_size in [1, 2, 3, 100]:
+                    self.assertEqual(expected, transduce_chunked(xform_fn(), rf, [], coll, chunk_size=chunk_size))
+
+        # Early termination: no chunks realized after reduced
+        _log = []
+        self.assertEqual([1, 2, 3], transduce_chunked(take(3), rf, [], log_iter(_log, range(1, 100)), chunk_size=2))
+        self.assertEqual([1, 2, 3, 4], _log)
+        _log = []
+        self.assertEqual([1, 2], transduce_chunked(identity, completing(lambda acc, e: reduced(acc) if e == 3 else _a(acc, e)), [], log_iter(_log, range(1, 100)), chunk_size=4))
+        self.assertEqual([1, 2, 3, 4], _log)
+
+        self.assertRaises(TypeError, lambda: transduce_chunked(identity, rf))
+
     def test_map_xf(self):
         # 0-arity
         called = []
@@ -924,6 +1177,47 @@ class CoreTest(TestCase):
         self.assertEqual([12, 13, 14, 15], l(list(map(plus, [1, 2, 3, 4], [4, 3, 2, 1], [7, 8, 9, 10]))))
         self.assertEqual([12, 13, 14, 15], l(list(map(plus, [1, 2, 3, 4], [4, 3, 2, 1, 'x', object()], [7, 8, 9, 10, None, None]))))
 
+    def test_pmap(self):
+        lock = Lock()
+        in_flight = [0, 0] # current, max
+        def slow_inc(x):
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight)
+            sleep(random() / 1000)
+            with lock:
+                in_flight[0] -= 1
+            return x + 1
+
+        # coll
+        self.assertEqual(list(range(1, 101)), list(pmap(slow_inc, range(100), workers=8)))
+        self.assertEqual([], list(pmap(raiser, [])))
+        self.assertEqual(GeneratorType, type(pmap(slow_inc, [])))
+
+        # bounded: at most window items of coll realized ahead of the results
+        _log = []
+        s = pmap(slow_inc, log_iter(_log, iterate(lambda x: x + 1, 0)), workers=2, window=3)
+        self.assertEqual([1, 2, 3], [next(s), next(s), next(s)])
+        self.assertEqual(list(range(5)), _log)
+        s.close()
+        self.assertTrue(in_flight[1] <= 8)
+
+        # transducer
+        def _a(acc, e):
+            acc.append(e)
+            return acc
+        self.assertEqual(list(range(1, 51)), transduce(pmap(slow_inc, workers=4, window=5), completing(_a), [], range(50)))
+        self.assertEqual([3, 5], transduce(comp(filter(lambda x: x % 2), pmap(slow_inc, window=2), map(lambda x: x + 1), take(2)), completing(_a), [], range(100)))
+        self.assertEqual([1, 2], transduce(comp(take(2), pmap(slow_inc)), completing(_a), [], range(100)))
+        self.assertEqual([], transduce(pmap(raiser), completing(_a), [], []))
+
+        _log = []
+        self.assertEqual([1, 2, 3, 4], list(sequence(comp(pmap(slow_inc, window=2), take(4)), log_iter(_log, range(100)))))
+        self.assertEqual([0, 1, 2, 3, 4], _log)
+
+        self.assertRaises(TypeError, lambda: pmap())
+        self.assertRaises(TypeError, lambda: pmap(slow_inc, [], []))
+
     def test_filter_xf(self):
         assert_tx_default_0_1_arities(filter(raiser))
         assert_tx_default_bad_arity(filter(raiser))
@@ -958,6 +1252,39 @@ class CoreTest(TestCase):
         # with transduce
         self.assertEqual(4, transduce(remove(lambda x: (x % 2) == 0), completing(lambda acc, e: acc + e), 0, [1, 2, 3, 4]))
 
+    def test_reduce_protocol(self):
+        calls = []
+        class Countdown(object):
+            def __init__(self, n):
+                self.n = n
+            def __iter__(self):
+                raise AssertionError('not iterated')
+            def __seecr_reduce__(self, f, acc):
+                calls.append(acc)
+                for x in range(self.n, 0, -1):
+                    acc = f(acc, x)
+                    if is_reduced(acc):
+                        return acc
+                return acc
+
+        plus = lambda a, b: a + b
+        self.assertEqual(6, reduce(plus, 0, Countdown(3)))
+        self.assertEqual([0], calls)
+        self.assertEqual(5, reduce(lambda acc, x: reduced(acc + x) if x == 2 else acc + x, 0, Countdown(3)))
+        self.assertEqual([3, 2, 1, 'done'], transduce(identity, completing(append, lambda acc: acc + ['done']), [], Countdown(3)))
+        self.assertEqual([30, 20], transduce(compile_xform(comp(map(lambda x: x * 10), take(2))), completing(append), [], Countdown(3)))
+        self.assertEqual([[3, 2], [1]], transduce(partition_all(2), completing(append), [], Countdown(3)))
+
+        # iterate: self-reducing and still an iterator
+        i = iterate(lambda x: x + 1, 0)
+        self.assertEqual(10, reduce(lambda acc, x: reduced(acc) if x == 5 else acc + x, 0, i))
+        self.assertEqual(6, next(i))
+        self.assertEqual(15, reduce(lambda acc, x: reduced(acc + x) if x == 8 else acc + x, i))
+        self.assertEqual(9, next(i))
+        self.assertEqual([1, 2, 4], transduce(take(3), completing(append), [], iterate(lambda x: x * 2, 1)))
+        self.assertEqual([1, 2, 4], l(sequence(take(3), iterate(lambda x: x * 2, 1))))
+        self.assertEqual([0, 1], l(islice(iterate(lambda x: x + 1, 0), 2)))
+
     def test_iterate(self):
         i = iterate(lambda s: s+'x', '')
         self.assertEqual('', next(i))
@@ -1458,6 +1785,191 @@ class CoreTest(TestCase):
         assert_sqnc([(1, [1]), (2, [2]), ('parrr', []), ('ty!', []), ('s-done', [])], comp(take(2), party), g_n_fn())
 
 
+    def test_sequence_streaming(self):
+        _log = []
+        def log():
+            l = _log[:]
+            del _log[:]
+            return l
+
+        # Outputs of an expanding stage yielded as produced, not per input.
+        s = sequence(comp(map(lambda n: log_iter(_log, range(n))), cat, map(lambda x: x * 10)), [1000000])
+        self.assertEqual([0, 10], [next(s), next(s)])
+        self.assertEqual([0, 1], log())
+
+        # Also with non-fusable stages in between
+        def twice(rf):
+            def _step(*a):
+                if len(a) == 2:
+                    result = rf(a[0], a[1])
+                    return result if is_reduced(result) else rf(result, a[1])
+                return rf(*a)
+            return _step
+        s = sequence(comp(cat, twice, interpose('-'), twice, take(5)), log_iter(_log, [[1, 2], [3]]))
+        self.assertEqual(GeneratorType, type(s))
+        self.assertEqual([1, 1], [next(s), next(s)])
+        self.assertEqual([[1, 2]], log())
+        self.assertEqual(['-', '-', 1], l(s))
+        self.assertEqual([], log())
+
+        # Multiple colls
+        self.assertEqual([11, 22], l(sequence(map(lambda x, y: x + y), [1, 2, 3], [10, 20])))
+        self.assertEqual([11, 22], l(sequence(comp(map(lambda x, y: x + y), identity), [1, 2, 3], [10, 20])))
+        self.assertEqual(['1a', '1a', '2b', '2b'], l(sequence(comp(map(strng), twice), [1, 2], 'ab')))
+        self.assertEqual([(1, 'a'), (2, 'b')], l(sequence(identity, [1, 2], 'ab')))
+        self.assertEqual([], l(sequence(map(strng), [1, 2], None)))
+        self.assertRaises(TypeError, lambda: l(sequence(filter(truthy), [1, 2], [3, 4])))
+        self.assertRaises(TypeError, lambda: sequence())
+
+    def test_eduction(self):
+        def _a(acc, e):
+            acc.append(e)
+            return acc
+
+        coll = [1, 2, 3, 4, 5]
+        e = eduction(filter(lambda x: x % 2), map(lambda x: x * 10), coll)
+        self.assertEqual([10, 30, 50], l(e))
+        self.assertEqual([10, 30, 50], l(e)) # re-iterable
+        self.assertEqual(90, reduce(lambda acc, x: acc + x, 0, e))
+        self.assertEqual(90, reduce(lambda acc, x: acc + x, e))
+        self.assertEqual([30, 50], transduce(drop(1), completing(_a), [], e))
+        self.assertEqual(40, reduce(lambda acc, x: reduced(acc + x) if x == 30 else acc + x, 0, e))
+        self.assertEqual([10, 30, 'done'], transduce(take(2), completing(_a, lambda acc: acc + ['done']), [], e))
+
+        # reduce: no generator in between (fused)
+        e = eduction(map(lambda x: x + 1), take(2), coll)
+        self.assertEqual([2, 3], reduce(_a, [], e))
+
+        # non-fusable stages: completion of the stages, not of f
+        def party(rf):
+            def _step(*a):
+                if len(a) == 1:
+                    return rf(rf(a[0], 'party!'))
+                return rf(*a)
+            return _step
+        e = eduction(comp(take(2), party), coll)
+        self.assertEqual([1, 2, 'party!'], reduce(completing(_a, raiser), [], e))
+        self.assertEqual([1, 2, 'party!'], l(e))
+
+        self.assertRaises(TypeError, lambda: eduction(coll))
+
+    def test_partition_all(self):
+        def _a(acc, e):
+            acc.append(e)
+            return acc
+
+        self.assertEqual([], l(partition_all(2, [])))
+        self.assertEqual([[1, 2], [3, 4], [5]], l(partition_all(2, [1, 2, 3, 4, 5])))
+        self.assertEqual([[1, 2, 3]], l(partition_all(5, [1, 2, 3])))
+        self.assertEqual([[1, 2], [3, 4], [5]], transduce(partition_all(2), completing(_a), [], [1, 2, 3, 4, 5]))
+        self.assertEqual([[1, 2], [3, 4]], transduce(partition_all(2), completing(_a), [], [1, 2, 3, 4]))
+        self.assertEqual([[0, 1, 2], [3, 4]], l(sequence(comp(take(5), partition_all(3)), range(10))))
+        self.assertEqual([[0, 1, 2]], l(sequence(comp(partition_all(3), take(1)), range(10))))
+        self.assertEqual([[0, 1, 2], [3, 4, 5], [6]], transduce_chunked(partition_all(3), completing(_a), [], range(7), chunk_size=2))
+        self.assertEqual([[1, 2]], transduce_chunked(partition_all(2), completing(lambda acc, x: reduced(acc + [x])), [], [1, 2, 3, 4, 5], chunk_size=5))
+        self.assertRaises(ValueError, lambda: partition_all(0))
+        self.assertRaises(TypeError, lambda: partition_all())
+
+    def test_partition_by(self):
+        def _a(acc, e):
+            acc.append(e)
+            return acc
+
+        odd = lambda x: x % 2
+        self.assertEqual([], l(partition_by(odd, [])))
+        self.assertEqual([[1], [2, 4], [5, 7]], l(partition_by(odd, [1, 2, 4, 5, 7])))
+        self.assertEqual([[1], [2, 4], [5, 7]], transduce(partition_by(odd), completing(_a), [], [1, 2, 4, 5, 7]))
+        self.assertEqual([[1], [2, 4]], l(sequence(comp(partition_by(odd), take(2)), [1, 2, 4, 5, 7])))
+        self.assertEqual([['a', 'a'], ['b'], ['a']], l(sequence(partition_by(identity), 'aaba')))
+        # f itself returning reduced: no partition started after that
+        self.assertEqual([[1, 1]], transduce(partition_by(identity), completing(lambda acc, x: reduced(acc + [x])), [], [1, 1, 2]))
+        self.assertRaises(TypeError, lambda: partition_by())
+
+    def test_dedupe(self):
+        self.assertEqual([], l(dedupe([])))
+        self.assertEqual([1, 2, 3, 1], l(dedupe([1, 1, 2, 3, 3, 3, 1])))
+        self.assertEqual([1, 2, 3, 1], l(sequence(dedupe(), [1, 1, 2, 3, 3, 3, 1])))
+        self.assertEqual(7, transduce(dedupe(), lambda *a: sum(a), 0, [1, 1, 2, 3, 3, 3, 1]))
+        self.assertEqual(7, transduce(compile_xform(dedupe()), lambda *a: sum(a), 0, [1, 1, 2, 3, 3, 3, 1]))
+        self.assertEqual([None, 1], l(sequence(dedupe(), [None, None, 1])))
+        self.assertRaises(TypeError, lambda: dedupe([1], [2]))
+
+    def test_distinct(self):
+        self.assertEqual([], l(distinct([])))
+        self.assertEqual([1, 2, 3], l(distinct([1, 1, 2, 3, 3, 1, 2])))
+        self.assertEqual([1, 2, 3], l(sequence(distinct(), [1, 1, 2, 3, 3, 1, 2])))
+        self.assertEqual(6, transduce(distinct(), lambda *a: sum(a), 0, [1, 1, 2, 3, 3, 1, 2]))
+        xf = distinct()
+        self.assertEqual([1, 2], l(sequence(xf, [1, 2, 1])))
+        self.assertEqual([1, 2], l(sequence(xf, [1, 2, 1]))) # state per reduction
+        self.assertRaises(TypeError, lambda: distinct([1], [2]))
+
+    def test_keep(self):
+        f = lambda x: None if x % 3 == 0 else x % 3 == 1
+        self.assertEqual([True, False, True], l(keep(f, [1, 2, 3, 4])))
+        self.assertEqual([True, False, True], l(sequence(keep(f), [1, 2, 3, 4])))
+        self.assertEqual(2, transduce(compile_xform(keep(f)), lambda *a: sum(a), 0, [1, 2, 3, 4]))
+        self.assertRaises(TypeError, lambda: keep())
+
+    def test_mapcat(self):
+        self.assertEqual([0, 0, 1], l(mapcat(range, [1, 2])))
+        self.assertEqual([1, 'a', 2, 'b'], l(mapcat(lambda x, y: [x, y], [1, 2, 3], 'ab')))
+        self.assertEqual([0, 0, 1], l(sequence(mapcat(range), [1, 2])))
+        self.assertEqual([1, 'a', 2, 'b'], l(sequence(mapcat(lambda x, y: [x, y]), [1, 2, 3], 'ab')))
+        self.assertEqual([0, 0, 1], transduce(mapcat(range), completing(append), [], [1, 2]))
+        self.assertEqual([0, 0], transduce(comp(mapcat(range), take(2)), completing(append), [], [1, 2, 3]))
+        self.assertEqual([0, 0], transduce(compile_xform(comp(mapcat(range), take(2))), completing(append), [], [1, 2, 3]))
+
+        # lazy on the inputs
+        _log = []
+        s = sequence(mapcat(range), log_iter(_log, [1, 2]))
+        self.assertEqual(0, next(s))
+        self.assertEqual([1], _log)
+
+    def test_take_while(self):
+        small = lambda x: x < 3
+        self.assertEqual([], l(take_while(small, [])))
+        self.assertEqual([1, 2], l(take_while(small, [1, 2, 3, 1])))
+        self.assertEqual([1, 2], l(sequence(take_while(small), [1, 2, 3, 1])))
+        self.assertEqual(3, transduce(take_while(small), lambda *a: sum(a), 0, [1, 2, 3, 1]))
+        self.assertEqual(3, transduce(compile_xform(take_while(small)), lambda *a: sum(a), 0, [1, 2, 3, 1]))
+
+        # stops consuming
+        _log = []
+        self.assertEqual([1, 2], l(sequence(take_while(small), log_iter(_log, [1, 2, 3, 4, 5]))))
+        self.assertEqual([1, 2, 3], _log)
+        self.assertRaises(TypeError, lambda: take_while())
+
+    def test_drop_while(self):
+        small = lambda x: x < 3
+        self.assertEqual([], l(drop_while(small, [])))
+        self.assertEqual([3, 1], l(drop_while(small, [1, 2, 3, 1])))
+        self.assertEqual([3, 1], l(sequence(drop_while(small), [1, 2, 3, 1])))
+        self.assertEqual(4, transduce(drop_while(small), lambda *a: sum(a), 0, [1, 2, 3, 1]))
+        self.assertEqual(4, transduce(compile_xform(drop_while(small)), lambda *a: sum(a), 0, [1, 2, 3, 1]))
+        self.assertRaises(TypeError, lambda: drop_while())
+
+    def test_take_nth(self):
+        self.assertEqual([], l(take_nth(2, [])))
+        self.assertEqual([0, 2, 4], l(take_nth(2, range(5))))
+        self.assertEqual([0, 3], l(sequence(take_nth(3), range(5))))
+        self.assertEqual([0, 1, 2], l(sequence(take_nth(1), range(3))))
+        self.assertEqual(9, transduce(take_nth(3), lambda *a: sum(a), 0, range(8)))
+        self.assertEqual(9, transduce_chunked(take_nth(3), lambda *a: sum(a), 0, range(8), chunk_size=2))
+        self.assertRaises(ValueError, lambda: take_nth(0))
+        self.assertRaises(TypeError, lambda: take_nth())
+
+    def test_random_sample(self):
+        self.assertEqual([], l(random_sample(0, range(10))))
+        self.assertEqual(l(range(10)), l(random_sample(1, range(10))))
+        self.assertEqual(l(range(10)), l(sequence(random_sample(1), range(10))))
+        draws = iter([0.1, 0.9, 0.4, 0.6])
+        self.assertEqual([0, 2], l(random_sample(0.5, range(4), random=lambda: next(draws))))
+        draws = iter([0.1, 0.9, 0.4, 0.6])
+        self.assertEqual([0, 2], l(sequence(random_sample(0.5, random=lambda: next(draws)), range(4))))
+        self.assertTrue(300 < len(l(random_sample(0.5, range(1000)))) < 700)
+        self.assertRaises(TypeError, lambda: random_sample())
+
 def assert_tx_default_0_1_arities(transducer):
     # 0-arity
     called = []
@@ -1495,6 +2007,25 @@ class log_iter(object):
             return v
 
 
+def plus(a=0, b=0):
+    return a + b
+
+def sum_until_100(acc, x):
+    return reduced(acc + x) if x == 100 else acc + x
+
+def count_into(acc, x):
+    acc[x] = acc.get(x, 0) + 1
+    return acc
+
+def count_into_new(acc, x):
+    return count_into(dict(acc), x)
+
+def is_even(x):
+    return x % 2 == 0
+
+def merge_counts(*a):
+    return merge_with(plus, *a)
+
 def raiser(*a, **k):
     raise AssertionError('Should never be called!')
 
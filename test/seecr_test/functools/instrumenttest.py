@@ -0,0 +1,162 @@
+## begin license ##
+#
+# Seecr Functools a set of various functional tools
+#
+# Copyright (C) 2026 Seecr (Seek You Too B.V.) https://seecr.nl
+#
+# This file is part of "Seecr Functools"
+#
+# "Seecr Functools" is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# "Seecr Functools" is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with "Seecr Functools"; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+## end license ##
+
+from unittest import TestCase
+
+from time import sleep
+import tracemalloc
+
+from seecr.functools.core import transduce, sequence, map, filter, comp, take, cat, partition_all, completing, append, compile_xform, identity
+from seecr.functools.instrument import instrument, stage_name, format_report, format_memory_report
+
+
+def double(x):
+    return x * 2
+
+def slow(x):
+    sleep(0.002)
+    return x
+
+def big(x):
+    return [x] * 1000
+
+
+class InstrumentTest(TestCase):
+    def test_transduce_instrumented(self):
+        reports = []
+        xform = comp(map(double), filter(lambda x: x % 3), partition_all(2), take(3))
+        self.assertEqual([[2, 4], [8, 10], [14, 16]], transduce(xform, completing(append), [], range(100), instrument=reports.append))
+        self.assertEqual(1, len(reports))
+        report = reports[0]
+        self.assertEqual(['0:map(double)', '1:filter(<lambda>)', '2:partition_all', '3:take(3)'], [s['name'] for s in report])
+        self.assertEqual([(9, 9), (9, 6), (6, 3), (3, 3)], [(s['items_in'], s['items_out']) for s in report])
+        self.assertEqual([0, 0, 0, 1], [s['reduced'] for s in report])
+        self.assertEqual([1, 1, 1, 0], [s['reduced_downstream'] for s in report])
+        for s in report:
+            self.assertTrue(s['self_seconds'] >= 0)
+            self.assertTrue(s['complete_seconds'] >= 0)
+
+        # same result as uninstrumented, also compiled and 3-arity
+        self.assertEqual(
+            transduce(xform, completing(append), [], range(100)),
+            transduce(compile_xform(xform), completing(append), [], range(100), instrument=reports.append))
+        self.assertEqual([0, 2], transduce(map(double), append, range(2), instrument=reports.append))
+        self.assertEqual([['0:map(double)']], [[s['name'] for s in r] for r in reports[2:]])
+        self.assertEqual([1], transduce(identity, append, [1], instrument=reports.append))
+        self.assertEqual([], reports[-1])
+
+    def test_self_time(self):
+        reports = []
+        transduce(comp(map(slow), map(double)), completing(append), [], range(10), instrument=reports.append)
+        slow_stage, double_stage = reports[0]
+        self.assertTrue(slow_stage['self_seconds'] >= 0.02, slow_stage)
+        self.assertTrue(double_stage['self_seconds'] < 0.01, double_stage)  # not including upstream
+        self.assertTrue(slow_stage['items_per_second'] < 1000)
+
+    def test_completion_time(self):
+        def slow_completion(rf):
+            def _step(*a):
+                if len(a) == 1:
+                    sleep(0.02)
+                return rf(*a)
+            return _step
+        reports = []
+        transduce(comp(map(double), slow_completion), completing(append), [], range(3), instrument=reports.append)
+        double_stage, completing_stage = reports[0]
+        self.assertEqual('slow_completion', completing_stage['name'][2:])
+        self.assertTrue(completing_stage['complete_seconds'] >= 0.02)
+        self.assertTrue(double_stage['complete_seconds'] < 0.01)
+
+    def test_default_sink_logs(self):
+        with self.assertLogs('seecr.functools.instrument', level='INFO') as logs:
+            transduce(comp(map(double), cat), completing(append), [], [], instrument=True)
+        self.assertEqual(1, len(logs.output))
+        self.assertTrue('0:map(double)' in logs.output[0])
+        self.assertTrue('1:cat' in logs.output[0])
+
+    def test_instrument(self):
+        reports = []
+        xform = comp(map(double), instrument('odd', filter(lambda x: x % 4), reports.append))
+        self.assertEqual([2, 6], transduce(xform, completing(append), [], range(4)))
+        self.assertEqual([['odd']], [[s['name'] for s in r] for r in reports])
+        self.assertEqual((4, 2), (reports[0][0]['items_in'], reports[0][0]['items_out']))
+
+        self.assertEqual([2, 6], transduce(xform, completing(append), [], range(4)))
+        self.assertEqual(2, len(reports))    # fresh stats for each reduction
+
+    def test_stage_name(self):
+        self.assertEqual('map(double)', stage_name(map(double)))
+        self.assertEqual('take(3)', stage_name(take(3)))
+        self.assertEqual('cat', stage_name(cat))
+        self.assertEqual('partition_all', stage_name(partition_all(3)))
+        self.assertEqual('slow', stage_name(slow))
+
+    def test_format_report(self):
+        table = format_report([{'name': 'map(f)', 'items_in': 3, 'items_out': 3, 'self_seconds': 0.5, 'items_per_second': 6.0, 'reduced': 0, 'reduced_downstream': 0, 'complete_seconds': 0.0}])
+        self.assertEqual(2, len(table.split('\n')))
+        self.assertTrue(table.split('\n')[1].startswith('map(f) '))
+
+    def test_trace_memory_transduce(self):
+        reports = []
+        xform = comp(map(big), filter(lambda x: x[0] % 2), partition_all(10))
+        result = transduce(compile_xform(xform), completing(append), [], range(100), trace_memory=reports.append)
+        self.assertEqual(transduce(xform, completing(append), [], range(100)), result)
+        self.assertFalse(tracemalloc.is_tracing())
+        report, = reports
+        self.assertEqual(['source', '0:map(big)', '1:filter(<lambda>)', '2:partition_all', 'rf:_Completing'], [s['name'] for s in report])
+        self.assertEqual([0, 100, 100, 50, 5], [s['items_in'] for s in report])
+        by_name = {s['name']: s for s in report}
+        self.assertTrue(50 * 8000 <= by_name['0:map(big)']['retained_bytes'] < 60 * 8000, by_name)     # the half not filtered out
+        self.assertTrue(by_name['0:map(big)']['peak_bytes'] >= 8000, by_name)
+        self.assertTrue(by_name['rf:_Completing']['retained_bytes'] < 8000, by_name)
+        table = format_memory_report(report)
+        self.assertEqual(6, len(table.split('\n')))
+
+    def test_trace_memory_sequence(self):
+        reports = []
+        xform = comp(map(big), take(20))
+        self.assertEqual(list(sequence(xform, range(100))), list(sequence(xform, range(100), trace_memory=reports.append)))
+        report, = reports
+        self.assertEqual(['source', '0:map(big)', '1:take(20)', 'rf:sequence'], [s['name'] for s in report])
+        self.assertEqual(20, report[-1]['items_in'])
+
+        # consumer not accounted; report on close
+        kept = []
+        outputs = sequence(map(double), range(10), trace_memory=reports.append)
+        for x in outputs:
+            kept.append(big(x))
+            if len(kept) == 5:
+                break
+        outputs.close()
+        self.assertEqual(2, len(reports))
+        self.assertTrue(all(s['retained_bytes'] < 5 * 8000 for s in reports[1]), reports[1])
+        self.assertFalse(tracemalloc.is_tracing())
+
+        self.assertRaises(TypeError, lambda: sequence(map(double), [1], [2], trace_memory=True))
+
+    def test_trace_memory_default_sink_logs(self):
+        with self.assertLogs('seecr.functools.instrument', level='INFO') as logs:
+            transduce(map(double), completing(append), [], range(3), trace_memory=True)
+        self.assertEqual(1, len(logs.output))
+        self.assertTrue('0:map(double)' in logs.output[0])
@@ -0,0 +1,239 @@
+## begin license ##
+#
+# Seecr Functools a set of various functional tools
+#
+# Copyright (C) 2026 Seecr (Seek You Too B.V.) https://seecr.nl
+#
+# This file is part of "Seecr Functools"
+#
+# "Seecr Functools" is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# "Seecr Functools" is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with "Seecr Functools"; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+## end license ##
+
+from unittest import TestCase
+
+from gc import collect
+from io import BytesIO, StringIO
+from os import chmod, listdir, stat, umask
+from os.path import join
+from shutil import rmtree
+from tempfile import mkdtemp
+
+from seecr.functools.core import reduce, reduced, transduce, take, map, completing, append, sequence
+from seecr.functools import io
+from seecr.functools.io import lines, records, chunks, to_file, to_jsonl, to_csv, jsonl_source
+
+
+class IoTest(TestCase):
+    def setUp(self):
+        self.tempdir = mkdtemp()
+
+    def tearDown(self):
+        rmtree(self.tempdir)
+
+    def write(self, data, name='file'):
+        path = join(self.tempdir, name)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def test_lines(self):
+        path = self.write(b'one\ntwo\n\nfour\n')
+        self.assertEqual([b'one', b'two', b'', b'four'], list(lines(path)))
+        self.assertEqual([b'one', b'two', b'', b'four'], list(lines(path)))   # re-iterable
+        self.assertEqual([b'one', b'two', b'', b'four'], reduce(completing(append), [], lines(path)))
+        self.assertEqual(['ONE', 'TWO'], transduce(map(lambda l: str(l, 'ascii').upper()), completing(append), [], lines(self.write(b'one\ntwo'))))
+        self.assertEqual([b'x'], list(lines(self.write(b'x'))))
+
+        empty = self.write(b'', name='empty')
+        self.assertEqual([], list(lines(empty)))
+        self.assertEqual('init', reduce(completing(append), 'init', lines(empty)))
+
+    def test_records_spanning_blocks(self):
+        data = b'||'.join(b'record-%d' % i for i in range(100))
+        path = self.write(data)
+        expected = [b'record-%d' % i for i in range(100)]
+        orig_block_size = io._BLOCK_SIZE
+        try:
+            for block_size in [1, 3, 7, 64]:
+                io._BLOCK_SIZE = block_size
+                self.assertEqual(expected, list(records(path, b'||')))
+                self.assertEqual(expected, reduce(completing(append), [], records(path, b'||')))
+
+            # records (much) longer than a block, empty ones, delimiters across blocks
+            expected = [b'x' * 50, b'', b'a', b'y' * 33, b'', b'b']
+            path = self.write(b'||'.join(expected) + b'||')
+            for block_size in [1, 2, 3, 7, 64]:
+                io._BLOCK_SIZE = block_size
+                self.assertEqual(expected, list(records(path, b'||')))
+                self.assertEqual(expected, [line for lines in io._split_stream(BytesIO(b'\n'.join(expected))) for line in lines])
+                self.assertEqual(['x' * 50, '', 'a'], [line for lines in io._split_stream(StringIO('x' * 50 + '\n\na\n')) for line in lines])
+        finally:
+            io._BLOCK_SIZE = orig_block_size
+        self.assertRaises(ValueError, lambda: records(path, b''))
+
+    def test_early_termination(self):
+        path = self.write(b''.join(b'%d\n' % i for i in range(100000)))
+        seen = []
+        def rf(acc, x):
+            seen.append(x)
+            return acc + 1
+        self.assertEqual(3, transduce(take(3), completing(rf), 0, lines(path)))
+        self.assertEqual([b'0', b'1', b'2'], seen)
+        self.assertEqual(b'41', reduce(lambda acc, x: reduced(x) if x == b'41' else acc, None, lines(path)))
+        self.assertEqual([b'0', b'1'], list(sequence(take(2), lines(path))))
+
+    def test_chunks(self):
+        path = self.write(b'abcdefghij')
+        self.assertEqual([b'abcd', b'efgh', b'ij'], [bytes(c) for c in chunks(path, 4)])
+        result = reduce(completing(append), [], chunks(path, 4))
+        self.assertEqual([memoryview] * 3, [type(c) for c in result])
+        self.assertEqual(b'efgh', bytes(result[1]))   # still valid after the reduction
+        self.assertEqual([b'abc'], transduce(take(1), completing(lambda acc, c: acc + [bytes(c)]), [], chunks(path, 3)))
+        self.assertEqual([], list(chunks(self.write(b'', name='empty'), 4)))
+        self.assertRaises(ValueError, lambda: chunks(path, 0))
+
+    def read(self, name='file'):
+        with open(join(self.tempdir, name), 'rb') as f:
+            return f.read()
+
+    def test_to_file(self):
+        path = join(self.tempdir, 'file')
+        self.assertEqual(path, transduce(map(str), to_file(path, lambda s: s.encode() + b';'), range(5)))
+        self.assertEqual(b'0;1;2;3;4;', self.read())
+        self.assertEqual(['file'], listdir(self.tempdir))
+
+        # in bulk: one write per buffer_bytes
+        writes = []
+        rf = to_file(path, lambda x: x, buffer_bytes=4)
+        state = rf()
+        state.file = LoggingFile(state.file, writes)
+        for x in [b'ab', b'c', b'def', b'g']:
+            rf(state, x)
+        self.assertEqual([b'abcdef'], writes)
+        self.assertEqual(b'0;1;2;3;4;', self.read())   # not replaced yet
+        rf(state)
+        self.assertEqual([b'abcdef', b'g'], writes)
+        self.assertEqual(b'abcdefg', self.read())
+
+        # early termination completes too
+        transduce(take(2), to_file(path, lambda x: b'%d' % x), range(100))
+        self.assertEqual(b'01', self.read())
+
+    def test_to_file_mode(self):
+        path = join(self.tempdir, 'file')
+        mask = umask(0o022)
+        try:
+            transduce(map(str), to_file(path, str.encode), range(3))
+            self.assertEqual(0o644, stat(path).st_mode & 0o7777)    # as open() would create it
+            chmod(path, 0o640)
+            transduce(map(list), to_csv(path), [(1, 2)])
+            self.assertEqual(0o640, stat(path).st_mode & 0o7777)    # existing file's mode kept
+
+            umask(0o027)
+            path = join(self.tempdir, 'other')
+            transduce(map(str), to_file(path, str.encode), range(3))
+            self.assertEqual(0o640, stat(path).st_mode & 0o7777)
+            self.assertEqual(0o027, umask(0o027))   # left alone
+        finally:
+            umask(mask)
+
+    def test_to_file_atomic(self):
+        path = self.write(b'original')
+        def fail_at_3(x):
+            if x == 3:
+                raise ValueError(x)
+            return b'%d' % x
+        self.assertRaises(ValueError, lambda: transduce(map(lambda x: x), to_file(path, fail_at_3, buffer_bytes=1), range(5)))
+        self.assertEqual(b'original', self.read())
+        collect()
+        self.assertEqual(['file'], listdir(self.tempdir))   # temporary file removed
+
+    def test_to_jsonl(self):
+        path = join(self.tempdir, 'out.jsonl')
+        transduce(map(lambda i: {'i': i}), to_jsonl(path, sort_keys=True), range(3))
+        self.assertEqual(b'{"i": 0}\n{"i": 1}\n{"i": 2}\n', self.read('out.jsonl'))
+        self.assertEqual([b'{"i": 0}', b'{"i": 1}', b'{"i": 2}'], list(lines(path)))
+
+    def test_to_csv(self):
+        path = join(self.tempdir, 'out.csv')
+        transduce(map(lambda i: (i, 'v,%d' % i)), to_csv(path, header=('id', 'value')), range(2))
+        self.assertEqual(b'id,value\r\n0,"v,0"\r\n1,"v,1"\r\n', self.read('out.csv'))
+
+        transduce(map(lambda i: (i, i * 2)), to_csv(path, delimiter=';', lineterminator='\n'), range(3000))
+        data = self.read('out.csv').split(b'\n')
+        self.assertEqual(3001, len(data))
+        self.assertEqual([b'0;0', b'2999;5998', b''], [data[0], data[-2], data[-1]])
+
+        transduce(map(lambda i: (i,)), to_csv(path, header=['only-header']), [])
+        self.assertEqual(b'only-header\r\n', self.read('out.csv'))
+
+
+    def test_jsonl_source(self):
+        path = self.write(b'{"a": 1, "b": {"c": "x"}}\n\n[2]\n  \n"three"\r\n4')
+        expected = [{'a': 1, 'b': {'c': 'x'}}, [2], 'three', 4]
+        self.assertEqual(expected, list(jsonl_source(path)))
+        self.assertEqual(expected, list(jsonl_source(path)))
+        self.assertEqual(expected, reduce(completing(append), [], jsonl_source(path)))
+        self.assertEqual(expected, list(jsonl_source(BytesIO(self.read()))))
+        self.assertEqual(expected, list(jsonl_source(StringIO(self.read().decode()))))
+        self.assertEqual([], list(jsonl_source(self.write(b'', name='empty'))))
+        self.assertEqual([], list(jsonl_source(self.write(b'\n\n', name='blank'))))
+
+    def test_jsonl_source_blocks(self):
+        orig_block_size = io._BLOCK_SIZE
+        io._BLOCK_SIZE = 64
+        try:
+            path = self.write(b''.join(b'{"i": %d, "s": "%s"}\n' % (i, b'x' * (i % 50)) for i in range(200)))
+            self.assertEqual(list(range(200)), [v['i'] for v in jsonl_source(path)])
+            with open(path, 'rb') as f:
+                self.assertEqual(list(range(200)), [v['i'] for v in jsonl_source(f)])
+        finally:
+            io._BLOCK_SIZE = orig_block_size
+
+    def test_jsonl_source_projection(self):
+        path = self.write(b'{"id": 1, "user": {"name": "a"}}\n{"id": 2, "user": {}}\n')
+        self.assertEqual(['a', None], list(jsonl_source(path, ['user', 'name'])))
+        self.assertEqual([{'id': 1, 'name': 'a'}, {'id': 2, 'name': None}], list(jsonl_source(path, {'id': ['id'], 'name': ['user', 'name']})))
+        self.assertEqual([1], transduce(take(1), completing(append), [], jsonl_source(path, ['id'])))
+
+    def test_jsonl_source_bad_line(self):
+        path = self.write(b'1\n2\n{bad\n4\n')
+        values = []
+        def collect_values(acc, v):
+            values.append(v)
+            return acc
+        self.assertRaises(ValueError, lambda: reduce(collect_values, None, jsonl_source(path)))
+        self.assertEqual([1, 2], values)
+
+        # lines joined into valid JSON are not taken for separate values
+        self.assertRaises(ValueError, lambda: list(jsonl_source(self.write(b'1,2\n3\n'))))
+        self.assertRaises(ValueError, lambda: list(jsonl_source(self.write(b'"a\nb"\n'))))
+        self.assertRaises(ValueError, lambda: list(jsonl_source(self.write(b'1, 2\n[3\n4]\n'))))     # as many values as lines
+        self.assertRaises(ValueError, lambda: list(jsonl_source(StringIO('1, 2\n[3\n4]\n'))))
+        self.assertEqual([1, {'a': [2]}], list(jsonl_source(StringIO(' 1 \r\n\n{"a": [2]}\t\n'))))
+
+
+class LoggingFile(object):
+    def __init__(self, f, writes):
+        self._f = f
+        self._writes = writes
+
+    def write(self, data):
+        self._writes.append(data)
+        return self._f.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self._f, name)
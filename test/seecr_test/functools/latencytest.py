@@ -0,0 +1,122 @@
+## begin license ##
+#
+# Seecr Functools a set of various functional tools
+#
+# Copyright (C) 2026 Seecr (Seek You Too B.V.) https://seecr.nl
+#
+# This file is part of "Seecr Functools"
+#
+# "Seecr Functools" is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# "Seecr Functools" is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with "Seecr Functools"; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+## end license ##
+
+from unittest import TestCase
+
+from seecr.functools.core import comp, juxt, thrush, some_thread, before, after, any_fn, fpartial, transduce, map, filter, take, completing, append, _comp2
+from seecr.functools import latency
+from seecr.functools.latency import Histogram
+
+
+def inc(x):
+    return x + 1
+
+def double(x):
+    return x * 2
+
+
+class LatencyTest(TestCase):
+    def setUp(self):
+        latency.reset()
+        self.addCleanup(latency.disable)
+
+    def test_disabled_not_wrapped(self):
+        f = comp(inc, double)
+        self.assertEqual(_comp2(inc, double).__code__, f.__code__)
+        self.assertEqual(3, f(1))
+        self.assertEqual(3, thrush(1, double, inc))
+        self.assertEqual({}, latency.report())
+
+    def test_combinators_sampled(self):
+        latency.enable(every=2)
+        f = comp(inc, double, inc)
+        g = juxt(inc, double)
+        self.assertEqual('comp(inc, double, inc)', f.__name__)
+        for x in range(10):
+            self.assertEqual((x + 1) * 2 + 1, f(x))
+            self.assertEqual([x + 1, x * 2], g(x))
+        self.assertEqual(5, thrush(1, inc, double, inc))
+        self.assertEqual(5, thrush(1, inc, double, inc))    # thrush and some_thread share a countdown
+        self.assertEqual(None, some_thread(1, inc, lambda x: None, inc))
+        self.assertEqual(4, some_thread(1, inc, double))
+        self.assertEqual(3, before(inc, double)(2))
+        self.assertEqual(3, after(inc, double)(2))
+        self.assertEqual(3, any_fn(lambda x: None, inc)(2))
+        self.assertEqual(8, fpartial(pow, 3)(2))
+
+        report = latency.report()
+        self.assertEqual({'comp(inc, double, inc)', 'juxt(inc, double)', 'thrush(inc, double, inc)', 'some_thread(inc, double)'}, set(report))
+        self.assertEqual(5, report['comp(inc, double, inc)']['samples'])
+        self.assertEqual(5, report['juxt(inc, double)']['samples'])
+        stats = report['comp(inc, double, inc)']
+        self.assertTrue(0 < stats['p50'] <= stats['p99'] <= stats['p999'])
+
+        latency.reset()
+        self.assertEqual({}, latency.report())
+        f(1); f(1)
+        self.assertEqual(1, latency.report()['comp(inc, double, inc)']['samples'])
+
+    def test_immediate_calls_named_once(self):
+        names = []
+        def _name(kind, fns):
+            names.append(kind)
+            return orig_name(kind, fns)
+        orig_name = latency._name
+        latency._name = _name
+        self.addCleanup(setattr, latency, '_name', orig_name)
+        latency.enable(every=1)
+        for x in range(10):
+            self.assertEqual(x + 2, thrush(x, inc, inc))
+        self.assertEqual(10, latency.report()['thrush(inc, inc)']['samples'])
+        self.assertEqual(['thrush'], names)   # not within (nor after) each timed call
+
+    def test_comp_of_transducers(self):
+        latency.enable(every=1)
+        xform = comp(map(double), filter(lambda x: x % 3), take(3))
+        self.assertEqual([2, 4, 8], transduce(xform, completing(append), [], range(100)))
+        self.assertEqual(1, latency.report()['comp(_map_xf, _filter_xf, _take_xf)']['samples'])
+
+    def test_track(self):
+        f = latency.track('my-inc', inc, every=1)
+        self.assertEqual(2, f(1))
+        self.assertEqual(2, f(x=1))
+        self.assertEqual(2, latency.histogram('my-inc').count)
+        def boom():
+            raise ValueError()
+        self.assertRaises(ValueError, latency.track('boom', boom, every=1))
+        self.assertEqual(1, latency.report()['boom']['samples'])
+        self.assertRaises(ValueError, lambda: latency.enable(every=0))
+
+    def test_histogram(self):
+        h = Histogram()
+        self.assertEqual(None, h.percentile(0.5))
+        for ns in range(1, 1001):
+            h.record(ns * 1000)
+        self.assertEqual(1000, h.count)
+        for q, expected in [(0.5, 500000), (0.99, 990000), (0.999, 999000)]:
+            p = h.percentile(q)
+            self.assertTrue(expected <= p <= expected * 1.125, (q, p))
+        self.assertEqual(h.percentile(1), h.percentile(0.9999))
+        h.record(3)
+        self.assertEqual(3, h.percentile(0.0001))
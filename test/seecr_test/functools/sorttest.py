@@ -0,0 +1,127 @@
+## begin license ##
+#
+# Seecr Functools a set of various functional tools
+#
+# Copyright (C) 2026 Seecr (Seek You Too B.V.) https://seecr.nl
+#
+# This file is part of "Seecr Functools"
+#
+# "Seecr Functools" is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# "Seecr Functools" is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with "Seecr Functools"; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+## end license ##
+
+from unittest import TestCase
+
+from heapq import merge
+
+from seecr.functools.core import reduce, reduced, transduce, take, completing, append, comp, map, filter
+from seecr.functools.sort import top_k, take_top, merge_sorted, external_sort, spilling_sort, spilling_group_by
+
+
+class SortTest(TestCase):
+    def test_top_k(self):
+        self.assertEqual([], transduce(map(abs), top_k(3), []))
+        self.assertEqual([9, 6, 5], transduce(map(abs), top_k(3), [3, -1, 4, 1, -5, 9, 2, 6]))
+        self.assertEqual([1, 1, 2], transduce(map(abs), top_k(3, key=lambda x: -x), [3, -1, 4, 1, -5, 9, 2, 6]))
+        self.assertEqual([3, 1], transduce(map(abs), top_k(5), [1, 3]))
+        self.assertEqual([], transduce(map(abs), top_k(0), [1, 2]))
+        self.assertRaises(ValueError, lambda: top_k(-1))
+
+        # ties: earlier items first; items themselves never compared
+        items = [(1, object()), (2, object()), (1, object()), (2, object())]
+        self.assertEqual([items[1], items[3], items[0]], transduce(map(lambda x: x), top_k(3, key=lambda x: x[0]), items))
+
+        # O(k) memory
+        rf = top_k(2)
+        heap = reduce(rf, rf(), range(100000))
+        self.assertEqual(2, len(heap))
+        self.assertEqual([99999, 99998], rf(heap))
+
+    def test_take_top(self):
+        self.assertEqual([9, 6], transduce(take_top(2), completing(append), [], [3, 1, 4, 1, 5, 9, 2, 6]))
+        self.assertEqual([9], transduce(comp(take_top(2), take(1)), completing(append), [], [3, 1, 4, 1, 5, 9, 2, 6]))
+        self.assertEqual(['ccc', 'bb'], transduce(take_top(2, len), completing(append), [], ['a', 'ccc', 'bb']))
+        self.assertRaises(ValueError, lambda: take_top(-1))
+
+    def test_merge_sorted(self):
+        self.assertEqual([], list(merge_sorted()))
+        self.assertEqual([], list(merge_sorted([], [])))
+        self.assertEqual([1, 2, 3, 4, 5, 6], list(merge_sorted([1, 4], [2, 5, 6], [3])))
+        self.assertEqual([(0, 'b'), (1, 'a'), (1, 'b'), (2, 'a')], list(merge_sorted([(1, 'a'), (2, 'a')], [(0, 'b'), (1, 'b')], key=lambda p: p[0])))
+
+        # lazy
+        log = []
+        def logging(name, items):
+            for x in items:
+                log.append((name, x))
+                yield x
+        m = merge_sorted(logging('a', [1, 3]), logging('b', [2]))
+        self.assertEqual([], log)
+        self.assertEqual(1, next(m))
+        self.assertEqual([('a', 1), ('b', 2), ('a', 3)], log) # heads of all colls, and the next of the one taken from
+
+    def test_merge_sorted_reduce(self):
+        colls = [[1, 4, 7, 10], [2, 5, 8], [3, 6, 9, 11, 12]]
+        self.assertEqual(78, reduce(lambda acc, x: acc + x, 0, merge_sorted(*colls)))
+        self.assertEqual(list(range(1, 13)), transduce(map(lambda x: x), completing(append), [], merge_sorted(*colls)))
+
+        # early termination, then continue as iterator
+        for stop in range(14):
+            m = merge_sorted(*colls)
+            first = reduce(lambda acc, x: reduced(acc + [x]) if x == stop else acc + [x], [], m)
+            self.assertEqual(list(range(1, 13)), first + list(m))
+
+            m = merge_sorted(*colls, key=lambda x: x)
+            self.assertEqual([1, 2, 3], transduce(take(3), completing(append), [], m))
+            self.assertEqual(4, next(m))
+
+    def test_merge_sorted_like_heapq_merge(self):
+        colls = [sorted((i * 7 + j * 13) % 20 for j in range(i * 3)) for i in range(6)]
+        for key in [None, lambda x: x // 4]:
+            self.assertEqual(list(merge(*colls, key=key)), list(merge_sorted(*colls, key=key)))
+            self.assertEqual(list(merge(*colls, key=key)), reduce(completing(append), [], merge_sorted(*colls, key=key)))
+
+    def test_external_sort(self):
+        self.assertEqual([], list(external_sort(None, [])))
+        self.assertEqual([1, 2, 3], list(external_sort(None, [3, 1, 2])))
+
+        pairs = [((i * 37) % 11, i) for i in range(1000)]
+        by_first = lambda p: p[0]
+        self.assertEqual(sorted(pairs, key=by_first), list(external_sort(by_first, pairs, mem_limit=64)))   # stable
+        self.assertEqual(sorted(pairs), list(external_sort(None, iter(pairs), mem_limit=7)))
+        self.assertRaises(ValueError, lambda: external_sort(None, [], mem_limit=0))
+
+    def test_spilling_sort(self):
+        rf = spilling_sort(mem_limit=10)
+        state = reduce(rf, rf(), range(95, -1, -1))
+        self.assertEqual(9, len(state.runs))
+        self.assertEqual(6, len(state.items))
+        self.assertEqual(list(range(96)), list(rf(state)))
+
+        self.assertEqual(list(range(0, 200, 2)), list(transduce(filter(lambda x: x % 2 == 0), spilling_sort(mem_limit=16), range(199, -1, -1))))
+
+        # abandoned early: temporary files closed when garbage collected
+        result = transduce(map(lambda x: -x), spilling_sort(mem_limit=10), range(100))
+        self.assertEqual([-99, -98], [next(result), next(result)])
+        del result
+
+    def test_spilling_group_by(self):
+        words = ['apple', 'bob', 'cherry', 'axe', 'banana', 'cat', 'avocado'] * 10
+        expected = {}
+        for w in words:
+            expected.setdefault(w[0], []).append(w)
+        groups = transduce(map(lambda w: w), spilling_group_by(lambda w: w[0], mem_limit=8), words)
+        self.assertEqual(sorted(expected.items()), list(groups))
+        self.assertEqual([], list(transduce(map(lambda w: w), spilling_group_by(len), [])))
@@ -0,0 +1,103 @@
+## begin license ##
+#
+# Seecr Functools a set of various functional tools
+#
+# Copyright (C) 2026 Seecr (Seek You Too B.V.) https://seecr.nl
+#
+# This file is part of "Seecr Functools"
+#
+# "Seecr Functools" is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# "Seecr Functools" is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with "Seecr Functools"; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+## end license ##
+
+from unittest import TestCase, skipIf
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from seecr.functools.core import comp, take, drop, interpose, ReducingFn
+from seecr.functools import vectorized as v
+
+
+@skipIf(numpy is None, 'numpy not installed')
+class VectorizedTest(TestCase):
+    def test_map_filter_called_per_array(self):
+        calls = []
+        def double(xs):
+            calls.append(len(xs))
+            return xs * 2
+        def multiple_of_3(xs):
+            calls.append(len(xs))
+            return xs % 3 == 0
+
+        arr = numpy.arange(10)
+        self.assertEqual(36, v.transduce(comp(v.map(double), v.filter(multiple_of_3)), v.sum, arr))
+        self.assertEqual([10, 10], calls)
+
+        del calls[:]
+        self.assertEqual(36, v.transduce(comp(v.map(double), v.filter(multiple_of_3)), v.sum, arr, chunk_size=4))
+        self.assertEqual([4, 4, 4, 4, 2, 2], calls)
+
+        del calls[:]
+        self.assertEqual(36, v.transduce(comp(v.map(double), v.filter(multiple_of_3)), v.sum, [arr[:7], arr[7:]]))
+        self.assertEqual([7, 7, 3, 3], calls)
+
+        # Per-item when not chunked.
+        self.assertEqual([0, 6, 12], list(v.sequence(comp(v.map(double), v.filter(multiple_of_3)), [arr[:4], arr[4:7]])))
+
+    def test_reductions(self):
+        arr = numpy.array([4, -2, 9, 3])
+        ident = lambda rf: rf
+        self.assertEqual(14, v.transduce(ident, v.sum, arr))
+        self.assertEqual(4, v.transduce(ident, v.count, arr))
+        self.assertEqual(-2, v.transduce(ident, v.min, [arr[:2], arr[2:]]))
+        self.assertEqual(9, v.transduce(ident, v.max, [arr[2:], arr[:2]]))
+
+        empty = numpy.array([])
+        self.assertEqual(0, v.transduce(ident, v.sum, empty))
+        self.assertEqual(0, v.transduce(ident, v.count, empty))
+        self.assertEqual(None, v.transduce(ident, v.min, empty))
+        self.assertEqual(None, v.transduce(ident, v.max, []))
+
+        # Also usable item-by-item (e.g. with core.transduce)
+        self.assertEqual(9, v.max(v.max(v.max(), 3), 9))
+        self.assertEqual(3, v.count(v.count(v.count(v.count(), 'a'), 'b'), 'c'))
+
+    def test_mixed_with_core_transducers(self):
+        arr = numpy.arange(1, 11)
+        self.assertEqual(3, v.transduce(comp(v.filter(lambda xs: xs > 2), take(3)), v.count, arr, chunk_size=4))
+        self.assertEqual(7 + 8 + 9 + 10 + 11 + 12, v.transduce(comp(drop(4), v.map(lambda xs: xs + 2)), v.sum, arr, chunk_size=3))
+        self.assertEqual([1, '-', 2], [x if x == '-' else int(x) for x in v.sequence(comp(take(2), interpose('-')), arr)])
+
+        # early termination stops consuming batches
+        seen = []
+        def batches():
+            for b in [arr[:3], arr[3:6], arr[6:]]:
+                seen.append(len(b))
+                yield b
+        self.assertEqual(4, v.transduce(take(4), v.count, batches()))
+        self.assertEqual([3, 3], seen)
+
+        # any ReducingFn, init given
+        class Collect(ReducingFn):
+            __slots__ = ()
+            def step(self, acc, x):
+                return acc + [int(x)]
+        self.assertEqual(['x', 4, 6], v.transduce(v.map(lambda xs: xs * 2), Collect(), ['x'], numpy.array([2, 3])))
+
+    def test_bad_arity(self):
+        self.assertRaises(TypeError, lambda: v.transduce(v.map(abs), v.sum))
@@ -0,0 +1,150 @@
+## begin license ##
+#
+# Seecr Functools a set of various functional tools
+#
+# Copyright (C) 2026 Seecr (Seek You Too B.V.) https://seecr.nl
+#
+# This file is part of "Seecr Functools"
+#
+# "Seecr Functools" is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# "Seecr Functools" is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with "Seecr Functools"; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+#
+## end license ##
+
+from unittest import TestCase
+
+from seecr.functools.core import comp, take, map, sequence, transduce, completing, append, identity
+from seecr.functools import window as w
+
+
+class WindowTest(TestCase):
+    def test_sliding(self):
+        self.assertEqual([], list(sequence(w.sliding(3), [1, 2])))
+        self.assertEqual([(1, 2, 3), (2, 3, 4), (3, 4, 5)], list(sequence(w.sliding(3), [1, 2, 3, 4, 5])))
+        self.assertEqual([(1, 2, 3), (3, 4, 5)], list(sequence(w.sliding(3, 2), [1, 2, 3, 4, 5, 6])))
+        self.assertEqual([(1, 2), (5, 6)], list(sequence(w.sliding(2, 4), range(1, 8))))
+        self.assertEqual([(1, 2, 3)], transduce(comp(w.sliding(3), take(1)), completing(append), [], [1, 2, 3, 4]))
+
+        xf = w.sliding(2)
+        self.assertEqual([(1, 2)], list(sequence(xf, [1, 2])))
+        self.assertEqual([(3, 4)], list(sequence(xf, [3, 4]))) # state per reduction
+
+        self.assertRaises(ValueError, lambda: w.sliding(0))
+        self.assertRaises(ValueError, lambda: w.sliding(2, 0))
+
+    def test_tumbling(self):
+        self.assertEqual([(1, 2), (3, 4)], list(sequence(w.tumbling(2), [1, 2, 3, 4, 5])))
+        self.assertEqual([(1,), (2,)], list(sequence(w.tumbling(1), [1, 2])))
+        self.assertRaises(ValueError, lambda: w.tumbling(0))
+
+    def test_sum_mean(self):
+        self.assertEqual([], list(sequence(w.sum(3), [1, 2])))
+        self.assertEqual([6, 9, 12], list(sequence(w.sum(3), [1, 2, 3, 4, 5])))
+        self.assertEqual([6, 12], list(sequence(w.sum(3, 2), [1, 2, 3, 4, 5])))
+        self.assertEqual([2.0, 3.0, 4.0], list(sequence(w.mean(3), [1, 2, 3, 4, 5])))
+
+        # no drift: rounding errors (0.1's lost next to 1e16) do not stay in the sum
+        sums = list(sequence(w.sum(3), [1e16] + [0.1] * 20))
+        for s in sums[-10:]:
+            self.assertAlmostEqual(0.3, s)
+
+    def test_min_max(self):
+        xs = [3, 1, 4, 1, 5, 9, 2, 6]
+        self.assertEqual([1, 1, 1, 1, 2, 2], list(sequence(w.min(3), xs)))
+        self.assertEqual([4, 4, 5, 9, 9, 9], list(sequence(w.max(3), xs)))
+        self.assertEqual([1, 1, 2], list(sequence(w.min(3, 2), xs)))
+        self.assertEqual([9], list(sequence(w.max(8), xs)))
+        self.assertEqual(xs, list(sequence(w.max(1), xs)))
+
+        # O(1) per item: the deque never holds more than the window
+        self.assertEqual(list(range(4, 1000)), list(sequence(w.max(5), range(1000))))
+        self.assertEqual(list(range(0, 996)), list(sequence(w.min(5), range(1000))))
+        self.assertEqual([x - 4 for x in range(4, 1000)], list(sequence(comp(map(lambda x: -x), w.max(5), map(lambda x: -x)), range(1000))))
+
+    def test_window_by_time_tumbling(self):
+        by_ts = w.window_by_time(identity, 10)
+        self.assertEqual([], list(sequence(by_ts, [])))
+        self.assertEqual(
+            [(0, 10, [1, 5]), (10, 20, [12]), (20, 30, [25]), (40, 50, [40])],
+            list(sequence(by_ts, [1, 5, 12, 3, 25, 19, 40])))   # 3 and 19 too late
+
+        # allowed lateness
+        self.assertEqual(
+            [(0, 10, [1, 5, 3]), (10, 20, [12]), (20, 30, [25]), (40, 50, [40])],
+            list(sequence(w.window_by_time(identity, 10, allowed_lateness=5), [1, 5, 12, 3, 25, 19, 40])))
+
+        # key_ts
+        events = [{'ts': 1.5, 'v': 'a'}, {'ts': 2.5, 'v': 'b'}, {'ts': 3.0, 'v': 'c'}]
+        self.assertEqual(
+            [(0, 2, ['a']), (2, 4, ['b', 'c'])],
+            list(sequence(comp(w.window_by_time(lambda e: e['ts'], 2), map(lambda win: (win[0], win[1], [e['v'] for e in win[2]]))), events)))
+
+    def test_window_by_time_emits_when_watermark_passes(self):
+        emitted = []
+        def log(acc, win):
+            emitted.append(win)
+            return acc
+        rf = w.window_by_time(identity, 10)(completing(log))
+        rf(None, 1)
+        rf(None, 9)
+        self.assertEqual([], emitted)
+        rf(None, 10)
+        self.assertEqual([(0, 10, [1, 9])], emitted)
+        rf(None, 35)
+        self.assertEqual([(0, 10, [1, 9]), (10, 20, [10])], emitted)
+        rf(None)
+        self.assertEqual([(0, 10, [1, 9]), (10, 20, [10]), (30, 40, [35])], emitted)
+
+    def test_window_by_time_hopping(self):
+        self.assertEqual(
+            [(-5, 5, [1]), (0, 10, [1, 7]), (5, 15, [7, 12]), (10, 20, [12, 16]), (15, 25, [16])],
+            list(sequence(w.window_by_time(identity, 10, 5), [1, 7, 12, 16])))
+
+    def test_window_by_time_session(self):
+        self.assertEqual(
+            [(1, 5, [1, 2]), (10, 14, [10, 11]), (20, 23, [20])],
+            list(sequence(w.window_by_time(identity, gap=3), [1, 2, 10, 4, 11, 20, 3.5])))
+        self.assertEqual(
+            [(1, 7, [1, 2, 4]), (8, 14, [10, 11, 8]), (20, 23, [20])],
+            list(sequence(w.window_by_time(identity, gap=3, allowed_lateness=10), [1, 2, 10, 4, 11, 20, 3.5, 8])))
+
+        # merging sessions
+        self.assertEqual(
+            [(1, 8, [1, 5, 3])],
+            list(sequence(w.window_by_time(identity, gap=3, allowed_lateness=10), [1, 5, 3])))
+
+    def test_window_by_time_reduced(self):
+        self.assertEqual([(0, 10, [1, 5])], list(sequence(comp(w.window_by_time(identity, 10), take(1)), [1, 5, 12, 25])))
+        self.assertEqual([(1, 3, [1])], list(sequence(comp(w.window_by_time(identity, gap=2), take(1)), [1, 5, 12, 25])))
+
+        # upstream termination flushes
+        self.assertEqual([(0, 10, [1, 5]), (10, 20, [12])], list(sequence(comp(take(3), w.window_by_time(identity, 10)), [1, 5, 12, 25])))
+
+    def test_window_by_time_memory(self):
+        rf = w.window_by_time(identity, 10)(completing(lambda acc, win: acc + 1))
+        acc = 0
+        for t in range(100000):
+            acc = rf(acc, t)
+        self.assertEqual(9999, acc)
+        self.assertEqual(1, len(rf._open))
+        self.assertEqual(10000, rf(acc))
+
+    def test_window_by_time_arguments(self):
+        self.assertRaises(ValueError, lambda: w.window_by_time(identity))
+        self.assertRaises(ValueError, lambda: w.window_by_time(identity, 10, gap=2))
+        self.assertRaises(ValueError, lambda: w.window_by_time(identity, 0))
+        self.assertRaises(ValueError, lambda: w.window_by_time(identity, 10, 0))
+        self.assertRaises(ValueError, lambda: w.window_by_time(identity, gap=0))
+        self.assertRaises(ValueError, lambda: w.window_by_time(identity, gap=2, slide=1))
+        self.assertRaises(ValueError, lambda: w.window_by_time(identity, 10, allowed_lateness=-1))